@@ -22,9 +22,8 @@ from pulp_ansible.app.serializers import CollectionVersionCopyMoveSerializer
 
 from galaxy_ng.app import models
 from galaxy_ng.app.api.v1.models import LegacyNamespace
-from galaxy_ng.app.api.v1.models import LegacyRole
 from galaxy_ng.app.constants import COMMUNITY_DOMAINS
-from galaxy_ng.app.utils.rbac import get_v3_namespace_owners
+from galaxy_ng.app.utils.rbac import is_v3_namespace_owner
 
 from galaxy_ng.app.access_control.statements import PULP_VIEWSETS
 
@@ -787,45 +786,52 @@ class LegacyAccessPolicy(AccessPolicyBase):
         if user.is_superuser:
             return True
 
-        namespace = None
+        # the same request can be checked more than once, the answer does not change
+        if not hasattr(request, "_is_legacy_namespace_owner"):
+            request._is_legacy_namespace_owner = self._is_namespace_owner(request, user)
+        return request._is_legacy_namespace_owner
+
+    def _is_namespace_owner(self, request, user):
+        namespaces = None
         github_user = None
         kwargs = request.parser_context['kwargs']
 
         # enumerate the related namespace for this request
         if '/imports/' in request.META['PATH_INFO']:
             github_user = request.data['github_user']
-            namespace = LegacyNamespace.objects.filter(name=github_user).first()
+            namespaces = LegacyNamespace.objects.filter(name=github_user)
 
         elif '/removerole/' in request.META['PATH_INFO']:
 
             github_user = request.query_params['github_user']
-            namespace = LegacyNamespace.objects.filter(name=github_user).first()
+            namespaces = LegacyNamespace.objects.filter(name=github_user)
 
         elif '/roles/' in request.META['PATH_INFO']:
             roleid = kwargs.get("id", kwargs.get("pk"))
-            role = LegacyRole.objects.filter(id=roleid).first()
-            namespace = role.namespace
+            namespaces = LegacyNamespace.objects.filter(roles__id=roleid)
 
         elif '/namespaces/' in request.META['PATH_INFO']:
             ns_id = kwargs['pk']
-            namespace = LegacyNamespace.objects.filter(id=ns_id).first()
+            namespaces = LegacyNamespace.objects.filter(id=ns_id)
 
         elif '/ai_deny_index/' in request.META["PATH_INFO"]:
             ns_name = kwargs.get("reference", request.data.get("reference"))
-            namespace = LegacyNamespace.objects.filter(name=ns_name).first()
+            namespaces = LegacyNamespace.objects.filter(name=ns_name)
+
+        namespace = None
+        if namespaces is not None:
+            namespace = namespaces.values_list("pk", "namespace_id").first()
 
         # allow a user to make their own namespace
         if namespace is None and github_user and user.username == github_user:
             return True
 
-        # v1 namespace rbac is controlled via their v3 namespace
-        v3_namespace = namespace.namespace
-        if not v3_namespace:
+        if namespace is None:
             return False
 
-        # use the helper to get the list of owners
-        owners = get_v3_namespace_owners(v3_namespace)
-        if owners and user in owners:  # noqa: SIM103
-            return True
+        # v1 namespace rbac is controlled via their v3 namespace
+        _, v3_namespace_id = namespace
+        if not v3_namespace_id:
+            return False
 
-        return False
+        return is_v3_namespace_owner(user, v3_namespace_id)
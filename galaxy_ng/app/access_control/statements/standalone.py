@@ -62,7 +62,7 @@ _collection_statements = [
         "condition": ["can_update_collection", "v3_can_view_repo_content"]
     },
     {
-        "action": ["copy_content", "move_content"],
+        "action": ["copy_content", "move_content", "bulk_move_content"],
         "principal": "authenticated",
         "effect": "allow",
         "condition": [
@@ -0,0 +1,132 @@
+import base64
+import json
+
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+from galaxy_ng.app.utils.db import estimate_count
+
+
+def keyset_filter(ordering, position):
+    """Return a Q matching the rows that come after `position` in `ordering`.
+
+    `ordering` is a list of order_by() fields, `position` the values of those
+    fields on the last row already seen. The last field must be unique.
+
+    keyset_filter(["created", "id"], [created, id]) gives
+    created >= %s AND (created > %s OR (created = %s AND id > %s))
+    """
+    condition = Q()
+    for i, field in enumerate(ordering):
+        name = field.lstrip("-")
+        lookup = "lt" if field.startswith("-") else "gt"
+        term = Q(**{f"{name}__{lookup}": position[i]})
+        for previous, value in zip(ordering[:i], position):
+            term &= Q(**{previous.lstrip("-"): value})
+        condition |= term
+
+    # the redundant bound on the first field lets the index range scan
+    first = ordering[0]
+    lookup = "lte" if first.startswith("-") else "gte"
+    return Q(**{f"{first.lstrip('-')}__{lookup}": position[0]}) & condition
+
+
+class KeysetPaginationMixin:
+    """Opt-in keyset (cursor) pagination for a paginator class.
+
+    Sending the `cursor` query param, empty for the first page, switches to
+    keyset mode: pages are read with `WHERE (keys) > (last row keys) LIMIT n`
+    so late pages cost as much as the first one, the position is carried by
+    the `next` link and the count is an estimate. Without the param the
+    paginator behaves as before.
+
+    The queryset is ordered by `keyset`, or by `view.get_keyset()` when the
+    view defines it. Views whose queryset can not be filtered after the fact
+    (unions) can define `view.get_keyset_queryset(keyset, position_filter)`.
+    """
+
+    cursor_query_param = "cursor"
+    keyset = ("id",)
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.keyset_mode = self.cursor_query_param in request.query_params
+        if not self.keyset_mode:
+            return super().paginate_queryset(queryset, request, view=view)
+
+        self.request = request
+        self.keyset_page_size = self.get_keyset_page_size(request)
+        self.current_keyset = list(
+            view.get_keyset() if hasattr(view, "get_keyset") else self.keyset
+        )
+        position = self.decode_cursor(request.query_params[self.cursor_query_param])
+
+        position_filter = None
+        if position is not None:
+            position_filter = keyset_filter(self.current_keyset, position)
+
+        if hasattr(view, "get_keyset_queryset"):
+            page_qs = view.get_keyset_queryset(self.current_keyset, position_filter)
+        else:
+            page_qs = queryset.order_by(*self.current_keyset)
+            if position_filter is not None:
+                page_qs = page_qs.filter(position_filter)
+
+        self.count = estimate_count(queryset)
+        rows = list(page_qs[:self.keyset_page_size + 1])
+        self.has_next = len(rows) > self.keyset_page_size
+        self.page = rows[:self.keyset_page_size]
+        return self.page
+
+    def get_keyset_page_size(self, request):
+        # PageNumberPagination or LimitOffsetPagination
+        if hasattr(self, "get_page_size"):
+            return self.get_page_size(request)
+        return self.get_limit(request)
+
+    def get_paginated_response(self, data):
+        if not self.keyset_mode:
+            return super().get_paginated_response(data)
+        return Response(self.get_keyset_paginated_data(data))
+
+    def get_keyset_paginated_data(self, data):
+        return {
+            "count": self.count,
+            "next": self.get_next_cursor_link(),
+            "previous": None,
+            "results": data,
+        }
+
+    def get_first_cursor_link(self):
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, "")
+
+    def get_next_cursor_link(self):
+        if not self.has_next:
+            return None
+        last = self.page[-1]
+        position = [
+            last[name] if isinstance(last, dict) else getattr(last, name)
+            for name in (field.lstrip("-") for field in self.current_keyset)
+        ]
+        url = self.request.build_absolute_uri()
+        for param in ("page", "offset"):
+            url = remove_query_param(url, param)
+        return replace_query_param(url, self.cursor_query_param, self.encode_cursor(position))
+
+    def encode_cursor(self, position):
+        # str() keeps the microseconds of datetimes, DjangoJSONEncoder drops them
+        data = json.dumps(position, default=str).encode()
+        return base64.urlsafe_b64encode(data).decode()
+
+    def decode_cursor(self, cursor):
+        if not cursor:
+            return None
+        try:
+            position = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        except (TypeError, ValueError):
+            raise NotFound("Invalid cursor")
+        if not isinstance(position, list) or len(position) != len(self.current_keyset):
+            raise NotFound("Invalid cursor")
+        return position
@@ -10,6 +10,7 @@ from rest_framework.exceptions import ValidationError
 
 from galaxy_ng.app import models
 from galaxy_ng.app.access_control.fields import GroupPermissionField
+from galaxy_ng.app.utils.db import filter_by_tuples
 
 log = logging.getLogger(__name__)
 
@@ -38,6 +39,22 @@ class SyncListSerializer(serializers.ModelSerializer):
             errmsg = _('Repository "{pulp_id}" not found while creating synclist')
             raise ValidationError(errmsg.format(pulp_id=repository_id))
 
+    def _get_collections(self, collections_data, errmsg, synclist_name):
+        """Resolve all the submitted (namespace, name) pairs with a single query."""
+        requested = {(data["namespace"], data["name"]) for data in collections_data}
+        collections = list(
+            filter_by_tuples(Collection.objects.all(), ("namespace", "name"), requested)
+        )
+
+        missing = requested - {(c.namespace, c.name) for c in collections}
+        if missing:
+            raise ValidationError([
+                errmsg.format(namespace=namespace, name=name, synclist=synclist_name)
+                for namespace, name in sorted(missing)
+            ])
+
+        return collections
+
     def to_internal_value(self, data):
         upstream_repository_data = data.get("upstream_repository", None)
         if upstream_repository_data:
@@ -64,22 +81,8 @@ class SyncListSerializer(serializers.ModelSerializer):
         except IntegrityError as exc:
             raise ValidationError(_("Synclist already exists: %s") % exc)
 
-        collections = []
-        for collection_data in collections_data:
-            try:
-                collections.append(Collection.objects.get(**collection_data))
-            except Collection.DoesNotExist:
-                errmsg = (
-                    _('Collection "{namespace}.{name}" not found '
-                      'while creating synclist {synclist}')
-                )
-                raise ValidationError(
-                    errmsg.format(
-                        namespace=collection_data["namespace"],
-                        name=collection_data["name"],
-                        synclist=instance.name,
-                    )
-                )
+        errmsg = _('Collection "{namespace}.{name}" not found while creating synclist {synclist}')
+        collections = self._get_collections(collections_data, errmsg, instance.name)
         instance.collections.clear()
         instance.collections.set(collections)
 
@@ -103,22 +106,8 @@ class SyncListSerializer(serializers.ModelSerializer):
 
         instance.name = validated_data.get("name", instance.name)
 
-        new_collections = []
-        for collection_data in collections_data:
-            try:
-                new_collections.append(Collection.objects.get(**collection_data))
-            except Collection.DoesNotExist:
-                errmsg = (
-                    _('Collection "{namespace}.{name}" not found '
-                      'while updating synclist {synclist}')
-                )
-                raise ValidationError(
-                    errmsg.format(
-                        namespace=collection_data["namespace"],
-                        name=collection_data["name"],
-                        synclist=instance.name,
-                    )
-                )
+        errmsg = _('Collection "{namespace}.{name}" not found while updating synclist {synclist}')
+        new_collections = self._get_collections(collections_data, errmsg, instance.name)
         instance.collections.set(new_collections)
 
         instance.save()
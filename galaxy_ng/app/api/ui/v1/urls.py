@@ -113,7 +113,13 @@ search_paths = [
         "",
         views.SearchListView.as_view({"get": "list"}),
         name="search-view",
-    )
+    ),
+    # GET _ui/v1/search/autocomplete/?q=...
+    path(
+        "autocomplete/",
+        views.AutocompleteView.as_view(),
+        name="search-autocomplete",
+    ),
 ]
 
 signing_paths = [
@@ -22,6 +22,7 @@ from .ai_index import (
 from .search import (
     SearchListView
 )
+from .autocomplete import AutocompleteView
 
 
 __all__ = (
@@ -29,6 +30,8 @@ __all__ = (
     "AIDenyIndexAddView",
     "AIDenyIndexDetailView",
     "AIDenyIndexListView",
+    # autocomplete
+    "AutocompleteView",
     # Signing
     "CollectionSignView",
     # sync
@@ -0,0 +1,51 @@
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import OpenApiParameter, extend_schema
+from rest_framework.exceptions import ValidationError
+from rest_framework.permissions import AllowAny
+from rest_framework.response import Response
+
+from galaxy_ng.app.api import base as api_base
+from galaxy_ng.app.utils.autocomplete import (
+    DEFAULT_LIMIT,
+    MAX_LIMIT,
+    SUGGESTION_TYPES,
+    get_suggestions,
+)
+
+
+class AutocompleteView(api_base.APIView):
+    """Type-ahead suggestions for namespace, role and collection names."""
+
+    permission_classes = [AllowAny]
+
+    @extend_schema(
+        parameters=[
+            OpenApiParameter("q", description="Text typed so far", required=True),
+            OpenApiParameter("type", enum=list(SUGGESTION_TYPES), many=True),
+            OpenApiParameter("limit", OpenApiTypes.INT, default=DEFAULT_LIMIT),
+        ],
+        responses=OpenApiTypes.OBJECT,
+    )
+    def get(self, request, *args, **kwargs):
+        """Return the best matching names for `q`.
+
+        Exact and prefix matches are ranked first, then the names most similar
+        to `q`. Each suggestion has the format::
+
+            {"type": "role", "namespace": "geerlingguy", "name": "docker",
+             "rank": 1, "similarity": 0.5}
+        """
+        term = request.query_params.get("q", "")
+
+        types = request.query_params.getlist("type") or SUGGESTION_TYPES
+        if any(type_ not in SUGGESTION_TYPES for type_ in types):
+            raise ValidationError(f"'type' must be one of {list(SUGGESTION_TYPES)}")
+
+        try:
+            limit = int(request.query_params.get("limit", DEFAULT_LIMIT))
+        except ValueError:
+            raise ValidationError("'limit' must be an integer")
+        if not 0 < limit <= MAX_LIMIT:
+            raise ValidationError(f"'limit' must be between 1 and {MAX_LIMIT}")
+
+        return Response({"data": get_suggestions(term, types=types, limit=limit)})
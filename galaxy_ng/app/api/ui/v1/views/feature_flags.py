@@ -1,19 +1,25 @@
 from django.conf import settings
 from django.utils.translation import gettext_lazy as _
 from rest_framework.permissions import IsAuthenticatedOrReadOnly
-from rest_framework.response import Response
 
 from pulpcore.plugin.models import SigningService
 from galaxy_ng.app.api import base as api_base
+from galaxy_ng.app.api.utils import conditional_response
+from galaxy_ng.app.utils.snapshots import get_settings_snapshot
 
 
 class FeatureFlagsView(api_base.APIView):
     permission_classes = [IsAuthenticatedOrReadOnly]
 
     def get(self, request, *args, **kwargs):
-        flags = settings.get("GALAXY_FEATURE_FLAGS", {})
+        etag, flags = get_settings_snapshot("feature-flags", request, self.get_flags)
+        return conditional_response(request, flags, etag=etag)
+
+    @staticmethod
+    def get_flags():
+        flags = dict(settings.get("GALAXY_FEATURE_FLAGS", {}))
         _load_conditional_signing_flags(flags)
-        return Response(flags)
+        return flags
 
 
 def _load_conditional_signing_flags(flags):
@@ -1,10 +1,7 @@
 from galaxy_ng.app.access_control import access_policy
-from random import sample
 from rest_framework.response import Response
-from pulp_ansible.app.models import CollectionVersion, AnsibleDistribution
-from galaxy_ng.app.models import Namespace
-from galaxy_ng.app import settings
 from galaxy_ng.app.api import base as api_base
+from galaxy_ng.app.utils.landing_page import get_landing_page_estate
 
 
 class LandingPageView(api_base.APIView):
@@ -12,28 +9,22 @@ class LandingPageView(api_base.APIView):
     action = "retrieve"
 
     def get(self, request, *args, **kwargs):
-        golden_name = settings.GALAXY_API_DEFAULT_DISTRIBUTION_BASE_PATH
-
-        distro = AnsibleDistribution.objects.get(base_path=golden_name)
-        repository_version = distro.repository.latest_version()
-        collection_count = CollectionVersion.objects.filter(
-            pk__in=repository_version.content, is_highest=True
-        ).count()
-
-        partner_count = Namespace.objects.count()
+        estate = get_landing_page_estate()
+        collection_count = estate["collection_count"]
+        partner_count = estate["partner_count"]
 
         # If there are no partners dont show the recommendation for it
         recommendations = {}
-        if partner_count > 0:
-            namespace = sample(list(Namespace.objects.all()), 1)[0]
+        namespace = estate["partner"]
+        if namespace is not None:
             recommendations = {
                 "recs": [
                     {
                         "id": "ansible-partner",
                         "icon": "bulb",
                         "action": {
-                            "title": f"Check out our partner {namespace.company}",
-                            "href": f"./ansible/automation-hub/partners/{namespace.name}",
+                            "title": f"Check out our partner {namespace['company']}",
+                            "href": f"./ansible/automation-hub/partners/{namespace['name']}",
                         },
                         "description": "Discover automation from our partners.",
                     }
@@ -12,7 +12,7 @@ from django.db.models import (
     Value,
 )
 from django.db.models.fields.json import KT
-from django.db.models.functions import Coalesce
+from django.db.models.functions import Cast, Coalesce
 from drf_spectacular.types import OpenApiTypes
 from drf_spectacular.utils import OpenApiParameter, extend_schema
 from pulp_ansible.app.models import (
@@ -25,6 +25,7 @@ from rest_framework.exceptions import ValidationError
 from rest_framework.permissions import AllowAny
 
 from galaxy_ng.app.api import base as api_base
+from galaxy_ng.app.api.pagination import KeysetPaginationMixin
 from galaxy_ng.app.api.ui.v1.serializers import SearchResultsSerializer
 from galaxy_ng.app.api.v1.models import LegacyRole
 from galaxy_ng.app.models.namespace import Namespace
@@ -60,6 +61,22 @@ QUERYSET_VALUES = [
     "relevance",
 ]
 RANK_NORMALIZATION = 32
+# appended to the sorting to give every row a unique keyset position
+KEYSET_TIEBREAK = ["namespace_name", "name", "content_type"]
+
+
+class SearchPagination(KeysetPaginationMixin, api_base.GALAXY_PAGINATION_CLASS):
+    def get_keyset_paginated_data(self, data):
+        return {
+            "meta": {"count": self.count},
+            "links": {
+                "first": self.get_first_cursor_link(),
+                "previous": None,
+                "next": self.get_next_cursor_link(),
+                "last": None,
+            },
+            "data": data,
+        }
 
 
 class SearchListView(api_base.GenericViewSet, mixins.ListModelMixin):
@@ -67,6 +84,7 @@ class SearchListView(api_base.GenericViewSet, mixins.ListModelMixin):
 
     permission_classes = [AllowAny]
     serializer_class = SearchResultsSerializer
+    pagination_class = SearchPagination
 
     @extend_schema(
         parameters=[
@@ -121,6 +139,10 @@ class SearchListView(api_base.GenericViewSet, mixins.ListModelMixin):
 
         Pagination is based on `limit` and `offset` parameters.
 
+        To walk the whole result set pass an empty `cursor` parameter instead of
+        `offset` and follow `links:next`. Each page then costs the same however
+        deep it is, `meta:count` is an estimate and there is no `last` link.
+
         ## Results
 
         Results are embedded in the pagination serializer including
@@ -155,7 +177,16 @@ class SearchListView(api_base.GenericViewSet, mixins.ListModelMixin):
         qs = self.get_search_results(self.filter_params, self.sort)
         return qs
 
-    def get_search_results(self, filter_params, sort):
+    def get_keyset(self):
+        """The sorting, made unique for the keyset pagination."""
+        sort_fields = [item.lstrip("-") for item in self.sort]
+        return self.sort + [item for item in KEYSET_TIEBREAK if item not in sort_fields]
+
+    def get_keyset_queryset(self, keyset, position_filter):
+        """The union can not be filtered, the position is applied to each queryset."""
+        return self.get_search_results(self.filter_params, keyset, position_filter=position_filter)
+
+    def get_search_results(self, filter_params, sort, position_filter=None):
         """Validates filter_params, builds each queryset and then unionize and apply filters."""
         type_ = filter_params.get("type", "").lower()
         if type_ not in ("role", "collection", ""):
@@ -177,7 +208,8 @@ class SearchListView(api_base.GenericViewSet, mixins.ListModelMixin):
             filter_params,
             sort,
             type_,
-            query=query
+            query=query,
+            position_filter=position_filter,
         )
         return result_qs
 
@@ -212,14 +244,18 @@ class SearchListView(api_base.GenericViewSet, mixins.ListModelMixin):
         )
         namespace_qs = Namespace.objects.filter(name=OuterRef("namespace"))
 
-        relevance = Value(0)
+        relevance = Value(0.0, output_field=FloatField())
         if query:
-            relevance = Func(
-                F("search_vector"),
-                query,
-                RANK_NORMALIZATION,
-                function="ts_rank",
-                output_field=FloatField(),
+            # ts_rank gives a real, cast it so the value round trips in the keyset cursor
+            relevance = Cast(
+                Func(
+                    F("search_vector"),
+                    query,
+                    RANK_NORMALIZATION,
+                    function="ts_rank",
+                    output_field=FloatField(),
+                ),
+                FloatField(),
             )
 
         # The order of the fields here is important, must match the role_queryset
@@ -248,14 +284,18 @@ class SearchListView(api_base.GenericViewSet, mixins.ListModelMixin):
 
     def get_role_queryset(self, query=None):
         """Build the LegacyRole queryset from annotations."""
-        relevance = Value(0)
+        relevance = Value(0.0, output_field=FloatField())
         if query:
-            relevance = Func(
-                F("search"),
-                query,
-                RANK_NORMALIZATION,
-                function="ts_rank",
-                output_field=FloatField(),
+            # ts_rank gives a real, cast it so the value round trips in the keyset cursor
+            relevance = Cast(
+                Func(
+                    F("search"),
+                    query,
+                    RANK_NORMALIZATION,
+                    function="ts_rank",
+                    output_field=FloatField(),
+                ),
+                FloatField(),
             )
         # The order of the fields here is important, must match the collection_queryset
         qs = LegacyRole.objects.annotate(
@@ -275,7 +315,9 @@ class SearchListView(api_base.GenericViewSet, mixins.ListModelMixin):
         ).values(*QUERYSET_VALUES)
         return qs
 
-    def filter_and_sort(self, collections, roles, filter_params, sort, type_="", query=None):
+    def filter_and_sort(
+        self, collections, roles, filter_params, sort, type_="", query=None, position_filter=None
+    ):
         """Apply filters individually on each queryset and then combine to sort."""
         facets = {}
         if deprecated := filter_params.get("deprecated"):
@@ -315,6 +357,10 @@ class SearchListView(api_base.GenericViewSet, mixins.ListModelMixin):
             collections = collections.filter(query)
             roles = roles.filter(query)
 
+        if position_filter is not None:
+            collections = collections.filter(position_filter)
+            roles = roles.filter(position_filter)
+
         if type_.lower() == "role":
             qs = roles.order_by(*sort)
         elif type_.lower() == "collection":
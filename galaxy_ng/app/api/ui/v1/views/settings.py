@@ -1,15 +1,20 @@
 from django.conf import settings
 from rest_framework.permissions import IsAuthenticatedOrReadOnly
-from rest_framework.response import Response
 
 from galaxy_ng.app.api import base as api_base
+from galaxy_ng.app.api.utils import conditional_response
+from galaxy_ng.app.utils.snapshots import get_settings_snapshot
 
 
 class SettingsView(api_base.APIView):
     permission_classes = [IsAuthenticatedOrReadOnly]
 
     def get(self, request, *args, **kwargs):
-        data = {}
+        etag, data = get_settings_snapshot("settings", request, self.get_settings)
+        return conditional_response(request, data, etag=etag)
+
+    @staticmethod
+    def get_settings():
         keyset = [
             "GALAXY_ENABLE_UNAUTHENTICATED_COLLECTION_ACCESS",
             "GALAXY_ENABLE_UNAUTHENTICATED_COLLECTION_DOWNLOAD",
@@ -45,4 +50,4 @@ class SettingsView(api_base.APIView):
             data["DYNACONF_AFTER_GET_HOOKS"] = \
                 [str(func) for func in settings_dict["DYNACONF_AFTER_GET_HOOKS"]]
 
-        return Response(data)
+        return data
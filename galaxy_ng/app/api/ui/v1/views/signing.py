@@ -1,13 +1,14 @@
-from django.core.exceptions import ObjectDoesNotExist, ValidationError
+from django.core.exceptions import ObjectDoesNotExist
 from django.utils.translation import gettext_lazy as _
 from pulp_ansible.app.models import AnsibleDistribution
 from pulpcore.plugin.models import SigningService
 from rest_framework import status
+from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
 
 from galaxy_ng.app.access_control import access_policy
 from galaxy_ng.app.api import base as api_base
-from galaxy_ng.app.tasks import call_sign_task
+from galaxy_ng.app.tasks import call_sign_by_filter_task, call_sign_task
 
 
 class CollectionSignView(api_base.APIView):
@@ -50,44 +51,45 @@ class CollectionSignView(api_base.APIView):
         self.kwargs = kwargs
         signing_service = self._get_signing_service(request)
         repository = self.get_repository(request)
-        content_units = self._get_content_units_to_sign(request, repository)
 
-        sign_task = call_sign_task(signing_service, repository, content_units)
+        if request.data.get("content_units"):
+            sign_task = call_sign_task(
+                signing_service, repository, request.data["content_units"]
+            )
+        else:
+            # the task selects the content units itself from the filter
+            sign_filter = self._get_sign_filter(request, repository)
+            sign_task = call_sign_by_filter_task(signing_service, repository, **sign_filter)
         return Response(data={"task_id": sign_task.pk}, status=status.HTTP_202_ACCEPTED)
 
-    def _get_content_units_to_sign(self, request, repository):
-        """Returns a list of pks for content units to sign.
+    def _get_sign_filter(self, request, repository):
+        """Returns the namespace, collection and version to sign.
 
-        If `content_units` is specified in the request, it will be used.
-        Otherwise, will use the filtering options specified in the request.
-        namespace, collection, version can be used to filter the content units.
+        namespace, collection, version can be used to filter the content units,
+        at least one content unit has to match.
         """
-        if request.data.get("content_units"):
-            return request.data["content_units"]
-        else:
-            try:
-                namespace = self.kwargs.get("namespace") or request.data["namespace"]
-            except KeyError:
-                raise ValidationError(_("Missing required field: namespace"))
+        try:
+            namespace = self.kwargs.get("namespace") or request.data["namespace"]
+        except KeyError:
+            raise ValidationError(_("Missing required field: namespace"))
 
-            query_params = {
-                "pulp_type": "ansible.collection_version",
-                "ansible_collectionversion__namespace": namespace,
-            }
+        query_params = {
+            "pulp_type": "ansible.collection_version",
+            "ansible_collectionversion__namespace": namespace,
+        }
 
-            collection = self.kwargs.get("collection") or request.data.get("collection")
-            version = self.kwargs.get("version") or request.data.get("version")
+        collection = self.kwargs.get("collection") or request.data.get("collection")
+        version = self.kwargs.get("version") or request.data.get("version")
 
-            if collection:
-                query_params["ansible_collectionversion__name"] = collection
-            if version:
-                query_params["ansible_collectionversion__version"] = version
+        if collection:
+            query_params["ansible_collectionversion__name"] = collection
+        if version:
+            query_params["ansible_collectionversion__version"] = version
 
-            content_units = repository.content.filter(**query_params).values_list("pk", flat=True)
-            if not content_units:
-                raise ValidationError(_("No content units found for: %s") % query_params)
+        if not repository.content.filter(**query_params).exists():
+            raise ValidationError(_("No content units found for: %s") % query_params)
 
-            return [str(item) for item in content_units]
+        return {"namespace": namespace, "collection": collection, "version": version}
 
     def get_repository(self, request):
         """Retrieves the repository object from the request distro_base_path.
@@ -1,5 +1,8 @@
-from django.db.models import Count
+from django.db.models import OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+from django.core.cache import cache
 from rest_framework import mixins
+from rest_framework.response import Response
 from django_filters import filters
 from django_filters.rest_framework import DjangoFilterBackend, filterset
 
@@ -11,6 +14,39 @@ from galaxy_ng.app.api.ui.v1 import versioning
 from galaxy_ng.app.access_control import access_policy
 from galaxy_ng.app.api.v1.models import LegacyRoleTag
 from galaxy_ng.app.api.v1.serializers import LegacyRoleTagSerializer
+from galaxy_ng.app.models import TagUsage
+from galaxy_ng.app.utils.tags import TAG_USAGE_CACHE_TIMEOUT, get_tag_usage_cache_key
+
+
+def _annotate_tag_usage(qs, kind):
+    """Annotate `count` from the TagUsage counters."""
+    return qs.annotate(
+        count=Coalesce(
+            Subquery(
+                TagUsage.objects.filter(kind=kind, name=OuterRef("name")).values("count")[:1]
+            ),
+            Value(0),
+        )
+    )
+
+
+class TagUsageCacheMixin:
+    """Serve the tag listings of `tag_kind` from the cache.
+
+    The listings are cached per absolute URI, their pagination links depend
+    on the host.
+    """
+
+    tag_kind = None
+
+    def list(self, request, *args, **kwargs):
+        key = get_tag_usage_cache_key(self.tag_kind, request.build_absolute_uri())
+        data = None if key is None else cache.get(key)
+        if data is None:
+            data = super().list(request, *args, **kwargs).data
+            if key is not None:
+                cache.set(key, data, TAG_USAGE_CACHE_TIMEOUT)
+        return Response(data)
 
 
 class TagsViewSet(api_base.GenericViewSet):
@@ -34,9 +70,7 @@ class CollectionTagFilterOrdering(filters.OrderingFilter):
         if value is not None and any(v in ["count", "-count"] for v in value):
             order = "-" if "-count" in value else ""
 
-            return qs.filter(
-                ansible_collectionversion__ansible_crossrepositorycollectionversionindex__is_highest=True  # noqa: E501
-            ).annotate(count=Count('ansible_collectionversion')).order_by(f"{order}count")
+            return qs.filter(count__gt=0).order_by(f"{order}count", "name")
 
         return super().filter(qs, value)
 
@@ -57,6 +91,7 @@ class CollectionTagFilter(filterset.FilterSet):
 
 
 class CollectionsTagsViewSet(
+    TagUsageCacheMixin,
     api_base.GenericViewSet,
     mixins.ListModelMixin
 ):
@@ -68,12 +103,13 @@ class CollectionsTagsViewSet(
     versioning_class = versioning.UIVersioning
     filter_backends = (DjangoFilterBackend,)
     filterset_class = CollectionTagFilter
+    tag_kind = "collection"
 
     queryset = Tag.objects.all()
 
     def get_queryset(self):
         qs = super().get_queryset()
-        return qs.annotate(count=Count("ansible_collectionversion"))
+        return _annotate_tag_usage(qs, self.tag_kind)
 
 
 class RoleTagFilterOrdering(filters.OrderingFilter):
@@ -81,7 +117,7 @@ class RoleTagFilterOrdering(filters.OrderingFilter):
         if value is not None and any(v in ["count", "-count"] for v in value):
             order = "-" if "-count" in value else ""
 
-            return qs.annotate(count=Count('legacyrole')).order_by(f"{order}count")
+            return qs.order_by(f"{order}count", "name")
 
         return super().filter(qs, value)
 
@@ -102,12 +138,14 @@ class RoleTagFilter(filterset.FilterSet):
 
 
 class RolesTagsViewSet(
+    TagUsageCacheMixin,
     api_base.GenericViewSet,
     mixins.ListModelMixin
 ):
     """
     ViewSet for roles' tags within the system.
-    Tags can be populated manually by running `django-admin populate-role-tags`.
+    Tags are indexed on role import and sync, they can be rebuilt manually
+    by running `django-admin populate-role-tags`.
     """
     queryset = LegacyRoleTag.objects.all()
     serializer_class = LegacyRoleTagSerializer
@@ -115,7 +153,8 @@ class RolesTagsViewSet(
     versioning_class = versioning.UIVersioning
     filter_backends = (DjangoFilterBackend,)
     filterset_class = RoleTagFilter
+    tag_kind = "role"
 
     def get_queryset(self):
         qs = super().get_queryset()
-        return qs.annotate(count=Count("legacyrole"))
+        return _annotate_tag_usage(qs, self.tag_kind)
@@ -1,3 +1,5 @@
+import hashlib
+import json
 import os
 import re
 import socket
@@ -6,8 +8,10 @@ from typing import NamedTuple
 from django.utils.translation import gettext_lazy as _
 from django.http import Http404
 from django.core.exceptions import ObjectDoesNotExist, ValidationError
+from django.utils.http import parse_etags, quote_etag
 
-from rest_framework import serializers
+from rest_framework import serializers, status
+from rest_framework.response import Response
 from pulpcore.plugin import models as pulp_models
 
 from requests.adapters import HTTPAdapter
@@ -177,3 +181,29 @@ def get_aap_version():
         with open(AAP_VERSION_FILE_PATH) as f:
             return f.read().strip('\n')
     return None
+
+
+def get_etag(data):
+    """Return a strong ETag for JSON-serializable `data`."""
+    content = json.dumps(data, sort_keys=True, default=str).encode()
+    return quote_etag(hashlib.sha256(content).hexdigest())
+
+
+def conditional_response(request, data, etag=None, cache_control="no-cache"):
+    """Return a Response for `data` with its ETag, or a 304 when the client has it.
+
+    "no-cache" lets clients keep the response but makes them revalidate it with
+    If-None-Match on every use.
+    """
+    etag = etag or get_etag(data)
+    # If-None-Match uses the weak comparison
+    if_none_match = [
+        tag.removeprefix("W/") for tag in parse_etags(request.headers.get("If-None-Match", ""))
+    ]
+    if etag in if_none_match or "*" in if_none_match:
+        response = Response(status=status.HTTP_304_NOT_MODIFIED)
+    else:
+        response = Response(data)
+    response["ETag"] = etag
+    response["Cache-Control"] = cache_control
+    return response
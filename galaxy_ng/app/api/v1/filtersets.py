@@ -1,13 +1,17 @@
+from django.contrib.contenttypes.models import ContentType
 from django.db.models import Q
-from django.db.models import Case, Value, When
+from django.db.models import Case, CharField, Exists, OuterRef, Value, When
+from django.db.models.fields.json import KT
+from django.db.models.functions import Cast
 from django_filters import filters
 from django_filters.rest_framework import filterset
+from pulpcore.plugin.models.role import GroupRole, UserRole
 
+from galaxy_ng.app.models import Namespace
 from galaxy_ng.app.models.auth import User
 from galaxy_ng.app.api.v1.models import LegacyNamespace
 from galaxy_ng.app.api.v1.models import LegacyRole
 from galaxy_ng.app.api.v1.models import LegacyRoleImport
-from galaxy_ng.app.utils.rbac import get_v3_namespace_owners
 
 
 class LegacyNamespaceFilter(filterset.FilterSet):
@@ -37,21 +41,17 @@ class LegacyNamespaceFilter(filterset.FilterSet):
         return queryset
 
     def owner_filter(self, queryset, name, value):
-        # find the owner on the linked v3 namespace
-
-        # FIXME(jctanner): this is terribly slow
-        pks = []
-        for ns1 in LegacyNamespace.objects.all():
-            if not ns1.namespace:
-                continue
-            ns3 = ns1.namespace
-            owners = get_v3_namespace_owners(ns3)
-            if value in [x.username for x in owners]:
-                pks.append(ns1.id)
-
-        queryset = queryset.filter(id__in=pks)
-
-        return queryset
+        # find the owner on the linked v3 namespace, the owner role held by the
+        # user or one of its groups counts, as in is_v3_namespace_owner()
+        namespace_roles = {
+            "role__name": "galaxy.collection_namespace_owner",
+            "content_type": ContentType.objects.get_for_model(Namespace),
+            "object_id": Cast(OuterRef("namespace_id"), output_field=CharField()),
+        }
+        return queryset.filter(
+            Exists(UserRole.objects.filter(user__username=value, **namespace_roles))
+            | Exists(GroupRole.objects.filter(group__user__username=value, **namespace_roles))
+        )
 
     def provider_filter(self, queryset, name, value):
         return queryset.filter(namespace__name=value)
@@ -138,25 +138,29 @@ class LegacyRoleFilter(filterset.FilterSet):
     def keywords_filter(self, queryset, name, value):
 
         keywords = self.request.query_params.getlist('keywords')
-
-        for keyword in keywords:
-            queryset = queryset.filter(
-                Q(namespace__name__contains=keyword)
-                | Q(name__contains=keyword)
-                | Q(full_metadata__description__contains=keyword)
-            )
-
-        return queryset
+        return self._filter_by_keywords(queryset, keywords)
 
     def autocomplete_filter(self, queryset, name, value):
 
         keywords = self.request.query_params.getlist('autocomplete')
+        return self._filter_by_keywords(queryset, keywords)
+
+    def _filter_by_keywords(self, queryset, keywords):
+        """
+        Substring match on the namespace name, role name and description.
+        The description is compared as text (->>) so the trigram index on
+        that expression can be used, the namespace names are matched in a
+        subquery against their own trigram index.
+        """
+        if not keywords:
+            return queryset
 
+        queryset = queryset.alias(description=KT('full_metadata__description'))
         for keyword in keywords:
             queryset = queryset.filter(
-                Q(namespace__name__contains=keyword)
+                Q(namespace__in=LegacyNamespace.objects.filter(name__contains=keyword))
                 | Q(name__contains=keyword)
-                | Q(full_metadata__description__contains=keyword)
+                | Q(description__contains=keyword)
             )
 
         return queryset
@@ -165,8 +169,11 @@ class LegacyRoleFilter(filterset.FilterSet):
 
         keywords = self.request.query_params.getlist('username_autocomplete')
 
+        # match the namespaces first, against their own trigram index
         for keyword in keywords:
-            queryset = queryset.filter(namespace__name__icontains=keyword)
+            queryset = queryset.filter(
+                namespace__in=LegacyNamespace.objects.filter(name__icontains=keyword)
+            )
 
         return queryset
 
@@ -1,6 +1,8 @@
 from django.db import models
+from django.db.models.functions import Upper
+from django.db.models.fields.json import KT, KeyTransform
 from django.contrib.postgres.search import SearchVectorField
-from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.indexes import GinIndex, OpClass
 
 from galaxy_ng.app.models import Namespace
 from galaxy_ng.app.models.auth import User
@@ -112,6 +114,16 @@ class LegacyNamespace(models.Model):
         editable=True
     )
 
+    class Meta:
+        indexes = (
+            GinIndex(
+                fields=["name"], opclasses=["gin_trgm_ops"], name="galaxy_legacyns_name_trgm"
+            ),
+            GinIndex(
+                OpClass(Upper("name"), name="gin_trgm_ops"), name="galaxy_legacyns_uname_trgm"
+            ),
+        )
+
     def __repr__(self):
         return f'<LegacyNamespace: {self.name}>'
 
@@ -170,6 +182,36 @@ class LegacyRole(models.Model):
 
     tags = models.ManyToManyField(LegacyRoleTag, editable=False, related_name="legacyrole")
 
+    class Meta:
+        # The v1 filters and the import lookups query these paths of
+        # full_metadata, they have to use the same expressions to hit the indexes.
+        indexes = (
+            # keyset pagination of the role list
+            models.Index(fields=["created", "id"], name="galaxy_legacyrole_created_idx"),
+            models.Index(
+                KT("full_metadata__github_user"),
+                KT("full_metadata__github_repo"),
+                name="galaxy_legacyrole_github_idx",
+            ),
+            models.Index(
+                KT("full_metadata__github_repo"), name="galaxy_legacyrole_repo_idx"
+            ),
+            GinIndex(
+                OpClass(KeyTransform("tags", "full_metadata"), name="jsonb_path_ops"),
+                name="galaxy_legacyrole_tags_gin",
+            ),
+            GinIndex(
+                fields=["name"], opclasses=["gin_trgm_ops"], name="galaxy_legacyrole_name_trgm"
+            ),
+            GinIndex(
+                OpClass(Upper("name"), name="gin_trgm_ops"), name="galaxy_legacyrole_uname_trgm"
+            ),
+            GinIndex(
+                OpClass(KT("full_metadata__description"), name="gin_trgm_ops"),
+                name="galaxy_legacyrole_desc_trgm",
+            ),
+        )
+
     def __repr__(self):
         return f'<LegacyRole: {self.namespace.name}.{self.name}>'
 
@@ -368,10 +368,11 @@ class LegacyRoleSerializer(serializers.ModelSerializer):
         }
 
     def get_download_count(self, obj):
-        counter = LegacyRoleDownloadCount.objects.filter(legacyrole=obj).first()
-        if counter:
-            return counter.count
-        return 0
+        # the role list selects the counter along with the role
+        try:
+            return obj.legacyroledownloadcount.count
+        except LegacyRoleDownloadCount.DoesNotExist:
+            return 0
 
 
 class LegacyRoleRepositoryUpdateSerializer(serializers.Serializer):
@@ -9,11 +9,14 @@ import tempfile
 import uuid
 
 from django.db import transaction
+from django.db.models.fields.json import KT
 
 from ansible.module_utils.compat.version import LooseVersion
 
+import attr
+from galaxy_importer import exceptions as importer_exceptions
 from galaxy_importer.config import Config
-from galaxy_importer.legacy_role import import_legacy_role
+from galaxy_importer.loaders import LegacyRoleLoader
 
 from galaxy_ng.app.models.auth import User
 from galaxy_ng.app.models import Namespace
@@ -28,6 +31,7 @@ from galaxy_ng.app.api.v1.models import LegacyRoleDownloadCount
 from galaxy_ng.app.api.v1.models import LegacyRoleImport
 from galaxy_ng.app.api.v1.utils import sort_versions
 from galaxy_ng.app.api.v1.utils import parse_version_tag
+from galaxy_ng.app.api.v1.utils import sync_role_tags
 
 from pulpcore.plugin.models import Task
 
@@ -69,10 +73,10 @@ def find_real_role(github_user, github_repo):
     clone_url = None
 
     # some roles have their github_user set differently from their namespace name ...
-    candidates = LegacyRole.objects.filter(
-        full_metadata__github_user=github_user,
-        full_metadata__github_repo=github_repo
-    ).order_by('created')
+    candidates = LegacyRole.objects.alias(
+        github_user=KT('full_metadata__github_user'),
+        github_repo=KT('full_metadata__github_repo'),
+    ).filter(github_user=github_user, github_repo=github_repo).order_by('created')
     if candidates.count() > 0:
         real_role = candidates.first()
         rr_github_user = real_role.full_metadata.get('github_user')
@@ -92,6 +96,22 @@ def find_real_role(github_user, github_repo):
     return real_role, real_namespace_name, real_github_user, real_github_repo, clone_url
 
 
+def load_legacy_role(checkout_path, namespace_name, cfg, logger):
+    """Load a legacy role with galaxy-importer.
+
+    Same as galaxy_importer.legacy_role.import_legacy_role(), except that it
+    does not have to run from the parent directory of the role: the loader
+    only uses `checkout_path`, so the process working directory is left alone
+    and several roles can be loaded at the same time.
+    """
+    if not os.path.isdir(checkout_path):
+        raise importer_exceptions.ImporterError(f"The path '{checkout_path}' does not exist")
+
+    data = LegacyRoleLoader(checkout_path, namespace_name, cfg, logger).load()
+    logger.info("Legacy role loading complete")
+    return attr.asdict(data)
+
+
 def do_git_checkout(clone_url, checkout_path, github_reference):
     """
     Handle making a clone, setting a branch/tag and
@@ -206,6 +226,40 @@ def normalize_versions(versions):
     return versions
 
 
+def _git_raw_date_to_isoformat(raw_date):
+    """Turn a git raw date, "<unix timestamp> <+hhmm>", into an isoformat date."""
+    timestamp, offset = raw_date.split()
+    minutes = int(offset[1:3]) * 60 + int(offset[3:5])
+    if offset.startswith('-'):
+        minutes = -minutes
+    tz = datetime.timezone(datetime.timedelta(minutes=minutes))
+    return datetime.datetime.fromtimestamp(int(timestamp), tz).isoformat()
+
+
+def get_tag_commits(gitrepo):
+    """
+    Return {tag name: (commit sha, commit date)} for all the tags of a checkout.
+
+    Everything is read with a single `git for-each-ref` call, annotated tags
+    are peeled to the commit they point to. Dates are read raw and formatted
+    here, the iso-strict output of git changed across versions.
+    """
+    output = gitrepo.git.for_each_ref(
+        'refs/tags',
+        format=(
+            '%(refname:strip=2)%00%(objectname)%00%(*objectname)'
+            '%00%(committerdate:raw)%00%(*committerdate:raw)'
+        ),
+    )
+    tags = {}
+    for line in output.splitlines():
+        name, sha, peeled_sha, date, peeled_date = line.split('\x00')
+        # tags of trees or blobs have no commit
+        if peeled_date or date:
+            tags[name] = (peeled_sha or sha, _git_raw_date_to_isoformat(peeled_date or date))
+    return tags
+
+
 def compute_all_versions(this_role, gitrepo):
     """
     Build a reconciled list of old versions and new versions.
@@ -219,48 +273,42 @@ def compute_all_versions(this_role, gitrepo):
     versions = normalize_versions(versions)
 
     # ALL semver tags should become versions
-    current_tags = []
-    for cversion in versions:
-        # we want tag but the sync'ed roles don't have it
-        # because the serializer returns "name" instead.
-        tag = cversion.get('tag')
-        if not tag:
-            tag = cversion.get('name')
-        current_tags.append(tag)
-    for tag in gitrepo.tags:
+    # we want tag but the sync'ed roles don't have it
+    # because the serializer returns "name" instead.
+    current_tags = {cversion.get('tag') or cversion.get('name') for cversion in versions}
+    git_tags = get_tag_commits(gitrepo)
+    for tag_name, (commit_sha, commit_date) in git_tags.items():
+
+        if tag_name in current_tags:
+            continue
 
         # must be a semver compliant value ...
         try:
-            version = parse_version_tag(tag.name)
+            version = parse_version_tag(tag_name)
         except ValueError:
             continue
 
-        if str(tag.name) in current_tags:
-            continue
-
         ts = datetime.datetime.now().isoformat()  # noqa: DTZ005
-        vdata = {
+        logger.info(f'adding new version from tag: {tag_name}')
+        versions.append({
             'id': str(uuid.uuid4()),
-            'tag': tag.name,
+            'tag': tag_name,
             'version': str(version),
-            'commit_date': tag.commit.committed_datetime.isoformat(),
-            'commit_sha': tag.commit.hexsha,
+            'commit_date': commit_date,
+            'commit_sha': commit_sha,
             'created': ts,
             'modified': ts,
-        }
-        if tag.name not in current_tags:
-            logger.info(f'adding new version from tag: {tag.name}')
-        versions.append(vdata)
+        })
 
     # remove old tag versions if they no longer exist in the repo
-    git_tags = [x.name for x in gitrepo.tags]
-    for version in versions[:]:
-        vname = version.get('tag')
-        if not vname:
-            vname = version.get('name')
-        if vname not in git_tags:
+    kept_versions = []
+    for version in versions:
+        vname = version.get('tag') or version.get('name')
+        if vname in git_tags:
+            kept_versions.append(version)
+        else:
             logger.info(f"removing {vname} because it no longer has a tag")
-            versions.remove(version)
+    versions = kept_versions
 
     versions = sort_versions(versions)
     for version in versions:
@@ -395,9 +443,6 @@ def legacy_role_import(
         namespace.save()
 
     with tempfile.TemporaryDirectory() as tmp_path:
-        # galaxy-importer requires importing legacy roles from the role's parent directory.
-        os.chdir(tmp_path)
-
         # galaxy-importer wants the role's directory to be the name of the role.
         checkout_path = os.path.join(tmp_path, github_repo)
         if clone_url is None:
@@ -424,7 +469,7 @@ def legacy_role_import(
         logger.info('===== LOADING ROLE =====')
         try:
             importer_config = Config()
-            result = import_legacy_role(checkout_path, namespace.name, importer_config, logger)
+            result = load_legacy_role(checkout_path, namespace.name, importer_config, logger)
         except Exception as e:
             logger.info('')
             logger.error(f'Role loading failed! {e}')
@@ -537,6 +582,7 @@ def legacy_role_import(
         logger.info('')
 
         # Save the new metadata
+        tags_changed = this_role.full_metadata.get('tags') != new_full_metadata['tags']
         this_role.full_metadata = new_full_metadata
 
         # Set the correct name ...
@@ -548,6 +594,8 @@ def legacy_role_import(
 
         logger.info('==== SAVING ROLE ====')
         this_role.save()
+        if tags_changed:
+            sync_role_tags({this_role.pk: new_full_metadata['tags']})
 
     # bind the role to the import log model
     if import_model:
@@ -688,9 +736,12 @@ def legacy_sync_from_upstream(
         new_full_metadata['versions'] = sort_versions(new_full_metadata['versions'])
 
         if dict(this_role.full_metadata) != new_full_metadata:
+            tags_changed = this_role.full_metadata.get('tags') != new_full_metadata['tags']
             with transaction.atomic():
                 this_role.full_metadata = new_full_metadata
                 this_role.save()
+                if tags_changed:
+                    sync_role_tags({this_role.pk: role_tags})
 
         with transaction.atomic():
             counter, _ = LegacyRoleDownloadCount.objects.get_or_create(legacyrole=this_role)
@@ -1,6 +1,9 @@
 import semantic_version
 from ansible.module_utils.compat.version import LooseVersion
 
+from galaxy_ng.app.api.v1.models import LegacyRole, LegacyRoleTag
+from galaxy_ng.app.utils.tags import refresh_role_tag_usage
+
 
 def parse_version_tag(value):
     value = str(value)
@@ -43,3 +46,56 @@ def sort_versions(versions):
         return versions
 
     return sorted_versions
+
+
+def sync_role_tags(role_tags):
+    """
+    Make the indexed tags of roles match their full_metadata tags.
+
+    role_tags maps a LegacyRole pk to its list of tag names. Missing tags are
+    created in bulk and the role/tag links are diffed against the through
+    table, so the number of queries does not depend on the number of roles.
+
+    The TagUsage counts of the tags gained or lost are refreshed.
+
+    Returns the number of tags created.
+    """
+    wanted = {pk: set(tags or []) for pk, tags in role_tags.items()}
+    names = set().union(*wanted.values())
+
+    tag_ids = dict(LegacyRoleTag.objects.filter(name__in=names).values_list("name", "pk"))
+    new_names = names - set(tag_ids)
+    if new_names:
+        LegacyRoleTag.objects.bulk_create(
+            [LegacyRoleTag(name=name) for name in new_names], ignore_conflicts=True
+        )
+        tag_ids.update(
+            LegacyRoleTag.objects.filter(name__in=new_names).values_list("name", "pk")
+        )
+
+    through = LegacyRole.tags.through
+    current = {
+        (role_id, tag_id): (pk, name)
+        for pk, role_id, tag_id, name in through.objects.filter(
+            legacyrole_id__in=wanted
+        ).values_list("pk", "legacyrole_id", "legacyroletag_id", "legacyroletag__name")
+    }
+    desired = {(pk, tag_ids[name]) for pk, tags in wanted.items() for name in tags}
+
+    stale = [current[link] for link in current.keys() - desired]
+    if stale:
+        through.objects.filter(pk__in=[pk for pk, _ in stale]).delete()
+    missing = desired - current.keys()
+    if missing:
+        through.objects.bulk_create(
+            [through(legacyrole_id=role_id, legacyroletag_id=tag_id)
+             for role_id, tag_id in missing],
+            ignore_conflicts=True,
+        )
+
+    missing_tag_ids = {tag_id for _, tag_id in missing}
+    changed_names = {name for _, name in stale}
+    changed_names.update(name for name, pk in tag_ids.items() if pk in missing_tag_ids)
+    refresh_role_tag_usage(changed_names)
+
+    return len(new_names)
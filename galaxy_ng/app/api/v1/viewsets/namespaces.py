@@ -14,6 +14,7 @@ from rest_framework.response import Response
 from rest_framework.pagination import PageNumberPagination
 
 from galaxy_ng.app.access_control.access_policy import LegacyAccessPolicy
+from galaxy_ng.app.api.pagination import KeysetPaginationMixin
 from galaxy_ng.app.utils.rbac import get_v3_namespace_owners
 from galaxy_ng.app.utils.rbac import add_user_to_v3_namespace
 from galaxy_ng.app.utils.rbac import remove_user_from_v3_namespace
@@ -43,10 +44,11 @@ GALAXY_AUTHENTICATION_CLASSES = perform_import(
 logger = logging.getLogger(__name__)
 
 
-class LegacyNamespacesSetPagination(PageNumberPagination):
+class LegacyNamespacesSetPagination(KeysetPaginationMixin, PageNumberPagination):
     page_size = 100
     page_size_query_param = 'page_size'
     max_page_size = 1000
+    keyset = ("id",)
 
 
 class LegacyNamespacesViewSet(
@@ -74,7 +76,7 @@ class LegacyNamespacesViewSet(
     TODO: allow mapping to a real namespace
     """
 
-    queryset = LegacyNamespace.objects.all().order_by('id')
+    queryset = LegacyNamespace.objects.select_related('namespace').order_by('id')
     pagination_class = LegacyNamespacesSetPagination
     serializer_class = LegacyNamespacesSerializer
 
@@ -1,7 +1,10 @@
 import logging
 
 from django.conf import settings
+from django.core.cache import cache
 from django.db import transaction
+from django.db.models import F
+from django.db.models.fields.json import KT
 from django.db.utils import InternalError as DatabaseInternalError
 from django_filters.rest_framework import DjangoFilterBackend
 from django.shortcuts import get_object_or_404
@@ -14,6 +17,14 @@ from rest_framework.settings import perform_import
 from rest_framework.pagination import PageNumberPagination
 
 from galaxy_ng.app.access_control.access_policy import LegacyAccessPolicy
+from galaxy_ng.app.api.pagination import KeysetPaginationMixin
+from galaxy_ng.app.api.utils import conditional_response, get_etag
+from galaxy_ng.app.utils.role_cache import (
+    ROLE_CACHE_TIMEOUT,
+    get_role_cache_key,
+    get_role_cache_version,
+    invalidate_role_cache,
+)
 
 from galaxy_ng.app.api.v1.tasks import (
     legacy_role_import,
@@ -48,16 +59,51 @@ GALAXY_AUTHENTICATION_CLASSES = perform_import(
 logger = logging.getLogger(__name__)
 
 
-class LegacyRolesSetPagination(PageNumberPagination):
+class LegacyRolesSetPagination(KeysetPaginationMixin, PageNumberPagination):
     page_size = 10
     page_size_query_param = 'page_size'
     max_page_size = 1000
+    keyset = ("created", "id")
+
+
+class LegacyRoleCacheMixin:
+    """Serve the role reads from the cache and answer conditional requests.
+
+    Responses are cached per absolute URI and per version, the version of all
+    roles for the list and of the role itself for the detail routes. The
+    versions are shared by all the processes and move whenever a role or its
+    download count changes, see galaxy_ng.app.utils.role_cache. Without a
+    shared version store the responses are not cached.
+    """
+
+    def list(self, request, *args, **kwargs):
+        return self._cached_response(request, None, super().list, *args, **kwargs)
 
+    def retrieve(self, request, *args, **kwargs):
+        return self._cached_response(request, self.kwargs["pk"], super().retrieve, *args, **kwargs)
+
+    def _cached_response(self, request, pk, view, *args, **kwargs):
+        version = get_role_cache_version(pk)
+        key = None if version is None else get_role_cache_key(version, request.build_absolute_uri())
+        cached = None if key is None else cache.get(key)
+        if cached is None:
+            response = view(request, *args, **kwargs)
+            if response.status_code != status.HTTP_200_OK:
+                return response
+            cached = (get_etag(response.data), response.data)
+            if key is not None:
+                cache.set(key, cached, ROLE_CACHE_TIMEOUT)
+
+        etag, data = cached
+        return conditional_response(request, data, etag=etag)
 
-class LegacyRolesViewSet(viewsets.ModelViewSet):
+
+class LegacyRolesViewSet(LegacyRoleCacheMixin, viewsets.ModelViewSet):
     """A list of legacy roles."""
 
-    queryset = LegacyRole.objects.all().order_by('created')
+    queryset = LegacyRole.objects.select_related(
+        'namespace__namespace', 'legacyroledownloadcount'
+    ).order_by('created')
     ordering = ('created')
     filter_backends = (DjangoFilterBackend,)
     filterset_class = LegacyRoleFilter
@@ -82,17 +128,15 @@ class LegacyRolesViewSet(viewsets.ModelViewSet):
                 with transaction.atomic():
 
                     try:
-                        # attempt to get or create the counter first
-                        counter, _ = LegacyRoleDownloadCount.objects.get_or_create(legacyrole=role)
-
-                        # now lock the row so that we avoid race conditions
-                        counter = LegacyRoleDownloadCount.objects.select_for_update().get(
-                            pk=counter.pk
+                        counter, created = LegacyRoleDownloadCount.objects.get_or_create(
+                            legacyrole=role, defaults={'count': 1}
                         )
-
-                        # increment and save
-                        counter.count += 1
-                        counter.save()
+                        if not created:
+                            # a single UPDATE avoids races, it sends no post_save
+                            LegacyRoleDownloadCount.objects.filter(pk=counter.pk).update(
+                                count=F('count') + 1
+                            )
+                            invalidate_role_cache([role.pk])
                     except DatabaseInternalError as e:
                         # Fail gracefully if the database is in read-only mode.
                         if "read-only" not in str(e):
@@ -161,7 +205,8 @@ class LegacyRolesViewSet(viewsets.ModelViewSet):
 
         qs = LegacyRole.objects
         qs = qs.filter(namespace__name=github_user)
-        qs = qs.filter(full_metadata__github_repo=github_repo)
+        qs = qs.alias(github_repo=KT('full_metadata__github_repo'))
+        qs = qs.filter(github_repo=github_repo)
 
         if qs.count() == 0:
             return Response({
@@ -197,7 +242,9 @@ class LegacyRolesViewSet(viewsets.ModelViewSet):
         })
 
 
-class LegacyRoleContentViewSet(viewsets.GenericViewSet, mixins.RetrieveModelMixin):
+class LegacyRoleContentViewSet(
+    LegacyRoleCacheMixin, viewsets.GenericViewSet, mixins.RetrieveModelMixin
+):
     """Documentation for a single legacy role."""
 
     permission_classes = [LegacyAccessPolicy]
@@ -208,7 +255,9 @@ class LegacyRoleContentViewSet(viewsets.GenericViewSet, mixins.RetrieveModelMixi
         return get_object_or_404(LegacyRole, id=self.kwargs["pk"])
 
 
-class LegacyRoleVersionsViewSet(viewsets.GenericViewSet, mixins.RetrieveModelMixin):
+class LegacyRoleVersionsViewSet(
+    LegacyRoleCacheMixin, viewsets.GenericViewSet, mixins.RetrieveModelMixin
+):
     """A list of versions for a single legacy role."""
 
     permission_classes = [LegacyAccessPolicy]
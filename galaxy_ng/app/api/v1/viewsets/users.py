@@ -10,6 +10,7 @@ from rest_framework.response import Response
 from rest_framework.pagination import PageNumberPagination
 
 from galaxy_ng.app.access_control.access_policy import LegacyAccessPolicy
+from galaxy_ng.app.api.pagination import KeysetPaginationMixin
 
 from galaxy_ng.app.models.auth import User
 from galaxy_ng.app.api.v1.serializers import (
@@ -29,10 +30,11 @@ GALAXY_AUTHENTICATION_CLASSES = perform_import(
 logger = logging.getLogger(__name__)
 
 
-class LegacyUsersSetPagination(PageNumberPagination):
+class LegacyUsersSetPagination(KeysetPaginationMixin, PageNumberPagination):
     page_size = 100
     page_size_query_param = 'page_size'
     max_page_size = 1000
+    keyset = ("id",)
 
 
 class LegacyUsersViewSet(viewsets.ModelViewSet):
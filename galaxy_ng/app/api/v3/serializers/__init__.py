@@ -1,5 +1,6 @@
 from .collection import (
     CollectionUploadSerializer,
+    CollectionVersionBulkMoveSerializer,
 )
 
 from .namespace import (
@@ -28,6 +29,7 @@ from .execution_environment import (
 __all__ = (
     # collection
     "CollectionUploadSerializer",
+    "CollectionVersionBulkMoveSerializer",
     "ContainerManifestDetailSerializer",
     "ContainerManifestSerializer",
     "ContainerReadmeSerializer",
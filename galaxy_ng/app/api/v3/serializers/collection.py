@@ -46,3 +46,17 @@ class CollectionUploadSerializer(Serializer):
             "mimetype": (mimetypes.guess_type(filename)[0] or 'application/octet-stream')
         })
         return data
+
+
+class CollectionVersionReferenceSerializer(Serializer):
+    namespace = serializers.CharField()
+    name = serializers.CharField()
+    version = serializers.CharField()
+
+
+class CollectionVersionBulkMoveSerializer(Serializer):
+    """
+    A serializer for moving many collection versions between repositories at once.
+    """
+
+    collection_versions = CollectionVersionReferenceSerializer(many=True, allow_empty=False)
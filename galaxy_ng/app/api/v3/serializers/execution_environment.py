@@ -1,5 +1,4 @@
-import json
-
+from django.db.models import Manager
 from rest_framework import serializers
 from drf_spectacular.types import OpenApiTypes
 from drf_spectacular.utils import extend_schema_field
@@ -12,6 +11,8 @@ from pulpcore.plugin import models as core_models
 
 from galaxy_ng.app import models
 from galaxy_ng.app.access_control.fields import MyPermissionsField
+from galaxy_ng.app.utils.containers import get_config_blob_data
+from galaxy_ng.app.utils.rbac import get_users_with_perms_by_object
 
 from galaxy_ng.app.api.ui.v1 import serializers as ui_serializers
 
@@ -61,11 +62,32 @@ class ContainerNamespaceSerializer(serializers.ModelSerializer):
 
     @extend_schema_field(serializers.ListField)
     def get_owners(self, namespace):
+        # batched by ContainerRepositoryListSerializer when listing repositories
+        namespace_owners = self.context.get("namespace_owners")
+        if namespace_owners is not None:
+            return namespace_owners.get(namespace.pk, [])
         return get_users_with_perms(
             namespace, with_group_users=False, for_concrete_model=True
         ).values_list("username", flat=True)
 
 
+class ContainerRepositoryListSerializer(serializers.ListSerializer):
+    """Resolve the remotes and namespace owners of a whole page at once."""
+
+    def to_representation(self, data):
+        distros = list(data.all() if isinstance(data, Manager) else data)
+
+        remote_pks = {d.repository.remote_id for d in distros if d.repository.remote_id}
+        self._context["container_remotes"] = container_models.ContainerRemote.objects.filter(
+            pk__in=remote_pks
+        ).select_related("registry__registry").in_bulk()
+        self._context["namespace_owners"] = get_users_with_perms_by_object(
+            {d.namespace.pk: d.namespace for d in distros}.values()
+        )
+
+        return super().to_representation(distros)
+
+
 class ContainerRepositorySerializer(serializers.ModelSerializer):
     pulp = serializers.SerializerMethodField()
     namespace = ContainerNamespaceSerializer()
@@ -95,6 +117,7 @@ class ContainerRepositorySerializer(serializers.ModelSerializer):
         )
 
         fields = read_only_fields
+        list_serializer_class = ContainerRepositoryListSerializer
 
     def get_namespace(self, distro) -> str:
         return distro.namespace.name
@@ -115,19 +138,27 @@ class ContainerRepositorySerializer(serializers.ModelSerializer):
     def get_pulp(self, distro):
         repo = distro.repository
         remote = None
-        if repo.remote:
+        if repo.remote_id:
+            container_remotes = self.context.get("container_remotes") or {}
+            container_remote = container_remotes.get(repo.remote_id) or repo.remote.cast()
             remote = ui_serializers.ContainerRemoteSerializer(
-                repo.remote.cast(), context=self.context).data
+                container_remote, context=self.context).data
+
+        # is_signed and latest_version_number are annotated by ContainerRepositoryViewSet
+        is_signed = getattr(distro, "is_signed", None)
+        if is_signed is None:
+            is_signed = repo.content.filter(pulp_type="container.signature").exists()
+        sign_state = (is_signed and "signed") or "unsigned"
 
-        sign_state = (repo.content.filter(
-            pulp_type="container.signature"
-        ).count() > 0 and "signed") or "unsigned"
+        latest_version_number = getattr(distro, "latest_version_number", None)
+        if latest_version_number is None:
+            latest_version_number = repo.latest_version().number
 
         return {
             "repository": {
                 "id": repo.pk,
                 "pulp_type": repo.pulp_type,
-                "version": repo.latest_version().number,
+                "version": latest_version_number,
                 "name": repo.name,
                 "description": repo.description,
                 "created_at": repo.pulp_created,
@@ -237,12 +268,9 @@ class ContainerManifestSerializer(serializers.ModelSerializer):
 class ContainerManifestDetailSerializer(ContainerManifestSerializer):
     @extend_schema_field(OpenApiTypes.OBJECT)
     def get_config_blob(self, obj):
-        with obj.config_blob._artifacts.first().file.open() as f:
-            config_json = json.load(f)
-
         return {
             "digest": obj.config_blob.digest,
-            "data": config_json,
+            "data": get_config_blob_data(obj.config_blob),
         }
 
 
@@ -273,14 +301,23 @@ class ContainerRepositoryHistorySerializer(serializers.ModelSerializer):
             "tag_name": None,
         }
 
-        # TODO(jerabekjiri): Figure out if there is a way to prefetch Manifest and Tag objects
+        # The list view resolves the digests and tag names of the whole page at once
         if content.pulp_type == "container.manifest":
-            manifest = container_models.Manifest.objects.get(pk=content.pk)
-            return_data["manifest_digest"] = manifest.digest
+            if "manifest_digests" in self.context:
+                return_data["manifest_digest"] = self.context["manifest_digests"].get(content.pk)
+            else:
+                manifest = container_models.Manifest.objects.get(pk=content.pk)
+                return_data["manifest_digest"] = manifest.digest
         elif content.pulp_type == "container.tag":
-            tag = container_models.Tag.objects.select_related("tagged_manifest").get(pk=content.pk)
-            return_data["manifest_digest"] = tag.tagged_manifest.digest
-            return_data["tag_name"] = tag.name
+            if "tags" in self.context:
+                return_data["tag_name"], return_data["manifest_digest"] = (
+                    self.context["tags"].get(content.pk, (None, None))
+                )
+            else:
+                tag = container_models.Tag.objects.select_related("tagged_manifest").get(
+                    pk=content.pk)
+                return_data["manifest_digest"] = tag.tagged_manifest.digest
+                return_data["tag_name"] = tag.name
 
         return return_data
 
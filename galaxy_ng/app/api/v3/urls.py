@@ -160,6 +160,11 @@ urlpatterns = [
         viewsets.CollectionVersionMoveViewSet.as_view({"post": "move_content"}),
         name="collection-version-move",
     ),
+    path(
+        "collection_versions/move/<str:source_path>/<str:dest_path>/",
+        viewsets.CollectionVersionMoveViewSet.as_view({"post": "bulk_move_content"}),
+        name="collection-version-bulk-move",
+    ),
     path(
         "collections/<str:namespace>/<str:name>/versions/<str:version>/copy/"
         "<str:source_path>/<str:dest_path>/",
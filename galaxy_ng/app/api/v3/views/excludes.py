@@ -1,10 +1,16 @@
 import yaml
-from django.core.exceptions import ObjectDoesNotExist
 from django.conf import settings
+from django.core.cache import cache
+from pulp_ansible.app.models import Collection
 
-from galaxy_ng.app import models
 from galaxy_ng.app.access_control import access_policy
 from galaxy_ng.app.api import base as api_base
+from galaxy_ng.app.models.synclist import (
+    EXCLUDES_CACHE_KEY,
+    EXCLUDES_CACHE_TIMEOUT,
+    EXCLUDES_CACHE_VERSION,
+)
+from galaxy_ng.app.utils.cache_versions import get_cache_version
 from rest_framework.renderers import (
     BaseRenderer,
     BrowsableAPIRenderer,
@@ -16,24 +22,38 @@ from yaml.dumper import SafeDumper
 
 
 def get_synclist_excludes(base_path):
-    """Get SyncList that has same name as distro base_path"""
-    try:
-        synclist = models.SyncList.objects.get(name=base_path, policy="exclude")
-        return synclist.collections.all()
-    except ObjectDoesNotExist:
-        return None
+    """Get (namespace, name) of the collections excluded by the SyncList named as base_path"""
+    return Collection.objects.filter(
+        synclist__name=base_path, synclist__policy="exclude"
+    ).order_by("namespace", "name").values_list("namespace", "name")
 
 
 def serialize_collection_queryset(queryset):
     """Serialize a Queryset in to a JSONable format."""
     return (queryset is not None and [
-        {
-            "name": "{collection.namespace}.{collection.name}".format(collection=collection)
-        }
-        for collection in queryset.all()
+        {"name": f"{namespace}.{name}"} for namespace, name in queryset
     ]) or []
 
 
+def get_cached_synclist_excludes(base_path):
+    """Serialized excludes of the SyncList named as base_path.
+
+    The cache entry is dropped in every process when the synclist or its
+    collections change, see SyncList.invalidate_excludes_cache(), and expires
+    after EXCLUDES_CACHE_TIMEOUT otherwise. Nothing is cached without redis.
+    """
+    version = get_cache_version(EXCLUDES_CACHE_VERSION.format(name=base_path))
+    if version is None:
+        return serialize_collection_queryset(get_synclist_excludes(base_path))
+
+    cache_key = EXCLUDES_CACHE_KEY.format(version=version, name=base_path)
+    collections_to_exclude = cache.get(cache_key)
+    if collections_to_exclude is None:
+        collections_to_exclude = serialize_collection_queryset(get_synclist_excludes(base_path))
+        cache.set(cache_key, collections_to_exclude, EXCLUDES_CACHE_TIMEOUT)
+    return collections_to_exclude
+
+
 class RequirementsFileRenderer(BaseRenderer):
     """Renders requirements YAML format."""
 
@@ -81,6 +101,5 @@ class ExcludesView(api_base.APIView):
         Returns a list of excludes for a given distro.
         """
         base_path = self.kwargs.get('path', settings.ANSIBLE_DEFAULT_DISTRIBUTION_PATH)
-        queryset = get_synclist_excludes(base_path)
-        collections_to_exclude = serialize_collection_queryset(queryset)
+        collections_to_exclude = get_cached_synclist_excludes(base_path)
         return Response({"collections": collections_to_exclude})
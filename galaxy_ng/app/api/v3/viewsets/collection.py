@@ -16,7 +16,7 @@ from pulp_ansible.app.models import (
 
 )
 
-from pulpcore.plugin.models import Content, SigningService, Task, TaskGroup
+from pulpcore.plugin.models import SigningService, Task, TaskGroup
 from pulpcore.plugin.serializers import AsyncOperationResponseSerializer
 from pulpcore.plugin.tasking import dispatch
 from rest_framework import status
@@ -27,7 +27,10 @@ from pulp_ansible.app.tasks.copy import copy_collection
 from galaxy_ng.app import models
 from galaxy_ng.app.access_control import access_policy
 from galaxy_ng.app.api import base as api_base
-from galaxy_ng.app.api.v3.serializers import CollectionUploadSerializer
+from galaxy_ng.app.api.v3.serializers import (
+    CollectionUploadSerializer,
+    CollectionVersionBulkMoveSerializer,
+)
 from galaxy_ng.app.common import metrics
 from galaxy_ng.app.common.parsers import AnsibleGalaxy29MultiPartParser
 from galaxy_ng.app.constants import DeploymentMode
@@ -37,6 +40,7 @@ from galaxy_ng.app.tasks import (
     import_and_auto_approve,
     import_to_staging,
 )
+from galaxy_ng.app.utils.db import filter_by_tuples
 
 
 log = logging.getLogger(__name__)
@@ -250,6 +254,15 @@ class CollectionRepositoryMixing:
             raise NotFound(_('Repo(s) for moving collection %s not found') % self.version_str)
         return src_repo, dest_repo
 
+    @staticmethod
+    def get_latest_content(repo):
+        """Get the content of the latest version of repo.
+
+        Filter it by pk, testing membership against it in python loads the
+        whole repository.
+        """
+        return repo.latest_version().content
+
 
 class CollectionVersionCopyViewSet(api_base.ViewSet, CollectionRepositoryMixing):
     permission_classes = [access_policy.CollectionAccessPolicy]
@@ -285,13 +298,86 @@ class CollectionVersionMoveViewSet(api_base.ViewSet, CollectionRepositoryMixing)
 
         collection_version = self.get_collection_version()
         src_repo, dest_repo = self.get_repos()
-        content_obj = Content.objects.get(pk=collection_version.pk)
-        if content_obj not in src_repo.latest_version().content:
+
+        if not self.get_latest_content(src_repo).filter(
+            pk=collection_version.pk
+        ).exists():
             raise NotFound(_('Collection %s not found in source repo') % self.version_str)
 
-        if content_obj in dest_repo.latest_version().content:
+        if self.get_latest_content(dest_repo).filter(
+            pk=collection_version.pk
+        ).exists():
             raise NotFound(_('Collection %s already found in destination repo') % self.version_str)
 
+        return self._dispatch_move([collection_version], src_repo, dest_repo)
+
+    @extend_schema(
+        request=CollectionVersionBulkMoveSerializer,
+        responses={202: AsyncOperationResponseSerializer},
+    )
+    def bulk_move_content(self, request, *args, **kwargs):
+        """Move many collection versions from source repo to destination repo.
+
+        All the collection versions are moved by a single task.
+        """
+        serializer = CollectionVersionBulkMoveSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        requested = {
+            (cv["namespace"], cv["name"], cv["version"])
+            for cv in serializer.validated_data["collection_versions"]
+        }
+
+        try:
+            src_repo = AnsibleDistribution.objects.get(
+                base_path=self.kwargs['source_path']).repository
+            dest_repo = AnsibleDistribution.objects.get(
+                base_path=self.kwargs['dest_path']).repository
+        except ObjectDoesNotExist:
+            raise NotFound(_('Repo(s) for moving collections not found'))
+
+        collection_versions = list(filter_by_tuples(
+            CollectionVersion.objects.only("pk", "namespace", "name", "version"),
+            ("namespace", "name", "version"),
+            requested,
+        ).order_by("pk"))
+
+        missing = requested - {
+            (cv.namespace, cv.name, cv.version) for cv in collection_versions
+        }
+        if missing:
+            raise NotFound(
+                _('Collection(s) %s not found') % _format_version_strs(missing)
+            )
+
+        pks = [cv.pk for cv in collection_versions]
+        in_src = set(
+            self.get_latest_content(src_repo).filter(
+                pk__in=pks
+            ).values_list("pk", flat=True)
+        )
+        in_dest = set(
+            self.get_latest_content(dest_repo).filter(
+                pk__in=pks
+            ).values_list("pk", flat=True)
+        )
+
+        not_in_src = [cv for cv in collection_versions if cv.pk not in in_src]
+        if not_in_src:
+            raise NotFound(
+                _('Collection(s) %s not found in source repo')
+                % _format_version_strs(not_in_src)
+            )
+
+        already_in_dest = [cv for cv in collection_versions if cv.pk in in_dest]
+        if already_in_dest:
+            raise NotFound(
+                _('Collection(s) %s already found in destination repo')
+                % _format_version_strs(already_in_dest)
+            )
+
+        return self._dispatch_move(collection_versions, src_repo, dest_repo)
+
+    def _dispatch_move(self, collection_versions, src_repo, dest_repo):
         response_data = {
             "copy_task_id": None,
             "remove_task_id": None,
@@ -302,7 +388,7 @@ class CollectionVersionMoveViewSet(api_base.ViewSet, CollectionRepositoryMixing)
         golden_repo = settings.get("GALAXY_API_DEFAULT_DISTRIBUTION_BASE_PATH", "published")
         auto_sign = settings.get("GALAXY_AUTO_SIGN_COLLECTIONS", False)
         move_task_params = {
-            "collection_version": collection_version,
+            "collection_versions": collection_versions,
             "source_repo": src_repo,
             "dest_repo": dest_repo,
         }
@@ -321,23 +407,25 @@ class CollectionVersionMoveViewSet(api_base.ViewSet, CollectionRepositoryMixing)
             move_task = call_sign_and_move_task(signing_service, **move_task_params)
         else:
             require_signatures = settings.get("GALAXY_REQUIRE_SIGNATURE_FOR_APPROVAL", False)
-            if (
-                dest_repo.name == golden_repo
-                and require_signatures
-                and collection_version.signatures.count() == 0
-            ):
-                return Response(
-                    {
-                        "detail": _(
-                            "Collection {namespace}.{name} could not be approved "
-                            "because system requires at least a signature for approval."
-                        ).format(
-                            namespace=collection_version.namespace,
-                            name=collection_version.name,
-                        )
-                    },
-                    status=status.HTTP_400_BAD_REQUEST,
-                )
+            if dest_repo.name == golden_repo and require_signatures:
+                unsigned = CollectionVersion.objects.filter(
+                    pk__in=[cv.pk for cv in collection_versions],
+                    signatures__isnull=True,
+                ).order_by("namespace", "name").values_list("namespace", "name")
+                if unsigned:
+                    return Response(
+                        {
+                            "detail": _(
+                                "Collection {collections} could not be approved "
+                                "because system requires at least a signature for approval."
+                            ).format(
+                                collections=", ".join(
+                                    f"{namespace}.{name}" for namespace, name in unsigned
+                                ),
+                            )
+                        },
+                        status=status.HTTP_400_BAD_REQUEST,
+                    )
             move_task = call_move_content_task(**move_task_params)
 
         response_data['copy_task_id'] = response_data['remove_task_id'] = move_task.pk
@@ -348,3 +436,11 @@ class CollectionVersionMoveViewSet(api_base.ViewSet, CollectionRepositoryMixing)
             ).repository
 
         return Response(data=response_data, status='202')
+
+
+def _format_version_strs(collection_versions):
+    """Format (namespace, name, version) tuples or CollectionVersions for error messages."""
+    return ", ".join(sorted(
+        "-".join(cv) if isinstance(cv, tuple) else f"{cv.namespace}-{cv.name}-{cv.version}"
+        for cv in collection_versions
+    ))
@@ -1,7 +1,7 @@
 import logging
 
 from django.core import exceptions
-from django.db.models import Count, Prefetch, Q
+from django.db.models import Count, Exists, OuterRef, Prefetch, Q, Subquery
 from django.shortcuts import get_object_or_404
 from django_filters import filters
 from django_filters.rest_framework import DjangoFilterBackend, filterset
@@ -108,7 +108,16 @@ class TagFilter(filterset.FilterSet):
 
 
 class ContainerRepositoryViewSet(api_base.ModelViewSet):
-    queryset = models.ContainerDistribution.objects.all().select_related('namespace')
+    queryset = models.ContainerDistribution.objects.all().select_related(
+        'namespace', 'repository__remote'
+    ).annotate(
+        is_signed=Exists(core_models.RepositoryContent.objects.filter(
+            repository=OuterRef('repository'), content__pulp_type='container.signature'
+        )),
+        latest_version_number=Subquery(core_models.RepositoryVersion.objects.filter(
+            repository=OuterRef('repository'), complete=True
+        ).order_by('-number').values('number')[:1]),
+    )
     serializer_class = serializers.ContainerRepositorySerializer
     filter_backends = (DjangoFilterBackend,)
     filterset_class = RepositoryFilter
@@ -213,6 +222,38 @@ class ContainerRepositoryHistoryViewSet(ContainerContentBaseViewset):
             ).order_by('-pulp_created')
         )
 
+    def get_serializer(self, *args, **kwargs):
+        if args and kwargs.get("many"):
+            kwargs["context"] = {
+                **self.get_serializer_context(),
+                **self._get_content_info_context(args[0]),
+            }
+        return super().get_serializer(*args, **kwargs)
+
+    @staticmethod
+    def _get_content_info_context(versions):
+        """Resolve the manifest digests and tag names of all the content units
+        added or removed in `versions` with one query per content type."""
+        content_pks = {"container.manifest": set(), "container.tag": set()}
+        for version in versions:
+            for membership in (*version.added_memberships.all(),
+                               *version.removed_memberships.all()):
+                content_pks[membership.content.pulp_type].add(membership.content_id)
+
+        return {
+            "manifest_digests": dict(
+                container_models.Manifest.objects.filter(
+                    pk__in=content_pks["container.manifest"]
+                ).values_list("pk", "digest")
+            ),
+            "tags": {
+                pk: (name, digest)
+                for pk, name, digest in container_models.Tag.objects.filter(
+                    pk__in=content_pks["container.tag"]
+                ).values_list("pk", "name", "tagged_manifest__digest")
+            },
+        }
+
 
 class ContainerReadmeViewSet(ContainerContentBaseViewset):
     queryset = models.ContainerDistroReadme.objects
@@ -1,31 +1,48 @@
 import logging
 
+from django.conf import settings
 from django.core.management.base import BaseCommand
 from django.db import transaction
+from django.db.models import OuterRef, Subquery
 from pulp_ansible.app.models import AnsibleDistribution, AnsibleRepository
+from pulpcore.app.util import cache_key
+from pulpcore.cache import Cache
 
 from galaxy_ng.app.models import SyncList
 
 log = logging.getLogger(__name__)
 
 
-def set_synclist_distro_by_name(name):
-    distro = AnsibleDistribution.objects.get(name=name)
-    synclist = SyncList.objects.get(name=name)
-    synclist.distribution = distro
-    synclist.save()
+def set_synclist_distros_by_name(names):
+    """Link the synclists named in `names` to the distribution of the same name."""
+    return SyncList.objects.filter(
+        name__in=AnsibleDistribution.objects.filter(name__in=names).values("name")
+    ).update(
+        distribution=Subquery(
+            AnsibleDistribution.objects.filter(name=OuterRef("name")).values("pk")[:1]
+        )
+    )
 
 
 class Command(BaseCommand):
     """This command deletes AnsibleRepository in the format of #####-synclists.
 
+    Repositories are processed in batches ordered by pk, each batch is deleted in
+    its own transaction, so an interrupted run can simply be started again.
+
     Example:
     django-admin delete-synclist-repos --number 100 --hard
     """
 
     def add_arguments(self, parser):
         parser.add_argument(
-            "--number", type=int, help="Max number to delete, for batching", required=True
+            "--number", type=int, help="Max number to process, defaults to all", default=None
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            help="Number of repos deleted per transaction",
+            default=1000,
         )
         parser.add_argument(
             "--hard",
@@ -37,34 +54,79 @@ class Command(BaseCommand):
 
     def handle(self, *args, **options):
         log.info("Deleting AnsibleRepository in the format of #####-synclists")
-        number_to_delete = options["number"]
+        number_to_process = options["number"]
+        batch_size = options["batch_size"]
 
-        synclist_repos = AnsibleRepository.objects.filter(name__endswith="-synclist")
+        synclist_repos = AnsibleRepository.objects.filter(
+            name__endswith="-synclist"
+        ).order_by("pk")
+        total = synclist_repos.count()
+        if number_to_process is not None:
+            total = min(total, number_to_process)
 
         if options["hard"]:
             log.info("Peforming delete of all repos")
-            for repo in synclist_repos[:number_to_delete]:
-                log.info(f"Deleting repo: {repo}")
-                with transaction.atomic():
-                    set_synclist_distro_by_name(repo.name)
-                    repo.delete()
-
         else:
             log.info("Peforming delete, will skip repo if does not find expected distro")
-            for repo in synclist_repos[:number_to_delete]:
-                log.info(f"Deleting repo: {repo}")
-                with transaction.atomic():
-                    if not AnsibleDistribution.objects.filter(name=repo.name):
-                        log.error(
-                            f"No distribution found matching the repo name '{repo.name}', skipping"
-                        )
-                        continue
-                    distro = AnsibleDistribution.objects.filter(name=repo.name).first()
-                    if distro.repository.name != "published":
-                        log.error(
-                            f"Distribution '{repo.name}' does not point at 'pubished' repo "
-                            f"but points at {distro.repository.name}, skipping"
-                        )
-                        continue
-                    set_synclist_distro_by_name(repo.name)
-                    repo.delete()
+
+        processed = deleted = 0
+        last_pk = None
+        while processed < total:
+            batch = synclist_repos if last_pk is None else synclist_repos.filter(pk__gt=last_pk)
+            repos = list(batch.values_list("pk", "name")[:min(batch_size, total - processed)])
+            if not repos:
+                break
+            last_pk = repos[-1][0]
+            processed += len(repos)
+
+            if not options["hard"]:
+                repos = self._filter_published_distros(repos)
+
+            deleted += self._delete_repos(repos)
+            log.info(
+                "Processed %s/%s synclist repos, deleted %s", processed, total, deleted
+            )
+
+    def _filter_published_distros(self, repos):
+        """Keep the repos whose distribution of the same name points at 'published'."""
+        distro_repos = dict(
+            AnsibleDistribution.objects.filter(
+                name__in=[name for _, name in repos]
+            ).values_list("name", "repository__name")
+        )
+
+        to_delete = []
+        for pk, name in repos:
+            if name not in distro_repos:
+                log.error(f"No distribution found matching the repo name '{name}', skipping")
+            elif distro_repos[name] != "published":
+                log.error(
+                    f"Distribution '{name}' does not point at 'pubished' repo "
+                    f"but points at {distro_repos[name]}, skipping"
+                )
+            else:
+                to_delete.append((pk, name))
+        return to_delete
+
+    def _delete_repos(self, repos):
+        if not repos:
+            return 0
+
+        pks = [pk for pk, _ in repos]
+        with transaction.atomic():
+            set_synclist_distros_by_name([name for _, name in repos])
+
+            base_paths = []
+            if settings.CACHE_ENABLED:
+                base_paths = list(
+                    AnsibleDistribution.objects.filter(
+                        repository__in=pks
+                    ).values_list("base_path", flat=True)
+                )
+            AnsibleRepository.objects.filter(pk__in=pks).delete()
+
+        # bulk deletes skip the Repository.invalidate_cache() hook
+        if base_paths:
+            Cache().delete(base_key=cache_key(base_paths))
+
+        return len(pks)
@@ -9,6 +9,7 @@ from pulpcore.plugin.tasking import dispatch
 
 from galaxy_ng.app.models import Namespace
 from galaxy_ng.app.tasks.namespaces import _create_pulp_namespace
+from galaxy_ng.app.utils.db import iterate_by_pk
 
 # Set logging_uid, this does not seem to get generated when task called via management command
 django_guid.set_guid(django_guid.utils.generate_guid())
@@ -105,9 +106,5 @@ def download_all_logos(namespace_name=None, only_missing_sha=False):
             last_created_pulp_metadata__avatar_sha256__isnull=True
         )
 
-    for namespace in qs:
-        download_logo = False
-        if namespace._avatar_url:
-            download_logo = True
-
-        _create_pulp_namespace(namespace.pk, download_logo=download_logo)
+    for pk, avatar_url in iterate_by_pk(qs.values_list("pk", "_avatar_url")):
+        _create_pulp_namespace(pk, download_logo=bool(avatar_url))
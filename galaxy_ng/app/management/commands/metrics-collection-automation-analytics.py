@@ -20,6 +20,11 @@ class Command(BaseCommand):
             '--ship', dest='ship', action='store_true',
             help='Enable to ship metrics to the Red Hat Cloud'
         )
+        parser.add_argument(
+            '--full-snapshot', dest='full-snapshot', action='store_true',
+            help='Export whole tables instead of rows changed since the last gathering '
+                 '(always the case until the last gathering is persisted)'
+        )
 
     def handle(self, *args, **options):
         """Handle command"""
@@ -34,7 +39,8 @@ class Command(BaseCommand):
         collector = Collector(
             collector_module=automation_analytics_data,
             collection_type=Collector.MANUAL_COLLECTION if opt_ship else Collector.DRY_RUN,
-            logger=logger
+            logger=logger,
+            full_snapshot=options.get('full-snapshot', False),
         )
 
         tgzfiles = collector.gather()
@@ -11,6 +11,12 @@ logger = logging.getLogger("metrics_collection.export_lightspeed")
 class Command(BaseCommand):
     """Django management command to export collections data to s3 bucket"""
 
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--full-snapshot', dest='full-snapshot', action='store_true',
+            help='Export whole tables instead of rows changed in the gathered interval'
+        )
+
     def handle(self, *args, **options):
         """Handle command"""
 
@@ -18,6 +24,7 @@ class Command(BaseCommand):
             collector_module=lightspeed_data,
             collection_type=Collector.MANUAL_COLLECTION,
             logger=logger,
+            full_snapshot=options.get('full-snapshot', False),
         )
 
         collector.gather(since=now() - timedelta(days=8), until=now() - timedelta(days=1))
@@ -3,7 +3,9 @@ from gettext import gettext as _
 import django_guid
 from django.core.management.base import BaseCommand
 
-from galaxy_ng.app.api.v1.models import LegacyRole, LegacyRoleTag
+from galaxy_ng.app.api.v1.models import LegacyRole
+from galaxy_ng.app.api.v1.utils import sync_role_tags
+from galaxy_ng.app.utils.db import batched_by_pk
 
 
 # Set logging_uid, this does not seem to get generated when task called via management command
@@ -13,23 +15,39 @@ django_guid.set_guid(django_guid.utils.generate_guid())
 class Command(BaseCommand):
     """
     Django management command for populating role tags ('_ui/v1/tags/roles/') within the system.
-    This command is run nightly on galaxy.ansible.com.
+
+    Role imports and syncs keep the tags up to date, this rebuilds them for
+    the whole catalog in batches of roles.
     """
 
     help = _("Populate the 'LegacyRoleTag' model with tags from LegacyRole 'full_metadata__tags'.")
 
-    def handle(self, *args, **options):
-        created_tags = []
-        roles = LegacyRole.objects.all()
-        for role in roles:
-            for name in role.full_metadata["tags"]:
-                tag, created = LegacyRoleTag.objects.get_or_create(name=name)
-                tag.legacyrole.add(role)
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size", type=int, default=1000, help="Number of roles processed per batch"
+        )
+        parser.add_argument(
+            "--start-after",
+            type=int,
+            default=None,
+            help="Resume after this role id, as reported by an interrupted run",
+        )
 
-                if created:
-                    created_tags.append(tag)
+    def handle(self, *args, **options):
+        created_tags = 0
+        role_count = 0
+        batches = batched_by_pk(
+            LegacyRole.objects.values_list("pk", "full_metadata__tags"),
+            batch_size=options["batch_size"],
+            start_after=options["start_after"],
+        )
+        for last_pk, batch in batches:
+            role_count += len(batch)
+            created_tags += sync_role_tags(dict(batch))
+            if options["verbosity"] > 1:
+                self.stdout.write(f"Processed {role_count} roles, up to role id {last_pk}")
 
         self.stdout.write(
             "Successfully populated {} tags "
-            "from {} roles.".format(len(created_tags), len(roles))
+            "from {} roles.".format(created_tags, role_count)
         )
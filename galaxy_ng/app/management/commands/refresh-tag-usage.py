@@ -0,0 +1,31 @@
+from gettext import gettext as _
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from galaxy_ng.app.models import TagUsage
+from galaxy_ng.app.utils.tags import refresh_collection_tag_usage, refresh_role_tag_usage
+
+
+class Command(BaseCommand):
+    """
+    Django management command for rebuilding the tag counts served by
+    '_ui/v1/tags/collections/' and '_ui/v1/tags/roles/'.
+
+    The counts are kept up to date as content and distributions change, this
+    is only needed to repair them.
+    """
+
+    help = _("Recount the collections and legacy roles using each tag.")
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            refresh_collection_tag_usage()
+            refresh_role_tag_usage()
+
+        self.stdout.write(
+            "Refreshed {} collection tags and {} role tags.".format(
+                TagUsage.objects.filter(kind="collection").count(),
+                TagUsage.objects.filter(kind="role").count(),
+            )
+        )
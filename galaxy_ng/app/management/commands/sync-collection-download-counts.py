@@ -1,11 +1,14 @@
 import datetime
 import logging
-import requests
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
+import requests
 from django.core.management.base import BaseCommand
-from django.db import transaction
+from django.utils import timezone
 from pulp_ansible.app.models import Collection, CollectionDownloadCount
 
+from galaxy_ng.app.utils.db import iterate_by_pk
+
 
 log = logging.getLogger(__name__)
 
@@ -17,8 +20,38 @@ SKIPLIST = [
     'github_qe_test_user',
 ]
 
+# counters checked less than this long ago are not fetched again
+FRESHNESS_WINDOW = datetime.timedelta(days=1)
+
+
+def fetch_download_count(upstream, namespace, name):
+    """Return the upstream download count of namespace.name, or None."""
+    detail_url = (
+        upstream
+        + f'/api/internal/ui/repo-or-collection-detail/?namespace={namespace}&name={name}'
+    )
+    log.debug('\t' + detail_url)
+    try:
+        ds = requests.get(detail_url, timeout=30).json()
+    except (requests.RequestException, ValueError) as e:
+        log.error(f'{namespace}.{name}: {e}')
+        return None
+
+    if 'data' not in ds:
+        log.error(ds)
+        return None
+    if 'collection' not in ds['data']:
+        log.error(ds['data'].keys())
+        return None
+    return ds['data']['collection']['download_count']
+
 
 class Command(BaseCommand):
+    """Mirror the collection download counts of an upstream galaxy.
+
+    Existing counters are loaded once, the counts are fetched concurrently and
+    written back in batches. Counters only ever go up.
+    """
 
     def add_arguments(self, parser):
         parser.add_argument(
@@ -30,71 +63,91 @@ class Command(BaseCommand):
         parser.add_argument(
             '--force', action='store_true', help='sync all counts and ignore last update'
         )
+        parser.add_argument(
+            '--workers', type=int, default=8, help="number of concurrent upstream requests"
+        )
+        parser.add_argument(
+            '--batch-size', type=int, default=500, help="number of counters written at once"
+        )
 
     def handle(self, *args, **options):
         log.info(f"Processing upstream download counts from {options['upstream']}")
         upstream = options['upstream']
-        limit = options['limit']
-
-        now = datetime.datetime.now()  # noqa: DTZ005
 
-        collection_count = 0
-        collection_total = Collection.objects.count()
-        for collection in Collection.objects.all().order_by('pulp_created'):
-
-            namespace = collection.namespace
-            name = collection.name
-            collection_count += 1
-
-            log.info(f'{collection_total}|{collection_count} {namespace}.{name}')
+        now = timezone.now()
+        counters = {
+            (counter.namespace, counter.name): counter
+            for counter in CollectionDownloadCount.objects.only(
+                'namespace', 'name', 'download_count', 'pulp_last_updated'
+            )
+        }
 
-            if limit and collection_count > limit:
+        to_fetch = []
+        for namespace, name in iterate_by_pk(Collection.objects.values_list('namespace', 'name')):
+            if options['limit'] and len(to_fetch) >= options['limit']:
                 break
-
             if namespace in SKIPLIST:
                 continue
 
-            # optimization: don't try to resync something that changed less than a day ago
-            counter = CollectionDownloadCount.objects.filter(namespace=namespace, name=name).first()
-            if counter is not None and not options['force']:
-                delta = (now - counter.pulp_last_updated.replace(tzinfo=None)).total_seconds()
-                if (delta / 60) < (24 * 60 * 60):
-                    continue
-
-            detail_url = (
-                upstream
-                + f'/api/internal/ui/repo-or-collection-detail/?namespace={namespace}&name={name}'
-            )
-            log.info('\t' + detail_url)
-            drr = requests.get(detail_url)
-            ds = drr.json()
-            if 'data' not in ds:
-                log.error(ds)
-                continue
-            if 'collection' not in ds['data']:
-                log.error(ds['data'].keys())
+            # optimization: don't try to resync something checked less than a day ago
+            counter = counters.get((namespace, name))
+            if (
+                counter is not None
+                and not options['force']
+                and now - counter.pulp_last_updated < FRESHNESS_WINDOW
+            ):
                 continue
+            to_fetch.append((namespace, name))
+
+        total = len(to_fetch)
+        log.info(f'Fetching download counts of {total} collections')
+
+        to_create, to_update = [], []
+        created = updated = 0
+        with ThreadPoolExecutor(max_workers=options['workers']) as executor:
+            futures = {
+                executor.submit(fetch_download_count, upstream, namespace, name): (namespace, name)
+                for namespace, name in to_fetch
+            }
+            for done, future in enumerate(as_completed(futures), start=1):
+                namespace, name = futures[future]
+                dcount = future.result()
+                if done % 100 == 0 or done == total:
+                    log.info(f'{total}|{done} {namespace}.{name}')
+                if dcount is None:
+                    continue
 
-            cid = ds['data']['collection']['id']
-            dcount = ds['data']['collection']['download_count']
-            log.info(f'\t{cid} {namespace}.{name} downloads:{dcount}')
-
-            if counter is None:
-                log.info(f'\tcreate downloadcount for {namespace}.{name} with value of {dcount}')
-                with transaction.atomic():
-                    counter = CollectionDownloadCount(
-                        namespace=namespace,
-                        name=name,
-                        download_count=dcount
+                counter = counters.get((namespace, name))
+                if counter is None:
+                    log.info(
+                        f'\tcreate downloadcount for {namespace}.{name} with value of {dcount}'
                     )
-                    counter.save()
-                continue
-
-            if counter.download_count < dcount:
-                log.info(
-                    f'\tupdate downloadcount for {namespace}.{name}'
-                    + f' from {counter.download_count} to {dcount}'
-                )
-                with transaction.atomic():
-                    counter.download_count = dcount
-                    continue
+                    to_create.append(CollectionDownloadCount(
+                        namespace=namespace, name=name, download_count=dcount
+                    ))
+                else:
+                    if counter.download_count < dcount:
+                        log.info(
+                            f'\tupdate downloadcount for {namespace}.{name}'
+                            + f' from {counter.download_count} to {dcount}'
+                        )
+                        counter.download_count = dcount
+                    # bulk_update() does not touch auto_now fields, mark the check ourselves
+                    counter.pulp_last_updated = timezone.now()
+                    to_update.append(counter)
+
+                if len(to_create) + len(to_update) >= options['batch_size']:
+                    created, updated = self._save(to_create, to_update, created, updated)
+
+        created, updated = self._save(to_create, to_update, created, updated)
+        log.info(f'Created {created} and checked {updated} download counters')
+
+    def _save(self, to_create, to_update, created, updated):
+        CollectionDownloadCount.objects.bulk_create(to_create, ignore_conflicts=True)
+        CollectionDownloadCount.objects.bulk_update(
+            to_update, ['download_count', 'pulp_last_updated']
+        )
+        created, updated = created + len(to_create), updated + len(to_update)
+        to_create.clear()
+        to_update.clear()
+        return created, updated
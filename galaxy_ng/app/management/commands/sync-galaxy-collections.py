@@ -1,21 +1,22 @@
 import logging
-import yaml
 import sys
 import time
 
 import django_guid
 from django.contrib.auth import get_user_model
 from django.core.management.base import BaseCommand
+from django.db.models import BooleanField, ExpressionWrapper, Q
 
+from galaxy_ng.app.tasks.collection_sync import sync_and_rebuild_collections
+from galaxy_ng.app.utils.db import filter_by_tuples
 from galaxy_ng.app.utils.galaxy import upstream_collection_iterator
 from galaxy_ng.app.utils.legacy import process_namespace
 
 from pulp_ansible.app.models import CollectionVersion
 from pulp_ansible.app.models import CollectionRemote
 from pulp_ansible.app.models import AnsibleRepository
-from pulp_ansible.app.tasks.collections import sync
-from pulp_ansible.app.tasks.collections import rebuild_repository_collection_versions_metadata
 
+from pulpcore.plugin.models import Task
 from pulpcore.plugin.tasking import dispatch
 from pulpcore.plugin.constants import TASK_FINAL_STATES, TASK_STATES
 
@@ -32,7 +33,11 @@ User = get_user_model()
 
 class Command(BaseCommand):
     """
-    Iterates through every upstream namespace and syncs it.
+    Iterates through every upstream collection and syncs it.
+
+    Collections are handled in batches, each batch is synced from a single
+    requirements file and rebuilt by one task. Tasks are dispatched as the
+    upstream is paginated and waited for at the end.
     """
 
     help = 'Sync upstream namespaces+owners from galaxy.ansible.com'
@@ -45,6 +50,12 @@ class Command(BaseCommand):
         parser.add_argument("--repository", help="name for the repository", default="published")
         parser.add_argument("--rebuild_only", action="store_true", help="only rebuild metadata")
         parser.add_argument("--limit", type=int)
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=50,
+            help="number of collections synced and rebuilt by each task",
+        )
 
     def echo(self, message, style=None):
         style = style or self.style.SUCCESS
@@ -59,6 +70,8 @@ class Command(BaseCommand):
         if not repo:
             raise Exception('could not find repo')
 
+        tasks = []
+        batch = []
         counter = 0
         processed_namespaces = set()
         for namespace_info, collection_info, collection_versions in upstream_collection_iterator(
@@ -77,111 +90,87 @@ class Command(BaseCommand):
                 process_namespace(namespace_info['name'], namespace_info)
                 processed_namespaces.add(namespace_info['name'])
 
-            # pulp_ansible sync isn't smart enough to do this ...
-            should_sync = False
-            should_rebuild = False
-            for cvdata in collection_versions:
-                cv = CollectionVersion.objects.filter(
-                    namespace=collection_info['namespace']['name'],
-                    name=collection_info['name'],
-                    version=cvdata['version']
-                ).first()
-
-                if not cv:
-                    should_sync = True
-                    should_rebuild = True
-                elif not cv.contents or not cv.requires_ansible:
-                    should_rebuild = True
-
-            self.echo(f'sync: {should_sync}')
-            self.echo(f'rebuild: {should_rebuild}')
-
-            if should_sync and not options['rebuild_only']:
-
-                # build a single collection requirements
-                requirements = {
-                    'collections': [
-                        collection_info['namespace']['name'] + '.' + collection_info['name']
-                    ]
-                }
-                requirements_yaml = yaml.dump(requirements)
-
-                # set the remote's requirements
-                remote.requirements_file = requirements_yaml
-                remote.save()
-
-                self.echo(
-                    f"dispatching sync for {collection_info['namespace']['name']}"
-                    + f".{collection_info['name']}"
-                )
-                self.do_sync_dispatch(
-                    remote,
-                    repo,
-                    collection_info['namespace']['name'],
-                    collection_info['name']
-                )
-
-            if should_rebuild:
-                self.echo(
-                    f"dispatching rebuild for {collection_info['namespace']['name']}"
-                    + f".{collection_info['name']}"
-                )
-                self.do_rebuild_dispatch(
-                    repo,
-                    collection_info['namespace']['name'],
-                    collection_info['name']
-                )
-
-    def do_sync_dispatch(self, remote, repository, namespace, name):
-
-        # dispatch the real pulp_ansible sync code
-        task = dispatch(
-            sync,
-            kwargs={
-                'remote_pk': str(remote.pk),
-                'repository_pk': str(repository.pk),
-                'mirror': False,
-                'optimize': False,
-            },
-            exclusive_resources=[repository],
+            batch.append((collection_info, collection_versions))
+            if len(batch) >= options['batch_size']:
+                tasks.extend(self.dispatch_batch(remote, repo, batch, options['rebuild_only']))
+                batch = []
+
+        if batch:
+            tasks.extend(self.dispatch_batch(remote, repo, batch, options['rebuild_only']))
+
+        self.wait_for_tasks(tasks)
+
+    def get_batch_status(self, batch):
+        """Return the (namespace, name) of the batch collections to sync and to rebuild.
+
+        pulp_ansible sync isn't smart enough to do this ... the local versions
+        of the whole batch are looked up with a single query.
+        """
+        upstream_versions = {
+            (collection_info['namespace']['name'], collection_info['name'], cvdata['version'])
+            for collection_info, collection_versions in batch
+            for cvdata in collection_versions
+        }
+        is_stale = ExpressionWrapper(
+            Q(contents=[]) | Q(contents__isnull=True)
+            | Q(requires_ansible__isnull=True) | Q(requires_ansible=''),
+            output_field=BooleanField(),
         )
-
-        while task.state not in TASK_FINAL_STATES:
-            time.sleep(2)
-            self.echo(f"Syncing {namespace}.{name} {task.state}")
-            task.refresh_from_db()
-
-        self.echo(f"Syncing {namespace}.{name} {task.state}")
-
-        if task.state == TASK_STATES.FAILED:
-            self.echo(
-                f"Task failed with error ({namespace}.{name}): {task.error}", self.style.ERROR
-            )
-            sys.exit(1)
-
-    def do_rebuild_dispatch(self, repository, namespace, name):
-
-        repository_version = repository.latest_version()
+        local_versions = {
+            (namespace, name, version): stale
+            for namespace, name, version, stale in filter_by_tuples(
+                CollectionVersion.objects.all(),
+                ('namespace', 'name', 'version'),
+                upstream_versions,
+            ).annotate(is_stale=is_stale).values_list('namespace', 'name', 'version', 'is_stale')
+        }
+
+        to_sync = set()
+        to_rebuild = set()
+        for namespace, name, version in upstream_versions:
+            if (namespace, name, version) not in local_versions:
+                to_sync.add((namespace, name))
+                to_rebuild.add((namespace, name))
+            elif local_versions[(namespace, name, version)]:
+                to_rebuild.add((namespace, name))
+        return sorted(to_sync), sorted(to_rebuild)
+
+    def dispatch_batch(self, remote, repository, batch, rebuild_only=False):
+        """Dispatch one sync and rebuild task for the batch, without waiting for it."""
+        to_sync, to_rebuild = self.get_batch_status(batch)
+        if rebuild_only:
+            to_sync = []
+
+        self.echo(f'sync: {", ".join(f"{ns}.{name}" for ns, name in to_sync) or "-"}')
+        self.echo(f'rebuild: {", ".join(f"{ns}.{name}" for ns, name in to_rebuild) or "-"}')
+        if not to_sync and not to_rebuild:
+            return []
 
         task = dispatch(
-            rebuild_repository_collection_versions_metadata,
+            sync_and_rebuild_collections,
             kwargs={
-                'repository_version_pk': str(repository_version.pk),
-                'namespace': namespace,
-                'name': name
+                'remote_pk': str(remote.pk),
+                'repository_pk': str(repository.pk),
+                'sync_collections': [f"{ns}.{name}" for ns, name in to_sync],
+                'rebuild_collections': to_rebuild,
             },
-            exclusive_resources=[repository],
+            exclusive_resources=[repository, remote],
         )
-
-        while task.state not in TASK_FINAL_STATES:
-            time.sleep(2)
-            self.echo(f"Rebuild {namespace}.{name} {task.state}")
-            task.refresh_from_db()
-
-        self.echo(f"Rebuild {namespace}.{name} {task.state}")
-
-        if task.state == TASK_STATES.FAILED:
-            self.echo(
-                f"Task failed with error ({namespace}.{name}): {task.error}", self.style.ERROR
-            )
+        self.echo(f"dispatched task {task.pk} for {len(batch)} collections")
+        return [task]
+
+    def wait_for_tasks(self, tasks):
+        pending = {task.pk: task for task in tasks}
+        failed = []
+        while pending:
+            for task in Task.objects.filter(pk__in=pending, state__in=TASK_FINAL_STATES):
+                del pending[task.pk]
+                self.echo(f"Task {task.pk} {task.state}")
+                if task.state == TASK_STATES.FAILED:
+                    self.echo(f"Task failed with error ({task.pk}): {task.error}", self.style.ERROR)
+                    failed.append(task)
+            if pending:
+                time.sleep(2)
+
+        if failed:
             sys.exit(1)
@@ -1,8 +1,16 @@
 import logging
 
+from django.conf import settings
 from django.core.management.base import BaseCommand
 from django.db import transaction
-from pulp_ansible.app.models import AnsibleDistribution, AnsibleRepository
+from django.utils import timezone
+from pulp_ansible.app.models import (
+    AnsibleDistribution,
+    AnsibleRepository,
+    CrossRepositoryCollectionVersionIndex,
+)
+from pulpcore.app.util import cache_key
+from pulpcore.cache import Cache
 
 log = logging.getLogger(__name__)
 
@@ -11,6 +19,11 @@ class Command(BaseCommand):
     """This command updates all AnsibleDistribution in the format of #####-synclists
     to point to the published repo.
 
+    The distributions are re-pointed with a single UPDATE, only the ones not
+    already pointing to the published repo are touched so the command can be re-run.
+    The UPDATE skips the AnsibleDistribution hooks, the cross repository index
+    rows and the content cache of the old repos are cleaned up here instead.
+
     Example:
     django-admin update-synclist-distros
     """
@@ -24,9 +37,31 @@ class Command(BaseCommand):
         published_repo = AnsibleRepository.objects.get(name="published")
 
         with transaction.atomic():
-            synclist_distros = AnsibleDistribution.objects.filter(base_path__endswith="-synclist")
-            for distro in synclist_distros:
-                if not distro.repository or distro.repository.pk != published_repo.pk:
-                    distro.repository = published_repo
-                    distro.save()
-                    log.info("distro edited: %s", distro.name)
+            synclist_distros = AnsibleDistribution.objects.filter(
+                base_path__endswith="-synclist"
+            ).exclude(repository=published_repo)
+
+            base_paths = []
+            if settings.CACHE_ENABLED:
+                base_paths = list(synclist_distros.values_list("base_path", flat=True))
+            old_repo_ids = set(
+                synclist_distros.exclude(repository=None).values_list("repository", flat=True)
+            )
+            updated = synclist_distros.update(
+                repository=published_repo, pulp_last_updated=timezone.now()
+            )
+
+            # as update_distribution_index() does for repos no longer distributed
+            CrossRepositoryCollectionVersionIndex.objects.filter(
+                repository__in=old_repo_ids, repository_version=None
+            ).exclude(
+                repository__in=AnsibleDistribution.objects.exclude(
+                    repository=None
+                ).values("repository")
+            ).delete()
+
+        # bulk updates skip the Distribution.invalidate_cache() hook
+        if base_paths:
+            Cache().delete(base_key=cache_key(base_paths))
+
+        log.info("distros edited: %s", updated)
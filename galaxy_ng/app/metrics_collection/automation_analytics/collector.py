@@ -5,6 +5,13 @@ from galaxy_ng.app.metrics_collection.automation_analytics.package import Packag
 
 
 class Collector(BaseCollector):
+    def __init__(self, *args, full_snapshot=False, **kwargs):
+        super().__init__(*args, full_snapshot=full_snapshot, **kwargs)
+        # Without a persisted watermark (AAH-2009) the collector falls back to
+        # the last 4 weeks, older rows would never be sent again.
+        if self._last_gathering() is None:
+            self.full_snapshot = True
+
     @staticmethod
     def _package_class():
         return Package
@@ -1,6 +1,6 @@
 import os
 from django.db import connection
-from insights_analytics_collector import CsvFileSplitter, register
+from insights_analytics_collector import register
 import galaxy_ng.app.metrics_collection.common_data as data
 
 
@@ -14,111 +14,114 @@ def instance_info(since, **kwargs):
     return data.instance_info()
 
 
-@register("collections", "1.0", format="csv", description="Data on ansible_collection")
+@register("collections", "1.1", format="csv", description="Data on ansible_collection")
 def collections(since, full_path, until, **kwargs):
-    query = data.collections_query()
+    query = data.collections_query(since, until)
 
-    return export_to_csv(full_path, "collections", query)
+    return export_to_csv(full_path, "collections", query, since, until)
 
 
 @register(
     "collection_versions",
-    "1.0",
+    "1.1",
     format="csv",
     description="Data on ansible_collectionversion",
 )
 def collection_versions(since, full_path, until, **kwargs):
-    query = data.collection_versions_query()
+    query = data.collection_versions_query(since, until)
 
-    return export_to_csv(full_path, "collection_versions", query)
+    return export_to_csv(full_path, "collection_versions", query, since, until)
 
 
 @register(
     "collection_version_tags",
-    "1.0",
+    "1.1",
     format="csv",
-    description="Full sync: Data on ansible_collectionversion_tags"
+    description="Data on ansible_collectionversion_tags"
 )
-def collection_version_tags(since, full_path, **kwargs):
-    query = data.collection_version_tags_query()
-    return export_to_csv(full_path, "collection_version_tags", query)
+def collection_version_tags(since, full_path, until, **kwargs):
+    query = data.collection_version_tags_query(since, until)
+    return export_to_csv(full_path, "collection_version_tags", query, since, until)
 
 
 @register(
     "collection_tags",
-    "1.0",
+    "1.1",
     format="csv",
     description="Data on ansible_tag"
 )
-def collection_tags(since, full_path, **kwargs):
-    query = data.collection_tags_query()
-    return export_to_csv(full_path, "collection_tags", query)
+def collection_tags(since, full_path, until, **kwargs):
+    query = data.collection_tags_query(since, until)
+    return export_to_csv(full_path, "collection_tags", query, since, until)
 
 
 @register(
     "collection_version_signatures",
-    "1.0",
+    "1.1",
     format="csv",
     description="Data on ansible_collectionversionsignature",
 )
-def collection_version_signatures(since, full_path, **kwargs):
-    query = data.collection_version_signatures_query()
+def collection_version_signatures(since, full_path, until, **kwargs):
+    query = data.collection_version_signatures_query(since, until)
 
-    return export_to_csv(full_path, "collection_version_signatures", query)
+    return export_to_csv(full_path, "collection_version_signatures", query, since, until)
 
 
 @register(
     "signing_services",
-    "1.0",
+    "1.1",
     format="csv",
     description="Data on core_signingservice"
 )
-def signing_services(since, full_path, **kwargs):
-    query = data.signing_services_query()
-    return export_to_csv(full_path, "signing_services", query)
+def signing_services(since, full_path, until, **kwargs):
+    query = data.signing_services_query(since, until)
+    return export_to_csv(full_path, "signing_services", query, since, until)
 
 
 @register(
     "collection_download_logs",
-    "1.0",
+    "1.1",
     format="csv",
     description="Data from ansible_downloadlog"
 )
 def collection_download_logs(since, full_path, until, **kwargs):
-    query = data.collection_downloads_query()
-    return export_to_csv(full_path, "collection_download_logs", query)
+    query = data.collection_downloads_query(since, until)
+    return export_to_csv(full_path, "collection_download_logs", query, since, until)
 
 
 @register(
     "collection_download_counts",
-    "1.0",
+    "1.1",
     format="csv",
     description="Data from ansible_collectiondownloadcount"
 )
 def collection_download_counts(since, full_path, until, **kwargs):
-    query = data.collection_download_counts_query()
-    return export_to_csv(full_path, "collection_download_counts", query)
+    query = data.collection_download_counts_query(since, until)
+    return export_to_csv(full_path, "collection_download_counts", query, since, until)
 
 
 def _get_csv_splitter(file_path, max_data_size=209715200):
-    return CsvFileSplitter(filespec=file_path, max_file_size=max_data_size)
+    return data.BytesCsvFileSplitter(filespec=file_path, max_file_size=max_data_size)
 
 
-def export_to_csv(full_path, file_name, query):
+def export_to_csv(full_path, file_name, query, since=None, until=None):
     copy_query = f"""COPY (
     {query}
     ) TO STDOUT WITH CSV HEADER
     """
-    return _simple_csv(full_path, file_name, copy_query, max_data_size=209715200)
+    return _simple_csv(
+        full_path, file_name, copy_query, max_data_size=209715200,
+        params=data.copy_params(since, until)
+    )
 
 
-def _simple_csv(full_path, file_name, query, max_data_size=209715200):
+def _simple_csv(full_path, file_name, query, max_data_size=209715200, params=None):
     file_path = _get_file_path(full_path, file_name)
     tfile = _get_csv_splitter(file_path, max_data_size)
 
-    with connection.cursor() as cursor, cursor.copy(query) as copy:
-        while data := copy.read():
-            tfile.write(str(data, 'utf8'))
+    with connection.cursor() as cursor, cursor.copy(query, params) as copy:
+        while chunk := copy.read():
+            tfile.write(chunk)
 
     return tfile.file_list()
 
@@ -1,11 +1,35 @@
 from django.db import connection
+from insights_analytics_collector import CollectionCSV as BaseCollectionCSV
 from insights_analytics_collector import Collector as BaseCollector
 
+from galaxy_ng.app.metrics_collection import common_data
+
+
+class CollectionCSV(BaseCollectionCSV):
+    def _gather_since(self):
+        # no lower watermark => the collector exports the full table
+        if self.collector.full_snapshot:
+            return None
+        return super()._gather_since()
+
 
 class Collector(BaseCollector):
+    def __init__(self, *args, full_snapshot=False, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.full_snapshot = full_snapshot
+
+    def gather(self, *args, **kwargs):
+        # the instance status is gathered once per collection run
+        common_data.api_status.cache_clear()
+        return super().gather(*args, **kwargs)
+
     def _is_valid_license(self):
         return True
 
     @staticmethod
     def db_connection():
         return connection
+
+    @staticmethod
+    def _collection_csv_class():
+        return CollectionCSV
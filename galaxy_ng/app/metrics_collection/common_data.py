@@ -1,36 +1,88 @@
-import os
-import requests
+import functools
 import logging
-from urllib.parse import urljoin
 import platform
 import distro
 from django.conf import settings
+from django.http import HttpRequest
+from insights_analytics_collector import CsvFileSplitter
+from pulpcore.app.views.status import StatusView
 from pulpcore.plugin.models import system_id
 
 logger = logging.getLogger("metrics_collection.export_data")
 
 
+class BytesCsvFileSplitter(CsvFileSplitter):
+    """CsvFileSplitter accepting the raw bytes produced by COPY ... TO STDOUT.
+
+    Writing the COPY chunks as-is avoids decoding every chunk to `str`
+    just to have it encoded back to utf-8 by the text file.
+    """
+
+    def cycle_file(self):
+        if self.currentfile:
+            self.currentfile.close()
+        self.counter = 0
+        fname = f"{self.filespec}_split{len(self.files)}"
+        self.currentfile = open(fname, "wb")
+        self.files.append(fname)
+        if self.header:
+            self.counter += self.currentfile.write(self.header + b"\n")
+
+    def write(self, s):
+        # COPY chunks are memoryviews, only the first one is copied to find the header
+        if not self.header:
+            self.header = bytes(s).split(b"\n", 1)[0]
+        self.counter += self.currentfile.write(s)
+        if self.counter >= self.max_file_size:
+            self.cycle_file()
+
+
+def changed_between(column, since=None, until=None):
+    """SQL condition limiting rows to those with `column` in the (since, until] window.
+
+    The bounds are referenced as the `%(since)s` and `%(until)s` query parameters
+    (see `copy_params()`). Without `since` all rows up to `until` are selected,
+    which is how a full snapshot is exported.
+    """
+    conditions = []
+    if since is not None:
+        conditions.append(f"{column} > %(since)s")
+    if until is not None:
+        conditions.append(f"{column} <= %(until)s")
+    return " AND ".join(conditions) or "TRUE"
+
+
+def copy_params(since=None, until=None):
+    """Query parameters for the conditions built by `changed_between()`."""
+    if since is None and until is None:
+        return None
+    return {"since": since, "until": until}
+
+
+@functools.cache
 def api_status():
-    status_path = 'pulp/api/v3/status/'
+    """Status of this instance, as served by `pulp/api/v3/status/`.
+
+    pulpcore's StatusView is called in-process rather than through
+    ANSIBLE_API_HOSTNAME, and its data memoized until the collector resets it
+    at the start of the next collection run.
+    """
     try:
-        path = os.path.join(settings.GALAXY_API_PATH_PREFIX or '', status_path)
-        url = urljoin(settings.ANSIBLE_API_HOSTNAME, path)
-        response = requests.request("GET", url)
-        if response.status_code == 200:
-            return response.json()
-        else:
-            logger.error(f"export metrics_collection: failed API call {status_path}: "
-                         f"HTTP status {response.status_code}")
-            return {}
+        request = HttpRequest()
+        request.method = "GET"
+        response = StatusView.as_view()(request)
+        if response.status_code != 200:
+            raise ValueError(f"status {response.status_code}")
+        return response.data
     except Exception as e:
-        logger.error(f"export metrics_collection: failed API call {status_path}: {e}")
+        logger.error(f"export metrics_collection: failed to gather status: {e}")
         return {}
 
 
 def hub_version():
     status = api_status()
     galaxy_version = ''
-    for version in status['versions']:
+    for version in status.get('versions', []):
         if version['component'] == 'galaxy':
             galaxy_version = version['version']
     return galaxy_version
@@ -69,19 +121,20 @@ def instance_info():
     }
 
 
-def collections_query():
-    return """
+def collections_query(since=None, until=None):
+    return f"""
         SELECT "ansible_collection"."pulp_id" AS uuid,
                "ansible_collection"."pulp_created",
                "ansible_collection"."pulp_last_updated",
                "ansible_collection"."namespace",
                "ansible_collection"."name"
         FROM "ansible_collection"
+        WHERE {changed_between('"ansible_collection"."pulp_last_updated"', since, until)}
     """
 
 
-def collection_versions_query():
-    return """
+def collection_versions_query(since=None, until=None):
+    return f"""
         SELECT "ansible_collectionversion"."content_ptr_id" AS uuid,
                "core_content"."pulp_created",
                "core_content"."pulp_last_updated",
@@ -98,30 +151,36 @@ def collection_versions_query():
         INNER JOIN "core_content" ON (
             "ansible_collectionversion"."content_ptr_id" = "core_content"."pulp_id"
             )
+        WHERE {changed_between('"core_content"."pulp_last_updated"', since, until)}
     """
 
 
-def collection_version_tags_query():
-    return """
-        SELECT id,
-               collectionversion_id AS collection_version_id,
-               tag_id
+def collection_version_tags_query(since=None, until=None):
+    # the through table has no timestamps, tags are set with their collection version
+    return f"""
+        SELECT ansible_collectionversion_tags.id,
+               ansible_collectionversion_tags.collectionversion_id AS collection_version_id,
+               ansible_collectionversion_tags.tag_id
         FROM ansible_collectionversion_tags
+        INNER JOIN core_content
+            ON core_content.pulp_id = ansible_collectionversion_tags.collectionversion_id
+        WHERE {changed_between('core_content.pulp_last_updated', since, until)}
     """
 
 
-def collection_tags_query():
-    return """
+def collection_tags_query(since=None, until=None):
+    return f"""
             SELECT pulp_id AS uuid,
                    pulp_created,
                    pulp_last_updated,
                    name
             FROM ansible_tag
+            WHERE {changed_between('pulp_last_updated', since, until)}
     """
 
 
-def collection_version_signatures_query():
-    return """
+def collection_version_signatures_query(since=None, until=None):
+    return f"""
         SELECT "ansible_collectionversionsignature".content_ptr_id AS uuid,
                "core_content".pulp_created,
                "core_content".pulp_last_updated,
@@ -133,22 +192,24 @@ def collection_version_signatures_query():
         FROM ansible_collectionversionsignature
         INNER JOIN core_content
             ON core_content.pulp_id = "ansible_collectionversionsignature".content_ptr_id
+        WHERE {changed_between('core_content.pulp_last_updated', since, until)}
     """
 
 
-def signing_services_query():
-    return """
+def signing_services_query(since=None, until=None):
+    return f"""
         SELECT pulp_id AS uuid,
                pulp_created,
                pulp_last_updated,
                public_key,
                name
         FROM core_signingservice
+        WHERE {changed_between('pulp_last_updated', since, until)}
     """
 
 
-def collection_downloads_query():
-    return """
+def collection_downloads_query(since=None, until=None):
+    return f"""
         SELECT pulp_id AS uuid,
                pulp_created,
                pulp_last_updated,
@@ -157,11 +218,12 @@ def collection_downloads_query():
                extra_data->>'org_id' AS org_id,
                user_agent
         FROM ansible_downloadlog
+        WHERE {changed_between('pulp_last_updated', since, until)}
     """
 
 
-def collection_download_counts_query():
-    return """
+def collection_download_counts_query(since=None, until=None):
+    return f"""
         SELECT pulp_id AS uuid,
                pulp_created,
                pulp_last_updated,
@@ -169,4 +231,5 @@ def collection_download_counts_query():
                name,
                download_count
         FROM ansible_collectiondownloadcount
+        WHERE {changed_between('pulp_last_updated', since, until)}
     """
@@ -4,9 +4,12 @@ from galaxy_ng.app.metrics_collection.lightspeed.package import Package
 
 
 class Collector(BaseCollector):
-    def __init__(self, collection_type, collector_module, logger):
+    def __init__(self, collection_type, collector_module, logger, full_snapshot=False):
         super().__init__(
-            collection_type=collection_type, collector_module=collector_module, logger=logger
+            collection_type=collection_type,
+            collector_module=collector_module,
+            logger=logger,
+            full_snapshot=full_snapshot,
         )
 
     @staticmethod
@@ -27,17 +30,17 @@ class Collector(BaseCollector):
         return True
 
     def _last_gathering(self):
-        # doing a full scan database dump
+        # no persisted watermarks, the command passes since/until
         return None
 
     def _load_last_gathered_entries(self):
-        # doing a full scan database dump
+        # no persisted watermarks, the command passes since/until
         return {}
 
     def _save_last_gathered_entries(self, last_gathered_entries):
-        # doing a full scan database dump
+        # no persisted watermarks, the command passes since/until
         pass
 
     def _save_last_gather(self):
-        # doing a full scan database dump
+        # no persisted watermarks, the command passes since/until
         pass
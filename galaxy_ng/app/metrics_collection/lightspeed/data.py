@@ -1,7 +1,7 @@
 import os
 from django.db import connection
 
-from insights_analytics_collector import CsvFileSplitter, register
+from insights_analytics_collector import register
 import galaxy_ng.app.metrics_collection.common_data as data
 
 
@@ -29,9 +29,9 @@ def instance_info(since, **kwargs):
     return data.instance_info()
 
 
-@register("ansible_collection_table", "1.0", format="csv", description="Data on ansible_collection")
+@register("ansible_collection_table", "1.1", format="csv", description="Data on ansible_collection")
 def ansible_collection_table(since, full_path, until, **kwargs):
-    source_query = """
+    source_query = f"""
         COPY (
             SELECT "ansible_collection"."pulp_id",
                    "ansible_collection"."pulp_created",
@@ -39,21 +39,22 @@ def ansible_collection_table(since, full_path, until, **kwargs):
                    "ansible_collection"."namespace",
                    "ansible_collection"."name"
             FROM "ansible_collection"
+            WHERE {data.changed_between('"ansible_collection"."pulp_last_updated"', since, until)}
         )
         TO STDOUT WITH CSV HEADER
     """
 
-    return _simple_csv(full_path, "ansible_collection", source_query)
+    return _simple_csv(full_path, "ansible_collection", source_query, since=since, until=until)
 
 
 @register(
     "ansible_collectionversion_table",
-    "1.0",
+    "1.1",
     format="csv",
     description="Data on ansible_collectionversion",
 )
 def ansible_collectionversion_table(since, full_path, until, **kwargs):
-    source_query = """COPY (
+    source_query = f"""COPY (
             SELECT "ansible_collectionversion"."content_ptr_id",
                    "core_content"."pulp_created",
                    "core_content"."pulp_last_updated",
@@ -74,39 +75,53 @@ def ansible_collectionversion_table(since, full_path, until, **kwargs):
                 "ansible_collectionversion"."content_ptr_id" =
                 "ansible_collectionversion_tags"."collectionversion_id"
                 )
+            WHERE {data.changed_between('"core_content"."pulp_last_updated"', since, until)}
         ) TO STDOUT WITH CSV HEADER
     """
-    return _simple_csv(full_path, "ansible_collectionversion", source_query)
+    return _simple_csv(
+        full_path, "ansible_collectionversion", source_query, since=since, until=until
+    )
 
 
 @register(
     "ansible_collectionversionsignature_table",
-    "1.0",
+    "1.1",
     format="csv",
     description="Data on ansible_collectionversionsignature",
 )
 def ansible_collectionversionsignature_table(since, full_path, until, **kwargs):
     # currently no rows in the table, so no objects to base a query off
-    source_query = """COPY (
-            SELECT * FROM ansible_collectionversionsignature
+    source_query = f"""COPY (
+            SELECT ansible_collectionversionsignature.*
+            FROM ansible_collectionversionsignature
+            INNER JOIN core_content
+                ON core_content.pulp_id = ansible_collectionversionsignature.content_ptr_id
+            WHERE {data.changed_between('core_content.pulp_last_updated', since, until)}
         ) TO STDOUT WITH CSV HEADER
     """
-    return _simple_csv(full_path, "ansible_collectionversionsignature", source_query)
+    return _simple_csv(
+        full_path, "ansible_collectionversionsignature", source_query, since=since, until=until
+    )
 
 
 @register(
     "ansible_collectionimport_table",
-    "1.0",
+    "1.1",
     format="csv",
     description="Data on ansible_collectionimport",
 )
 def ansible_collectionimport_table(since, full_path, until, **kwargs):
     # currently no rows in the table, so no objects to base a query off
-    source_query = """COPY (
-            SELECT * FROM ansible_collectionimport
+    source_query = f"""COPY (
+            SELECT ansible_collectionimport.*
+            FROM ansible_collectionimport
+            INNER JOIN core_task ON core_task.pulp_id = ansible_collectionimport.task_id
+            WHERE {data.changed_between('core_task.pulp_last_updated', since, until)}
         ) TO STDOUT WITH CSV HEADER
     """
-    return _simple_csv(full_path, "ansible_collectionimport", source_query)
+    return _simple_csv(
+        full_path, "ansible_collectionimport", source_query, since=since, until=until
+    )
 
 
 # Does not exist
@@ -124,84 +139,104 @@ def ansible_collectionimport_table(since, full_path, until, **kwargs):
 
 @register(
     "container_containerrepository_table",
-    "1.0",
+    "1.1",
     format="csv",
     description="Data on container_containerrepository",
 )
 def container_containerrepository_table(since, full_path, until, **kwargs):
     # currently no rows in the table, so no objects to base a query off
-    source_query = """COPY (
-            SELECT * FROM container_containerrepository
+    source_query = f"""COPY (
+            SELECT container_containerrepository.*
+            FROM container_containerrepository
+            INNER JOIN core_repository
+                ON core_repository.pulp_id = container_containerrepository.repository_ptr_id
+            WHERE {data.changed_between('core_repository.pulp_last_updated', since, until)}
         ) TO STDOUT WITH CSV HEADER
     """
-    return _simple_csv(full_path, "container_containerrepository", source_query)
+    return _simple_csv(
+        full_path, "container_containerrepository", source_query, since=since, until=until
+    )
 
 
 @register(
     "container_containerremote_table",
-    "1.0",
+    "1.1",
     format="csv",
     description="Data on container_containerremote",
 )
 def container_containerremote_table(since, full_path, until, **kwargs):
     # currently no rows in the table, so no objects to base a query off
-    source_query = """COPY (
-            SELECT * FROM container_containerremote
+    source_query = f"""COPY (
+            SELECT container_containerremote.*
+            FROM container_containerremote
+            INNER JOIN core_remote
+                ON core_remote.pulp_id = container_containerremote.remote_ptr_id
+            WHERE {data.changed_between('core_remote.pulp_last_updated', since, until)}
         ) TO STDOUT WITH CSV HEADER
     """
-    return _simple_csv(full_path, "container_containerremote", source_query)
+    return _simple_csv(
+        full_path, "container_containerremote", source_query, since=since, until=until
+    )
 
 
-@register("container_tag_table", "1.0", format="csv", description="Data on container_tag")
+@register("container_tag_table", "1.1", format="csv", description="Data on container_tag")
 def container_tag_table(since, full_path, until, **kwargs):
     # currently no rows in the table, so no objects to base a query off
-    source_query = """COPY (
-            SELECT * FROM container_tag
+    source_query = f"""COPY (
+            SELECT container_tag.*
+            FROM container_tag
+            INNER JOIN core_content ON core_content.pulp_id = container_tag.content_ptr_id
+            WHERE {data.changed_between('core_content.pulp_last_updated', since, until)}
         ) TO STDOUT WITH CSV HEADER
     """
-    return _simple_csv(full_path, "container_tag", source_query)
+    return _simple_csv(full_path, "container_tag", source_query, since=since, until=until)
 
 
 @register(
-    "galaxy_legacynamespace", "1.0", format="csv", description="Data on galaxy_legacynamespace"
+    "galaxy_legacynamespace", "1.1", format="csv", description="Data on galaxy_legacynamespace"
 )
 def galaxy_legacynamespace_table(since, full_path, until, **kwargs):
-    source_query = """COPY (SELECT
+    source_query = f"""COPY (SELECT
             id, created, modified, name, company, avatar_url, description, namespace_id
             FROM galaxy_legacynamespace
+            WHERE {data.changed_between('modified', since, until)}
         ) TO STDOUT WITH CSV HEADER"""
-    return _simple_csv(full_path, "galaxy_legacynamespace", source_query)
+    return _simple_csv(
+        full_path, "galaxy_legacynamespace", source_query, since=since, until=until
+    )
 
 
-@register("galaxy_legacyrole", "1.0", format="csv", description="Data on galaxy_legacyrole")
+@register("galaxy_legacyrole", "1.1", format="csv", description="Data on galaxy_legacyrole")
 def galaxy_legacyrole_table(since, full_path, until, **kwargs):
-    source_query = """COPY (SELECT
+    source_query = f"""COPY (SELECT
             id, created, modified, name, full_metadata, namespace_id
             FROM galaxy_legacyrole
+            WHERE {data.changed_between('modified', since, until)}
         ) TO STDOUT WITH CSV HEADER"""
-    return _simple_csv(full_path, "galaxy_legacyrole", source_query)
+    return _simple_csv(full_path, "galaxy_legacyrole", source_query, since=since, until=until)
 
 
 @register(
-    "galaxy_aiindexdenylist", "1.0", format="csv", description="Data on galaxy_aiindexdenylist"
+    "galaxy_aiindexdenylist", "1.1", format="csv", description="Data on galaxy_aiindexdenylist"
 )
 def galaxy_aiindexdenylist_table(since, full_path, until, **kwargs):
+    # no timestamps on the table, it is small enough to be exported whole
     source_query = """COPY (SELECT * FROM galaxy_aiindexdenylist
         ) TO STDOUT WITH CSV HEADER"""
     return _simple_csv(full_path, "galaxy_aiindexdenylist", source_query)
 
 
 def _get_csv_splitter(file_path, max_data_size=209715200):
-    return CsvFileSplitter(filespec=file_path, max_file_size=max_data_size)
+    return data.BytesCsvFileSplitter(filespec=file_path, max_file_size=max_data_size)
 
 
-def _simple_csv(full_path, file_name, query, max_data_size=209715200):
+def _simple_csv(full_path, file_name, query, max_data_size=209715200, since=None, until=None):
     file_path = _get_file_path(full_path, file_name)
     tfile = _get_csv_splitter(file_path, max_data_size)
 
-    with connection.cursor() as cursor, cursor.copy(query) as copy:
-        while data := copy.read():
-            tfile.write(str(data, 'utf8'))
+    with connection.cursor() as cursor, cursor.copy(query, data.copy_params(since, until)) as copy:
+        while chunk := copy.read():
+            tfile.write(chunk)
 
     return tfile.file_list()
 
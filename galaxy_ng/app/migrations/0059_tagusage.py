@@ -0,0 +1,61 @@
+from django.db import migrations, models
+from django.db.models import Count, Exists, OuterRef
+
+
+def populate_tag_usage(apps, schema_editor):
+    TagUsage = apps.get_model("galaxy", "TagUsage")
+    LegacyRoleTag = apps.get_model("galaxy", "LegacyRoleTag")
+    CollectionVersion = apps.get_model("ansible", "CollectionVersion")
+    CVIndex = apps.get_model("ansible", "CrossRepositoryCollectionVersionIndex")
+
+    collection_counts = (
+        CollectionVersion.objects.filter(
+            Exists(CVIndex.objects.filter(collection_version=OuterRef("pk"), is_highest=True)),
+            tags__isnull=False,
+        )
+        .values_list("tags__name")
+        .annotate(count=Count("pk", distinct=True))
+    )
+    role_counts = LegacyRoleTag.objects.annotate(
+        count=Count("legacyrole")
+    ).values_list("name", "count")
+
+    TagUsage.objects.bulk_create(
+        [TagUsage(kind="collection", name=name, count=count)
+         for name, count in collection_counts]
+        + [TagUsage(kind="role", name=name, count=count) for name, count in role_counts],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("galaxy", "0058_remove_galaxy_team_member_role"),
+        ("ansible", "0055_alter_collectionversion_version_alter_role_version"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="TagUsage",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                    ),
+                ),
+                (
+                    "kind",
+                    models.CharField(
+                        choices=[("collection", "Collection"), ("role", "Role")], max_length=16
+                    ),
+                ),
+                ("name", models.CharField(max_length=64)),
+                ("count", models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                "unique_together": {("kind", "name")},
+            },
+        ),
+        migrations.RunPython(populate_tag_usage, migrations.RunPython.noop, elidable=True),
+    ]
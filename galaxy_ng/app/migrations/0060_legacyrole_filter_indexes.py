@@ -0,0 +1,61 @@
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations, models
+import django.db.models.fields.json
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("galaxy", "0059_tagusage"),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddIndex(
+            model_name="legacynamespace",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["name"], name="galaxy_legacyns_name_trgm", opclasses=["gin_trgm_ops"]
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="legacyrole",
+            index=models.Index(
+                django.db.models.fields.json.KT("full_metadata__github_user"),
+                django.db.models.fields.json.KT("full_metadata__github_repo"),
+                name="galaxy_legacyrole_github_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="legacyrole",
+            index=models.Index(
+                django.db.models.fields.json.KT("full_metadata__github_repo"),
+                name="galaxy_legacyrole_repo_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="legacyrole",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.fields.json.KeyTransform("tags", "full_metadata"),
+                    name="jsonb_path_ops",
+                ),
+                name="galaxy_legacyrole_tags_gin",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="legacyrole",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["name"], name="galaxy_legacyrole_name_trgm", opclasses=["gin_trgm_ops"]
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="legacyrole",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.fields.json.KT("full_metadata__description"),
+                    name="gin_trgm_ops",
+                ),
+                name="galaxy_legacyrole_desc_trgm",
+            ),
+        ),
+    ]
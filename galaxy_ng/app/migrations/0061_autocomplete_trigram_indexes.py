@@ -0,0 +1,63 @@
+import django.contrib.postgres.indexes
+from django.db import migrations
+import django.db.models.functions.text
+
+# ansible_collection belongs to pulp_ansible, its index is managed by hand
+CREATE_COLLECTION_NAME_INDEX = """
+CREATE INDEX IF NOT EXISTS galaxy_collection_uname_trgm
+    ON ansible_collection USING gin (UPPER(name) gin_trgm_ops);
+"""
+
+DROP_COLLECTION_NAME_INDEX = """
+DROP INDEX IF EXISTS galaxy_collection_uname_trgm;
+"""
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("galaxy", "0060_legacyrole_filter_indexes"),
+        ("ansible", "0055_alter_collectionversion_version_alter_role_version"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="namespace",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper("name"), name="gin_trgm_ops"
+                ),
+                name="galaxy_namespace_name_trgm",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="namespace",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper("company"), name="gin_trgm_ops"
+                ),
+                name="galaxy_namespace_company_trgm",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="legacynamespace",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper("name"), name="gin_trgm_ops"
+                ),
+                name="galaxy_legacyns_uname_trgm",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="legacyrole",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper("name"), name="gin_trgm_ops"
+                ),
+                name="galaxy_legacyrole_uname_trgm",
+            ),
+        ),
+        migrations.RunSQL(
+            sql=CREATE_COLLECTION_NAME_INDEX,
+            reverse_sql=DROP_COLLECTION_NAME_INDEX,
+        ),
+    ]
@@ -0,0 +1,14 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("galaxy", "0061_autocomplete_trigram_indexes"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="legacyrole",
+            index=models.Index(fields=["created", "id"], name="galaxy_legacyrole_created_idx"),
+        ),
+    ]
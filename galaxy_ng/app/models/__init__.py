@@ -12,6 +12,7 @@ from .container import (
 from .namespace import Namespace, NamespaceLink
 from .organization import Organization, Team
 from .synclist import SyncList
+from .tags import TagUsage
 
 from pulp_ansible.app.models import (
     AnsibleRepository,
@@ -43,6 +44,8 @@ __all__ = (
     "Setting",
     # synclist
     "SyncList",
+    # tags
+    "TagUsage",
     "Team",
     "User",
 )
@@ -1,8 +1,10 @@
 import hashlib
 import json
 
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.db import models
 from django.db import transaction
+from django.db.models.functions import Upper
 from django_lifecycle import LifecycleModel
 from django.conf import settings
 
@@ -112,6 +114,16 @@ class Namespace(
         permissions = (
             ('upload_to_namespace', 'Can upload collections to namespace'),
         )
+        # icontains compiles to UPPER(col) LIKE UPPER(...), index that expression
+        indexes = (
+            GinIndex(
+                OpClass(Upper("name"), name="gin_trgm_ops"), name="galaxy_namespace_name_trgm"
+            ),
+            GinIndex(
+                OpClass(Upper("company"), name="gin_trgm_ops"),
+                name="galaxy_namespace_company_trgm",
+            ),
+        )
 
 
 class NamespaceLink(LifecycleModel):
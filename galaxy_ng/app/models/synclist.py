@@ -1,11 +1,18 @@
-from django.db import models
-from django_lifecycle import LifecycleModel
+from django.db import models, transaction
+from django_lifecycle import LifecycleModel, hook
 from pulp_ansible.app.models import AnsibleDistribution, AnsibleRepository, Collection
 
 from galaxy_ng.app.access_control.mixins import GroupModelPermissionsMixin
 
 from . import namespace as namespace_models
 
+EXCLUDES_CACHE_KEY = "galaxy_synclist_excludes_{version}_{name}"
+EXCLUDES_CACHE_VERSION = "synclist_excludes_{name}"
+# The invalidation below moves the shared version of the excludes, seen by all
+# the processes, but collection deletes cascade without any signal, the timeout
+# bounds how long their old excludes are served.
+EXCLUDES_CACHE_TIMEOUT = 30
+
 
 class SyncList(
     LifecycleModel, GroupModelPermissionsMixin
@@ -36,3 +43,15 @@ class SyncList(
     )
     collections = models.ManyToManyField(Collection)
     namespaces = models.ManyToManyField(namespace_models.Namespace)
+
+    @hook('after_save')
+    @hook('after_delete')
+    def invalidate_excludes_cache(self):
+        """Drop the cached excludes of this synclist once the transaction commits."""
+        from galaxy_ng.app.utils.cache_versions import bump_cache_versions  # noqa
+
+        names = [
+            EXCLUDES_CACHE_VERSION.format(name=name)
+            for name in {self.name, self.initial_value("name")}
+        ]
+        transaction.on_commit(lambda: bump_cache_versions(names))
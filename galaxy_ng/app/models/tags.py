@@ -0,0 +1,23 @@
+from django.db import models
+
+KINDS = (
+    ("collection", "Collection"),
+    ("role", "Role"),
+)
+
+
+class TagUsage(models.Model):
+    """Number of collections or legacy roles using a tag.
+
+    For collections only the highest version of each collection is counted.
+    The rows are kept up to date by signal handlers when repository versions are
+    created and when role tags change, and can be rebuilt with
+    `django-admin refresh-tag-usage`.
+    """
+
+    kind = models.CharField(choices=KINDS, max_length=16)
+    name = models.CharField(max_length=64)
+    count = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        unique_together = ("kind", "name")
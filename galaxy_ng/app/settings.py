@@ -325,6 +325,15 @@ GALAXY_COLLECTION_SIGNING_SERVICE = None
 # This sets the name of the signing service to be used for signing containers
 GALAXY_CONTAINER_SIGNING_SERVICE = None
 
+# Container config blobs shown on the manifest detail endpoint are cached by digest.
+# Number of config blobs kept in memory by each process
+GALAXY_CONTAINER_CONFIG_BLOB_CACHE_SIZE = 256
+# Config blobs bigger than this (in bytes) are read from storage every time
+GALAXY_CONTAINER_CONFIG_BLOB_CACHE_MAX_BYTES = 1024 * 1024
+# Also keep the config blobs in the django cache. That cache is per process unless
+# CACHES is configured with a shared backend such as redis, only enable it then.
+GALAXY_CONTAINER_CONFIG_BLOB_SHARED_CACHE = False
+
 AUTH_LDAP_SERVER_URI = None
 AUTH_LDAP_BIND_DN = None
 AUTH_LDAP_BIND_PASSWORD = None
@@ -11,8 +11,10 @@ import logging
 from django.dispatch import receiver
 from django.db.models.signals import post_save
 from django.db.models.signals import post_delete
+from django.db.models.signals import pre_delete
 from django.db.models.signals import m2m_changed
-from django.db.models import CharField, Value
+from django.db import transaction
+from django.db.models import CharField, Q, Value
 from django.db.models.functions import Concat
 from django.contrib.auth.models import Group
 from django.conf import settings
@@ -23,10 +25,20 @@ from pulp_ansible.app.models import (
     AnsibleRepository,
     Collection,
     AnsibleNamespaceMetadata,
+    CollectionVersion,
+    Tag,
 )
-from galaxy_ng.app.models import Namespace, User, Team
+from galaxy_ng.app.api.v1.models import LegacyNamespace, LegacyRole, LegacyRoleDownloadCount
+from galaxy_ng.app.models import Namespace, SyncList, User, Team
+from galaxy_ng.app.utils.landing_page import invalidate_landing_page_cache
+from galaxy_ng.app.utils.role_cache import invalidate_role_cache
+from galaxy_ng.app.utils.tags import refresh_collection_tag_usage, refresh_role_tag_usage
 from galaxy_ng.app.migrations._dab_rbac import copy_roles_to_role_definitions
-from pulpcore.plugin.models import ContentRedirectContentGuard
+from pulpcore.plugin.models import (
+    ContentRedirectContentGuard,
+    RepositoryContent,
+    RepositoryVersion,
+)
 
 from ansible_base.rbac.validators import validate_permissions_for_model
 from ansible_base.rbac.models import (
@@ -67,6 +79,94 @@ def ensure_retain_repo_versions_on_repository(sender, instance, created, **kwarg
         instance.save()
 
 
+@receiver(m2m_changed, sender=SyncList.collections.through)
+def invalidate_synclist_excludes_cache(sender, instance, action, reverse, pk_set, **kwargs):
+    """Invalidate the cached excludes of synclists whose collections changed."""
+    if not reverse:
+        if action in ("post_add", "post_remove", "post_clear"):
+            instance.invalidate_excludes_cache()
+        return
+
+    # collection.synclist_set changes, the synclists are unknown after a clear
+    if action == "pre_clear":
+        synclists = SyncList.objects.filter(collections=instance)
+    elif action in ("post_add", "post_remove"):
+        synclists = SyncList.objects.filter(pk__in=pk_set)
+    else:
+        return
+    for synclist in synclists:
+        synclist.invalidate_excludes_cache()
+
+
+@receiver(post_save, sender=RepositoryVersion)
+def refresh_collection_tag_usage_for_version(sender, instance, **kwargs):
+    """Recount the tags of the collections added or removed by an ansible repository
+    version, their highest version may have changed."""
+    if not instance.complete or instance.repository.pulp_type != "ansible.ansible":
+        return
+
+    def _refresh():
+        changed_versions = RepositoryContent.objects.filter(
+            Q(version_added=instance) | Q(version_removed=instance),
+            content__pulp_type="ansible.collection_version",
+        ).values("content_id")
+        changed_collections = CollectionVersion.objects.filter(
+            pk__in=changed_versions
+        ).values("collection_id")
+        names = Tag.objects.filter(
+            ansible_collectionversion__collection_id__in=changed_collections
+        ).values_list("name", flat=True).distinct()
+        refresh_collection_tag_usage(list(names))
+
+    transaction.on_commit(_refresh)
+
+
+@receiver(post_save, sender=AnsibleDistribution)
+@receiver(post_delete, sender=AnsibleDistribution)
+def refresh_collection_tag_usage_for_distribution(sender, **kwargs):
+    """Recount all the collection tags once a distribution is created, re-pointed
+    or deleted, the set of distributed repositories changed."""
+    transaction.on_commit(refresh_collection_tag_usage)
+
+
+@receiver(post_save, sender=RepositoryVersion)
+def invalidate_landing_page_for_version(sender, instance, **kwargs):
+    if instance.complete and instance.repository.pulp_type == "ansible.ansible":
+        invalidate_landing_page_cache()
+
+
+@receiver(post_save, sender=Namespace)
+@receiver(post_delete, sender=Namespace)
+@receiver(post_save, sender=AnsibleDistribution)
+def invalidate_landing_page(sender, **kwargs):
+    invalidate_landing_page_cache()
+
+
+@receiver(pre_delete, sender=LegacyRole)
+def refresh_role_tag_usage_on_delete(sender, instance, **kwargs):
+    names = list(instance.tags.values_list("name", flat=True))
+    if names:
+        transaction.on_commit(lambda: refresh_role_tag_usage(names))
+
+
+@receiver(post_save, sender=LegacyRole)
+@receiver(post_delete, sender=LegacyRole)
+def invalidate_legacy_role_cache(sender, instance, **kwargs):
+    invalidate_role_cache([instance.pk])
+
+
+@receiver(post_save, sender=LegacyRoleDownloadCount)
+def invalidate_legacy_role_cache_for_count(sender, instance, **kwargs):
+    # install hits bump the counter with an UPDATE and invalidate the cache
+    # themselves, the first one and the upstream syncs save it
+    invalidate_role_cache([instance.legacyrole_id])
+
+
+@receiver(post_save, sender=LegacyNamespace)
+def invalidate_legacy_namespace_role_cache(sender, instance, **kwargs):
+    invalidate_role_cache(instance.roles.values_list("pk", flat=True))
+
+
 @receiver(post_save, sender=AnsibleDistribution)
 def ensure_content_guard_exists_on_distribution(sender, instance, created, **kwargs):
     """Ensure distribution have a content guard when created."""
@@ -0,0 +1,45 @@
+import logging
+
+import yaml
+from pulp_ansible.app.models import AnsibleRepository, CollectionRemote
+from pulp_ansible.app.tasks.collections import (
+    rebuild_repository_collection_versions_metadata,
+    sync,
+)
+
+log = logging.getLogger(__name__)
+
+
+def sync_and_rebuild_collections(
+    remote_pk, repository_pk, sync_collections=(), rebuild_collections=()
+):
+    """Sync a batch of collections and rebuild their metadata.
+
+    sync_collections: ["namespace.name", ...] synced with a single requirements file.
+    rebuild_collections: [(namespace, name), ...] rebuilt from the resulting repository
+        version.
+
+    The remote's requirements are set here, while the task holds the remote, so
+    batches can be dispatched back to back.
+    """
+    repository = AnsibleRepository.objects.get(pk=repository_pk)
+
+    if sync_collections:
+        remote = CollectionRemote.objects.get(pk=remote_pk)
+        remote.requirements_file = yaml.dump({"collections": list(sync_collections)})
+        remote.save()
+
+        log.info(f"Syncing {len(sync_collections)} collections")
+        sync(
+            remote_pk=str(remote_pk),
+            repository_pk=str(repository_pk),
+            mirror=False,
+            optimize=False,
+        )
+
+    repository_version = repository.latest_version()
+    for namespace, name in rebuild_collections:
+        log.info(f"Rebuilding {namespace}.{name}")
+        rebuild_repository_collection_versions_metadata(
+            str(repository_version.pk), namespace=namespace, name=name
+        )
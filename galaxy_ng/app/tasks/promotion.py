@@ -82,16 +82,16 @@ def call_auto_approve_task(collection_version, repo, ns_pk):
     return auto_approve_task
 
 
-def call_move_content_task(collection_version, source_repo, dest_repo):
+def call_move_content_task(collection_versions, source_repo, dest_repo):
     """
-    Dispatches the move collection task
+    Dispatches a single move collection task for all the `collection_versions`
     """
 
     return dispatch(
         move_collection,
         exclusive_resources=[source_repo, dest_repo],
         kwargs={
-            'cv_pk_list': [collection_version.pk],
+            'cv_pk_list': [cv.pk for cv in collection_versions],
             'src_repo_pk': source_repo.pk,
             'dest_repo_list': [dest_repo.pk],
         },
@@ -16,6 +16,7 @@ from django.db.utils import OperationalError
 logger = logging.getLogger(__name__)
 _conn = None
 CACHE_KEY = "GALAXY_SETTINGS_DATA"
+VERSION_KEY = "GALAXY_SETTINGS_VERSION"
 
 
 def get_redis_connection():
@@ -117,9 +118,19 @@ def update_setting_cache(data: dict[str, Any]) -> int:
     if data:
         updated = conn.hset(CACHE_KEY, mapping=data)
         conn.expire(CACHE_KEY, settings.get("GALAXY_SETTINGS_EXPIRE", 60 * 60 * 24))
+    conn.incr(VERSION_KEY)
     return updated
 
 
+@connection_error_wrapper(default=lambda: None)
+def get_settings_cache_version() -> Optional[str]:
+    """Returns the version of the settings cache, bumped on every cache update"""
+    if conn is None:
+        return None
+
+    return conn.get(VERSION_KEY) or "0"
+
+
 @connection_error_wrapper(default=dict)
 def get_settings_from_cache() -> dict[str, Any]:
     """Reads settings from Redis cache and returns a python dictionary"""
@@ -1,22 +1,34 @@
 import logging
+from pulpcore.plugin.models import SigningService
 from pulpcore.plugin.tasking import dispatch
-from pulp_ansible.app.tasks.signature import sign
+from pulp_ansible.app.models import (
+    AnsibleRepository,
+    CollectionVersion,
+    CollectionVersionSignature,
+)
+from pulp_ansible.app.tasks.signature import (
+    CollectionSigningFirstStage,
+    SigningDeclarativeVersion,
+    sign,
+)
 
 from .promotion import move_collection
 
 log = logging.getLogger(__name__)
 
 
-def call_sign_and_move_task(signing_service, collection_version, source_repo, dest_repo):
+def call_sign_and_move_task(signing_service, collection_versions, source_repo, dest_repo):
     """Dispatches sign and move task
 
     This is a wrapper to group sign, copy_content and remove_content tasks
     because those 3 must run in sequence ensuring the same locks.
+    All the `collection_versions` are signed and moved by the same task.
     """
+    cv_pk_list = [cv.pk for cv in collection_versions]
     log.info(
-        'Signing with `%s` and moving collection version `%s` from `%s` to `%s`',
+        'Signing with `%s` and moving collection versions `%s` from `%s` to `%s`',
         signing_service.name,
-        collection_version.pk,
+        cv_pk_list,
         source_repo.name,
         dest_repo.name
     )
@@ -26,26 +38,33 @@ def call_sign_and_move_task(signing_service, collection_version, source_repo, de
         exclusive_resources=[source_repo, dest_repo],
         kwargs={
             "signing_service_pk": signing_service.pk,
-            "collection_version_pk": collection_version.pk,
+            "cv_pk_list": cv_pk_list,
             "source_repo_pk": source_repo.pk,
             "dest_repo_pk": dest_repo.pk,
         }
     )
 
 
-def sign_and_move(signing_service_pk, collection_version_pk, source_repo_pk, dest_repo_pk):
-    """Sign collection version and then move to the destination repo"""
+def sign_and_move(
+    signing_service_pk, source_repo_pk, dest_repo_pk, collection_version_pk=None, cv_pk_list=None
+):
+    """Sign collection versions and then move them to the destination repo
+
+    `collection_version_pk` is kept for tasks dispatched before `cv_pk_list` was introduced.
+    """
+    if cv_pk_list is None:
+        cv_pk_list = [collection_version_pk]
 
     # Sign while in the source repository
     sign(
         repository_href=source_repo_pk,
-        content_hrefs=[collection_version_pk],
+        content_hrefs=cv_pk_list,
         signing_service_href=signing_service_pk
     )
 
     # Move content from source to destination
     move_collection(
-        cv_pk_list=[collection_version_pk],
+        cv_pk_list=cv_pk_list,
         src_repo_pk=source_repo_pk,
         dest_repo_list=[dest_repo_pk],
     )
@@ -74,3 +93,62 @@ def call_sign_task(signing_service, repository, content_units):
             "signing_service_href": signing_service.pk,
         }
     )
+
+
+def call_sign_by_filter_task(signing_service, repository, namespace, collection=None, version=None):
+    """Calls task to sign the collection versions of a namespace in a repository.
+    signing_service: Instance of SigningService
+    repository: Instance of AnsibleRepository
+    namespace, collection, version: narrow down the collection versions to sign
+
+    The task receives the filter rather than the list of content units, so the
+    task arguments stay small whatever the number of versions to sign.
+    """
+    log.info(
+        'Signing on-demand with `%s` on repository `%s` namespace `%s` collection `%s` '
+        'version `%s`',
+        signing_service.name,
+        repository.name,
+        namespace,
+        collection,
+        version,
+    )
+
+    return dispatch(
+        sign_by_filter,
+        exclusive_resources=[repository],
+        kwargs={
+            "repository_pk": repository.pk,
+            "signing_service_pk": signing_service.pk,
+            "namespace": namespace,
+            "collection": collection,
+            "version": version,
+        }
+    )
+
+
+def sign_by_filter(repository_pk, signing_service_pk, namespace, collection=None, version=None):
+    """Sign the collection versions of `repository` matching the filter.
+
+    Uses the pulp_ansible signing pipeline: versions already signed with the
+    signing service's key are skipped, the signing subprocesses are bounded by
+    ANSIBLE_SIGNING_TASK_LIMITER and the signatures are saved in batches.
+    """
+    repository = AnsibleRepository.objects.get(pk=repository_pk)
+    signing_service = SigningService.objects.get(pk=signing_service_pk)
+    latest_content = repository.latest_version().content
+
+    filters = {"namespace": namespace}
+    if collection:
+        filters["name"] = collection
+    if version:
+        filters["version"] = version
+    content = CollectionVersion.objects.filter(
+        pk__in=latest_content.filter(pulp_type=CollectionVersion.get_pulp_type()), **filters
+    )
+    current_signatures = CollectionVersionSignature.objects.filter(
+        pk__in=latest_content.filter(pulp_type=CollectionVersionSignature.get_pulp_type())
+    )
+
+    first_stage = CollectionSigningFirstStage(content, signing_service, current_signatures)
+    SigningDeclarativeVersion(first_stage, repository).create()
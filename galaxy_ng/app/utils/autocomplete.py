@@ -0,0 +1,76 @@
+from django.contrib.postgres.search import TrigramSimilarity
+from django.db.models import Case, CharField, F, IntegerField, Value, When
+from pulp_ansible.app.models import Collection
+
+from galaxy_ng.app.api.v1.models import LegacyRole
+from galaxy_ng.app.models import Namespace
+
+SUGGESTION_TYPES = ("namespace", "role", "collection")
+SUGGESTION_FIELDS = ("type", "namespace", "name", "rank", "similarity")
+
+# shorter terms carry no trigram to look up, they only match as a prefix
+MIN_CONTAINS_LENGTH = 3
+
+DEFAULT_LIMIT = 10
+MAX_LIMIT = 50
+
+
+def _suggestions(queryset, suggestion_type, namespace, term):
+    """Annotate `queryset` with the SUGGESTION_FIELDS, in that order, for the union."""
+    if len(term) < MIN_CONTAINS_LENGTH:
+        queryset = queryset.filter(name__istartswith=term)
+    else:
+        queryset = queryset.filter(name__icontains=term)
+
+    # annotation names must not clash with model fields, SUGGESTION_FIELDS are
+    # restored when the rows are turned into dicts
+    return queryset.annotate(
+        suggestion_type=Value(suggestion_type, output_field=CharField()),
+        suggestion_namespace=namespace,
+        suggestion_name=F("name"),
+        rank=Case(
+            When(name__iexact=term, then=Value(2)),
+            When(name__istartswith=term, then=Value(1)),
+            default=Value(0),
+            output_field=IntegerField(),
+        ),
+        similarity=TrigramSimilarity("name", term),
+    ).values_list(
+        "suggestion_type", "suggestion_namespace", "suggestion_name", "rank", "similarity"
+    )
+
+
+def get_suggestions(term, types=SUGGESTION_TYPES, limit=DEFAULT_LIMIT):
+    """Return the top `limit` names matching `term`, best match first.
+
+    Namespaces, role names and collection names are matched case insensitively
+    against their trigram indexes and merged in a single UNION ALL query.
+    Exact matches come first, then prefix matches, then the rest by trigram
+    similarity.
+
+    get_suggestions("dock", types=["role"])
+    [{"type": "role", "namespace": "geerlingguy", "name": "docker", ...}]
+    """
+    term = term.strip()
+    if not term:
+        return []
+
+    querysets = []
+    if "namespace" in types:
+        querysets.append(
+            _suggestions(Namespace.objects.all(), "namespace", F("name"), term)
+        )
+    if "role" in types:
+        querysets.append(
+            _suggestions(LegacyRole.objects.all(), "role", F("namespace__name"), term)
+        )
+    if "collection" in types:
+        querysets.append(
+            _suggestions(Collection.objects.all(), "collection", F("namespace"), term)
+        )
+    if not querysets:
+        return []
+
+    qs = querysets[0].union(*querysets[1:], all=True)
+    qs = qs.order_by("-rank", "-similarity", "suggestion_name")[:limit]
+    return [dict(zip(SUGGESTION_FIELDS, row)) for row in qs]
@@ -0,0 +1,28 @@
+"""
+Version stamps of the cached API responses, shared by all the processes.
+
+The responses themselves are kept in the django cache, per process by
+default, under a key made of their version. The versions are kept in the
+redis of the settings cache, so a change made by any API process or pulp
+worker is seen by all of them. Without redis there is no shared version and
+nothing must be cached.
+"""
+from galaxy_ng.app.tasks import settings_cache
+from galaxy_ng.app.tasks.settings_cache import connection_error_wrapper
+
+VERSION_KEY = "GALAXY_CACHE_VERSION_{name}"
+
+
+@connection_error_wrapper(default=lambda: None)
+def get_cache_version(name):
+    """Return the version of `name`, or None when there is no shared store."""
+    return settings_cache.conn.get(VERSION_KEY.format(name=name)) or "0"
+
+
+@connection_error_wrapper(default=lambda: None)
+def bump_cache_versions(names):
+    """Move the versions of all the `names`, in a single round trip."""
+    pipe = settings_cache.conn.pipeline(transaction=False)
+    for name in names:
+        pipe.incr(VERSION_KEY.format(name=name))
+    pipe.execute()
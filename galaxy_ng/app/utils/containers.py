@@ -0,0 +1,60 @@
+import json
+import threading
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.cache import cache
+
+CONFIG_BLOB_CACHE_KEY = "galaxy_container_config_blob_{digest}"
+
+_config_blobs = OrderedDict()
+_config_blobs_lock = threading.Lock()
+
+
+def _load_config_blob(artifact):
+    with artifact.file.open() as f:
+        return json.load(f)
+
+
+def get_config_blob_data(config_blob):
+    """Load the json document of a container config blob.
+
+    Config blobs are immutable and content addressed, so the loaded documents are
+    kept by digest in a per process LRU cache holding up to
+    GALAXY_CONTAINER_CONFIG_BLOB_CACHE_SIZE entries, and in the django cache too
+    when GALAXY_CONTAINER_CONFIG_BLOB_SHARED_CACHE is enabled.
+    Blobs bigger than GALAXY_CONTAINER_CONFIG_BLOB_CACHE_MAX_BYTES are never cached.
+    """
+    digest = config_blob.digest
+    with _config_blobs_lock:
+        if digest in _config_blobs:
+            _config_blobs.move_to_end(digest)
+            return _config_blobs[digest]
+
+    artifact = config_blob._artifacts.first()
+    if artifact.size > settings.GALAXY_CONTAINER_CONFIG_BLOB_CACHE_MAX_BYTES:
+        return _load_config_blob(artifact)
+
+    shared_cache = settings.GALAXY_CONTAINER_CONFIG_BLOB_SHARED_CACHE
+    cache_key = CONFIG_BLOB_CACHE_KEY.format(digest=digest)
+
+    data = cache.get(cache_key) if shared_cache else None
+    if data is None:
+        data = _load_config_blob(artifact)
+        if shared_cache:
+            cache.set(cache_key, data, timeout=None)
+
+    max_entries = settings.GALAXY_CONTAINER_CONFIG_BLOB_CACHE_SIZE
+    with _config_blobs_lock:
+        _config_blobs[digest] = data
+        _config_blobs.move_to_end(digest)
+        while len(_config_blobs) > max_entries:
+            _config_blobs.popitem(last=False)
+
+    return data
+
+
+def clear_config_blob_cache():
+    """Empty the per process config blob cache."""
+    with _config_blobs_lock:
+        _config_blobs.clear()
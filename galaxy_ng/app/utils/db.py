@@ -0,0 +1,88 @@
+import json
+
+from django.contrib.postgres.fields import ArrayField
+from django.db.models import BooleanField, F, Func, TextField, Value
+
+
+class TupleIn(Func):
+    """`(field1, field2, ...) IN (SELECT * FROM unnest(%s::text[], ...))`
+
+    The values are passed as one text array per field and joined back with
+    `unnest()`, so the query size does not grow with the number of tuples.
+    """
+
+    output_field = BooleanField()
+
+    def __init__(self, fields, values):
+        self.width = len(fields)
+        arrays = [
+            Value([str(value) for value in column], output_field=ArrayField(TextField()))
+            for column in zip(*values)
+        ]
+        super().__init__(*[F(field) for field in fields], *arrays)
+
+    def as_sql(self, compiler, connection, **extra_context):
+        sqls, params = [], []
+        for expression in self.get_source_expressions():
+            sql, expression_params = compiler.compile(expression)
+            sqls.append(sql)
+            params.extend(expression_params)
+        columns = ", ".join(sqls[:self.width])
+        arrays = ", ".join(f"{sql}::text[]" for sql in sqls[self.width:])
+        return f"({columns}) IN (SELECT * FROM unnest({arrays}))", params
+
+
+def filter_by_tuples(queryset, fields, values):
+    """Filter `queryset` to the rows whose `fields` match one of the `values` tuples.
+
+    The filter is a single TupleIn condition whatever the number of tuples.
+    Only text-like columns are supported.
+
+    filter_by_tuples(Collection.objects, ("namespace", "name"), [("foo", "bar")])
+    """
+    values = list(values)
+    if not values:
+        return queryset.none()
+    return queryset.filter(TupleIn(fields, values))
+
+
+def batched_by_pk(queryset, batch_size=1000, start_after=None):
+    """Iterate `queryset` in batches ordered by primary key.
+
+    Each batch is fetched with its own `pk > last_pk LIMIT batch_size` query, so
+    rows are never cached by the queryset and memory stays flat however large
+    the table is. Yields `(last_pk, rows)` tuples, `last_pk` can be stored as a
+    checkpoint and passed as `start_after` to resume an interrupted run.
+
+    for last_pk, roles in batched_by_pk(LegacyRole.objects.only("pk"), 500):
+        ...
+    """
+    base = queryset.order_by("pk")
+    pks = base.values_list("pk", flat=True)
+    last_pk = start_after
+    while True:
+        batch_pks = list((pks if last_pk is None else pks.filter(pk__gt=last_pk))[:batch_size])
+        if not batch_pks:
+            return
+        last_pk = batch_pks[-1]
+        yield last_pk, list(base.filter(pk__in=batch_pks))
+
+
+def iterate_by_pk(queryset, batch_size=1000, start_after=None):
+    """Yield the rows of `queryset` one at a time, fetched with batched_by_pk()."""
+    for _, rows in batched_by_pk(queryset, batch_size=batch_size, start_after=start_after):
+        yield from rows
+
+
+def estimate_count(queryset, exact_below=1000):
+    """Return the planner's row estimate for `queryset`, without running it.
+
+    Counting a large filtered table costs as much as reading it, the estimate
+    comes from a single EXPLAIN. Small results are counted exactly since the
+    estimate is least reliable there and the count is cheap.
+    """
+    plan = json.loads(queryset.order_by().explain(format="json"))
+    estimate = plan[0]["Plan"]["Plan Rows"]
+    if estimate < exact_below:
+        return queryset.count()
+    return estimate
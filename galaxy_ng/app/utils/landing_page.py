@@ -0,0 +1,49 @@
+from random import randrange
+
+from django.core.cache import cache
+from django.db import transaction
+from pulp_ansible.app.models import AnsibleDistribution, CollectionVersion
+
+from galaxy_ng.app import settings
+from galaxy_ng.app.models import Namespace
+
+LANDING_PAGE_CACHE_KEY = "galaxy_landing_page_estate"
+# The estate is dropped as soon as the collections or namespaces change,
+# the timeout also rotates the recommended partner
+LANDING_PAGE_CACHE_TIMEOUT = 60
+
+
+def _pick_partner(partner_count):
+    """Pick a random namespace, skipping to it on the primary key index."""
+    offset = randrange(partner_count)
+    return Namespace.objects.order_by("pk").values("name", "company")[offset:offset + 1].first()
+
+
+def get_landing_page_estate():
+    """Return the collection and partner counts and a recommended partner."""
+    estate = cache.get(LANDING_PAGE_CACHE_KEY)
+    if estate is not None:
+        return estate
+
+    golden_name = settings.GALAXY_API_DEFAULT_DISTRIBUTION_BASE_PATH
+    distro = AnsibleDistribution.objects.select_related("repository").get(
+        base_path=golden_name
+    )
+    repository_version = distro.repository.latest_version()
+    collection_count = CollectionVersion.objects.filter(
+        pk__in=repository_version.content, is_highest=True
+    ).count()
+
+    partner_count = Namespace.objects.count()
+    estate = {
+        "collection_count": collection_count,
+        "partner_count": partner_count,
+        "partner": _pick_partner(partner_count) if partner_count > 0 else None,
+    }
+    cache.set(LANDING_PAGE_CACHE_KEY, estate, LANDING_PAGE_CACHE_TIMEOUT)
+    return estate
+
+
+def invalidate_landing_page_cache():
+    """Drop the cached estate once the transaction commits."""
+    transaction.on_commit(lambda: cache.delete(LANDING_PAGE_CACHE_KEY))
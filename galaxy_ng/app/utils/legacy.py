@@ -1,13 +1,14 @@
 import logging
 import re
 from django.contrib.auth import get_user_model
+from django.db.models import Q
 
 from galaxy_ng.app.api.v1.models import LegacyNamespace
 from galaxy_ng.app.models import Namespace
 from galaxy_ng.app.utils.galaxy import generate_unverified_email
 from galaxy_ng.app.utils.namespaces import generate_v3_namespace_from_attributes
 from galaxy_ng.app.utils.rbac import add_user_to_v3_namespace
-from galaxy_ng.app.utils.rbac import get_v3_namespace_owners
+from galaxy_ng.app.utils.rbac import get_v3_namespace_owner_ids
 
 
 logger = logging.getLogger(__name__)
@@ -101,39 +102,71 @@ def process_namespace(namespace_name, namespace_info, force=False):
         namespace.save()
 
     logger.info(f'iterating upstream owners of {legacy_namespace}')
-    current_owners = get_v3_namespace_owners(namespace)
-    for owner_info in namespace_info['summary_fields']['owners']:
+    sync_namespace_owners([(namespace, namespace_info['summary_fields']['owners'])])
 
-        logger.info(f'check {legacy_namespace} owner {owner_info["username"]}')
-
-        if owner_info.get('github_id'):
-            unverified_email = generate_unverified_email(owner_info['github_id'])
-        else:
-            unverified_email = owner_info['username'] + '@localhost'
-
-        owner_created = False
-        owner = User.objects.filter(username=unverified_email).first()
-        if not owner:
-            owner = User.objects.filter(email=unverified_email).first()
-
-        logger.info(f'found matching owner for {owner_info["username"]} = {owner}')
-
-        # should always have an email set with default of the unverified email
-        if owner and not owner.email:
-            owner.email = unverified_email
-            owner.save()
-
-        if not owner:
-
-            owner, owner_created = User.objects.get_or_create(username=owner_info['username'])
-
-            if owner_created or not owner.email:
-                # the new user should have the unverified email until they actually login
-                owner.email = unverified_email
-                owner.save()
+    return legacy_namespace, namespace
 
-        if owner not in current_owners:
-            logger.info(f'adding {owner} to {namespace}')
-            add_user_to_v3_namespace(owner, namespace)
 
-    return legacy_namespace, namespace
+def _get_unverified_email(owner_info):
+    if owner_info.get('github_id'):
+        return generate_unverified_email(owner_info['github_id'])
+    return owner_info['username'] + '@localhost'
+
+
+def sync_namespace_owners(namespace_owners):
+    """Make the upstream owners of each v3 namespace its owners.
+
+    namespace_owners: [(namespace, [owner_info, ...]), ...] where owner_info is
+    an upstream owner summary ({'username': ..., 'github_id': ...}).
+
+    An owner is the user named after its unverified email, else the user
+    having that email, else the user with the same username, which is created
+    if needed. All the owners are resolved with a single query, whatever the
+    number of namespaces.
+    """
+    owners = {
+        (owner_info['username'], _get_unverified_email(owner_info))
+        for _, owners_info in namespace_owners
+        for owner_info in owners_info
+    }
+    if not owners:
+        return
+
+    usernames = {username for username, _ in owners}
+    emails = {email for _, email in owners}
+    users = User.objects.filter(
+        Q(username__in=usernames | emails) | Q(email__in=emails)
+    ).order_by('pk')
+    users_by_username = {}
+    users_by_email = {}
+    for user in users:
+        users_by_username[user.username] = user
+        users_by_email.setdefault(user.email, user)
+
+    resolved = {}
+    missing_email = {}
+    for username, email in sorted(owners):
+        owner = (
+            users_by_username.get(email)
+            or users_by_email.get(email)
+            or users_by_username.get(username)
+        )
+        if owner is None:
+            # the new user should have the unverified email until they actually login
+            owner = User.objects.create(username=username, email=email)
+            users_by_username[username] = owner
+        elif not owner.email:
+            # should always have an email set with default of the unverified email
+            owner.email = email
+            missing_email[owner.pk] = owner
+        resolved[(username, email)] = owner
+    User.objects.bulk_update(missing_email.values(), ['email'])
+
+    current_owners = get_v3_namespace_owner_ids(namespace for namespace, _ in namespace_owners)
+    for namespace, owners_info in namespace_owners:
+        for owner_info in owners_info:
+            owner = resolved[(owner_info['username'], _get_unverified_email(owner_info))]
+            if owner.pk not in current_owners[namespace.pk]:
+                logger.info(f'adding {owner} to {namespace}')
+                add_user_to_v3_namespace(owner, namespace)
+                current_owners[namespace.pk].add(owner.pk)
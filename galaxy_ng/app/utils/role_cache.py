@@ -0,0 +1,35 @@
+import hashlib
+
+from django.db import transaction
+
+from galaxy_ng.app.utils.cache_versions import bump_cache_versions, get_cache_version
+
+# The v1 role responses are dropped as soon as a role or its download count
+# changes, the timeout only bounds the memory they hold
+ROLE_CACHE_TIMEOUT = 60
+
+_LIST_VERSION = "v1_roles"
+
+
+def _role_version(pk):
+    return f"v1_role_{pk}"
+
+
+def get_role_cache_version(pk=None):
+    """Return the version of role `pk`, or of all the roles.
+
+    None means there is no shared version store and nothing must be cached.
+    """
+    return get_cache_version(_LIST_VERSION if pk is None else _role_version(pk))
+
+
+def get_role_cache_key(version, uri):
+    """Return the cache key of the response served at `uri` for `version`."""
+    digest = hashlib.sha256(uri.encode()).hexdigest()
+    return f"galaxy_v1_roles_{version}_{digest}"
+
+
+def invalidate_role_cache(pks=()):
+    """Drop the cached role lists and the responses of the roles `pks` on commit."""
+    names = [_LIST_VERSION] + [_role_version(pk) for pk in pks]
+    transaction.on_commit(lambda: bump_cache_versions(names))
@@ -0,0 +1,67 @@
+import threading
+import time
+
+from django.conf import settings
+from django.db.models import Count, Max
+
+from galaxy_ng.app.api.utils import get_etag
+
+# Snapshots are rebuilt at least this often, for the state they depend on
+# that is not versioned, like the signing services
+SNAPSHOT_TIMEOUT = 60
+MAX_SNAPSHOTS = 128
+
+_snapshots = {}
+_lock = threading.Lock()
+
+
+def _get_settings_version():
+    """Return a value that changes whenever the dynamic settings change."""
+    if "read_settings_from_cache_or_db" not in (settings.get("DYNACONF_AFTER_GET_HOOKS") or []):
+        return None
+
+    from galaxy_ng.app.models.config import Setting
+    from galaxy_ng.app.tasks.settings_cache import get_settings_cache_version
+
+    version = get_settings_cache_version()
+    if version is None:
+        # no settings cache, fingerprint the settings table instead
+        version = tuple(Setting.objects.aggregate(Count("pk"), Max("pk")).values())
+    return version
+
+
+def _get_host_key(request):
+    """Return the request values the host-derived settings are computed from."""
+    if "alter_hostname_settings" not in (settings.get("DYNACONF_AFTER_GET_HOOKS") or []):
+        return None
+    return (
+        request.headers.get("X-Forwarded-Proto", "http"),
+        request.headers.get("Host", "localhost:5001"),
+    )
+
+
+def get_settings_snapshot(name, request, build):
+    """Return `(etag, data)` of the `name` snapshot, built with `build()`.
+
+    Snapshots are kept in process per settings version and per request host,
+    so `build()` only runs when the settings change, for new hosts, or once
+    the snapshot is SNAPSHOT_TIMEOUT seconds old.
+    """
+    key = (name, _get_settings_version(), _get_host_key(request))
+    now = time.monotonic()
+    snapshot = _snapshots.get(key)
+    if snapshot is not None and snapshot[0] > now:
+        return snapshot[1], snapshot[2]
+
+    data = build()
+    etag = get_etag(data)
+    with _lock:
+        if len(_snapshots) >= MAX_SNAPSHOTS:
+            _snapshots.clear()
+        _snapshots[key] = (now + SNAPSHOT_TIMEOUT, etag, data)
+    return etag, data
+
+
+def clear_settings_snapshots():
+    with _lock:
+        _snapshots.clear()
@@ -0,0 +1,98 @@
+import hashlib
+
+from django.db import transaction
+from django.db.models import Count, Exists, OuterRef, Q
+from pulp_ansible.app.models import (
+    AnsibleDistribution,
+    CollectionVersion,
+    CrossRepositoryCollectionVersionIndex,
+)
+
+from galaxy_ng.app.api.v1.models import LegacyRoleTag
+from galaxy_ng.app.models import TagUsage
+from galaxy_ng.app.utils.cache_versions import bump_cache_versions, get_cache_version
+
+# The tag listings are dropped as soon as the counters of their kind change,
+# the timeout only bounds the memory they hold
+TAG_USAGE_CACHE_TIMEOUT = 60
+
+
+def _cache_version(kind):
+    return f"tag_usage_{kind}"
+
+
+def get_tag_usage_cache_key(kind, uri):
+    """Return the cache key of the `kind` tag listing served at `uri`.
+
+    None means there is no shared version store and nothing must be cached.
+    """
+    version = get_cache_version(_cache_version(kind))
+    if version is None:
+        return None
+    digest = hashlib.sha256(uri.encode()).hexdigest()
+    return f"galaxy_tag_usage_{kind}_{version}_{digest}"
+
+
+def invalidate_tag_usage_cache(kind):
+    """Drop the cached `kind` tag listings."""
+    bump_cache_versions([_cache_version(kind)])
+
+
+def _save_tag_usage(kind, counts, names=None):
+    """Store `counts` ({name: count}) for `kind`.
+
+    Tags in `names` missing from `counts` are set to 0. Without `names`, every
+    other tag of `kind` is set to 0.
+    """
+    if names is not None:
+        counts = {**dict.fromkeys(names, 0), **counts}
+    TagUsage.objects.bulk_create(
+        [TagUsage(kind=kind, name=name, count=count) for name, count in counts.items()],
+        update_conflicts=True,
+        unique_fields=["kind", "name"],
+        update_fields=["count"],
+    )
+    if names is None:
+        TagUsage.objects.filter(kind=kind).exclude(name__in=counts).update(count=0)
+    transaction.on_commit(lambda: invalidate_tag_usage_cache(kind))
+
+
+def refresh_collection_tag_usage(names=None):
+    """Recount the collections using the tags in `names`, or all the tags.
+
+    A collection counts when one of its versions is the highest version in a
+    distributed repository.
+    """
+    distributed = AnsibleDistribution.objects.filter(
+        Q(repository=OuterRef("repository"))
+        | Q(repository_version__repository=OuterRef("repository"))
+    )
+    versions = CollectionVersion.objects.filter(
+        Exists(CrossRepositoryCollectionVersionIndex.objects.filter(
+            Exists(distributed), collection_version=OuterRef("pk"), is_highest=True
+        )),
+        tags__isnull=False,
+    )
+    if names is not None:
+        names = set(names)
+        if not names:
+            return
+        versions = versions.filter(tags__name__in=names)
+
+    counts = dict(
+        versions.values_list("tags__name").annotate(count=Count("pk", distinct=True))
+    )
+    _save_tag_usage("collection", counts, names)
+
+
+def refresh_role_tag_usage(names=None):
+    """Recount the legacy roles using the tags in `names`, or all the tags."""
+    tags = LegacyRoleTag.objects.all()
+    if names is not None:
+        names = set(names)
+        if not names:
+            return
+        tags = tags.filter(name__in=names)
+
+    counts = dict(tags.annotate(count=Count("legacyrole")).values_list("name", "count"))
+    _save_tag_usage("role", counts, names)
@@ -0,0 +1,141 @@
+import contextlib
+import importlib
+import json
+import os
+import time
+import tracemalloc
+from unittest import mock
+
+from django.conf import settings
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import clear_url_caches
+from rest_framework.test import APIClient, APITestCase
+
+from galaxy_ng.app.models.auth import User
+
+from . import data
+
+# Number of objects of each kind created before measuring, the data set is then
+# doubled and every endpoint measured again. Keep it below the page sizes used
+# in the requests so that a per row query shows up as a query count increase.
+SCALE = int(os.environ.get("GALAXY_BENCHMARK_SCALE", 10))
+
+# When set, the measurements are also written to this file as json
+REPORT_PATH = os.environ.get("GALAXY_BENCHMARK_REPORT")
+
+
+# The versioned response caches (v1 roles, tag listings) would turn the
+# measured request into a cache hit, they are bypassed
+UNCACHED = (
+    "galaxy_ng.app.utils.role_cache.get_cache_version",
+    "galaxy_ng.app.utils.tags.get_cache_version",
+)
+
+
+def reload_urlconf(**overrides):
+    """Rebuild the url patterns, which read some settings when imported."""
+    with override_settings(**overrides):
+        for name in ("galaxy_ng.app.api.urls", "galaxy_ng.app.urls", settings.ROOT_URLCONF):
+            importlib.reload(importlib.import_module(name))
+    clear_url_caches()
+
+
+class BenchmarkTestCase(APITestCase):
+    """Measure query counts, time and memory of API requests at two data scales.
+
+    `assertWithinBudget` fails when an endpoint runs more queries than its
+    budget or when its query count grows with the amount of data.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.results = []
+        super().setUpClass()
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.admin = User.objects.create(username="bench_admin", is_superuser=True)
+        cls.repo = data.populate(0, SCALE)
+
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        if not cls.results:
+            return
+
+        print(f"\n{cls.__name__} (scale {SCALE} -> {SCALE * 2})")
+        print(f"{'endpoint':<40} {'queries':>9} {'ms':>9} {'peak KiB':>9}")
+        for result in cls.results:
+            print(
+                f"{result['name']:<40} "
+                f"{result['queries'][0]:>4}/{result['queries'][1]:<4} "
+                f"{result['ms'][1]:>9.1f} {result['peak_kib'][1]:>9.1f}"
+            )
+
+        if REPORT_PATH:
+            with open(REPORT_PATH, "a") as f:
+                for result in cls.results:
+                    f.write(json.dumps(result) + "\n")
+
+    def setUp(self):
+        super().setUp()
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.admin)
+
+    def measure(self, url):
+        with contextlib.ExitStack() as stack:
+            for target in UNCACHED:
+                stack.enter_context(mock.patch(target, return_value=None))
+            return self._measure(url)
+
+    def _measure(self, url):
+        # the first request warms up the per process caches (content types,
+        # access policies, settings) which are not what is being measured
+        self.assertEqual(self.client.get(url).status_code, 200)
+
+        tracemalloc.start()
+        try:
+            with CaptureQueriesContext(connection) as queries:
+                start = time.perf_counter()
+                response = self.client.get(url)
+                elapsed = time.perf_counter() - start
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        self.assertEqual(response.status_code, 200, response.data)
+        return len(queries), elapsed * 1000, peak / 1024
+
+    def assertWithinBudget(self, name, url, max_queries, growth=0):
+        """Measure `url` before and after doubling the data set.
+
+        Fails if it runs more than `max_queries` queries, or if doubling the data
+        adds more than `growth` queries. With `growth=None` only the growth check
+        is skipped, for endpoints known to still run queries per row.
+        """
+        small = self.measure(url)
+        data.populate(SCALE, SCALE)
+        large = self.measure(url)
+
+        self.results.append({
+            "name": name,
+            "url": url,
+            "queries": [small[0], large[0]],
+            "ms": [small[1], large[1]],
+            "peak_kib": [small[2], large[2]],
+        })
+
+        self.assertLessEqual(
+            large[0], max_queries, f"{name}: {large[0]} queries, budget is {max_queries}"
+        )
+        if growth is None:
+            return
+
+        self.assertLessEqual(
+            large[0] - small[0],
+            growth,
+            f"{name}: {small[0]} queries at scale {SCALE}, {large[0]} at {SCALE * 2}",
+        )
@@ -0,0 +1,107 @@
+"""Synthetic data generator for the benchmark suite.
+
+`populate(start, count)` creates `count` objects of every kind, numbered from
+`start`, so calling it again with `start=count` doubles the data set.
+"""
+import uuid
+
+from pulp_ansible.app.models import (
+    AnsibleDistribution,
+    AnsibleRepository,
+    Collection,
+    CollectionVersion,
+)
+from pulp_container.app import models as container_models
+from pulpcore.plugin.util import assign_role
+
+from galaxy_ng.app import models
+from galaxy_ng.app.api.v1.models import LegacyNamespace, LegacyRole
+from galaxy_ng.app.models.auth import Group, User
+
+REPO_NAME = "benchmark"
+VERSIONS_PER_COLLECTION = 2
+
+
+def get_or_create_repo():
+    repo, created = AnsibleRepository.objects.get_or_create(name=REPO_NAME)
+    if created:
+        AnsibleDistribution.objects.create(name=REPO_NAME, base_path=REPO_NAME, repository=repo)
+    return repo
+
+
+def populate(start, count):
+    """Create `count` of each: users, groups, namespaces, collections, legacy roles,
+    synclists and execution environments."""
+    repo = get_or_create_repo()
+    indexes = range(start, start + count)
+
+    users = User.objects.bulk_create(User(username=f"bench_user_{i}") for i in indexes)
+    for i, user in zip(indexes, users):
+        group = Group.objects.create(name=f"bench_group_{i}")
+        group.user_set.add(user)
+
+        namespace = models.Namespace.objects.create(name=f"bench_ns_{i}")
+        assign_role("galaxy.collection_namespace_owner", group, namespace)
+
+        legacy_namespace = LegacyNamespace.objects.create(name=f"bench_legacy_{i}")
+        legacy_namespace.owners.add(user)
+        LegacyRole.objects.create(
+            namespace=legacy_namespace,
+            name=f"role_{i}",
+            full_metadata={
+                "description": f"benchmark role {i}",
+                "tags": ["benchmark", f"tag_{i % 10}"],
+                "versions": [{"name": "1.0.0"}, {"name": "1.1.0"}],
+                "github_user": legacy_namespace.name,
+                "github_repo": f"role_{i}",
+            },
+        )
+
+        container_namespace = models.ContainerNamespace.objects.create(name=f"bench_ee_{i}")
+        assign_role("galaxy.execution_environment_namespace_owner", group, container_namespace)
+        models.ContainerDistribution.objects.create(
+            name=f"bench_ee_{i}/image",
+            base_path=f"bench_ee_{i}/image",
+            namespace=container_namespace,
+            repository=container_models.ContainerRepository.objects.create(
+                name=f"bench_ee_{i}/image"
+            ),
+        )
+
+    collections = [
+        Collection.objects.create(namespace=f"bench_ns_{i}", name=f"col_{i}") for i in indexes
+    ]
+    # the first collection gets versions on every call so its version list grows too
+    first, _ = Collection.objects.get_or_create(namespace="bench_ns_0", name="col_0")
+    versions = [
+        CollectionVersion.objects.create(
+            collection=collection,
+            namespace=collection.namespace,
+            name=collection.name,
+            version=f"{major}.0.0",
+            sha256=uuid.uuid4().hex,
+        )
+        for collection in collections
+        for major in range(1, VERSIONS_PER_COLLECTION + 1)
+    ] + [
+        CollectionVersion.objects.create(
+            collection=first,
+            namespace=first.namespace,
+            name=first.name,
+            version=f"0.{i}.0",
+            sha256=uuid.uuid4().hex,
+        )
+        for i in indexes
+    ]
+    with repo.new_version() as new_version:
+        new_version.add_content(
+            CollectionVersion.objects.filter(pk__in=[cv.pk for cv in versions])
+        )
+
+    for i, collection in zip(indexes, collections):
+        synclist = models.SyncList.objects.create(
+            name=f"bench_{i}-synclist", upstream_repository=repo, policy="exclude"
+        )
+        synclist.collections.add(collection)
+
+    return repo
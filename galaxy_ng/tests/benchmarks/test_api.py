@@ -0,0 +1,116 @@
+from unittest import skipUnless
+
+from django.conf import settings
+from django.test import override_settings
+from django.urls import reverse
+from pulpcore.plugin.util import assign_role
+
+from galaxy_ng.app.constants import DeploymentMode
+from galaxy_ng.app.models.auth import User
+from galaxy_ng.tests.unit.api.base import get_current_ui_url
+
+from . import data
+from .base import BenchmarkTestCase, reload_urlconf
+
+# Query budgets are checked at twice the benchmark scale. Endpoints known to
+# still run queries per row use `growth=None` until they are fixed.
+
+
+@override_settings(GALAXY_DEPLOYMENT_MODE=DeploymentMode.STANDALONE.value)
+class TestCollectionBenchmarks(BenchmarkTestCase):
+
+    def test_v3_collections(self):
+        url = reverse(
+            "galaxy:api:v3:collections-list", kwargs={"distro_base_path": data.REPO_NAME}
+        )
+        self.assertWithinBudget("v3 collections", f"{url}?limit=100", max_queries=30)
+
+    def test_v3_collection_versions(self):
+        url = reverse(
+            "galaxy:api:v3:collection-versions-list",
+            kwargs={"distro_base_path": data.REPO_NAME, "namespace": "bench_ns_0", "name": "col_0"},
+        )
+        self.assertWithinBudget("v3 collection versions", f"{url}?limit=100", max_queries=30)
+
+    def test_v3_namespaces(self):
+        url = reverse("galaxy:api:v3:namespaces-list")
+        self.assertWithinBudget("v3 namespaces", f"{url}?limit=100", max_queries=30)
+
+    def test_ui_namespaces(self):
+        url = get_current_ui_url("namespaces-list")
+        self.assertWithinBudget("ui namespaces", f"{url}?limit=100", max_queries=30)
+
+    def test_ui_search(self):
+        url = get_current_ui_url("search-view")
+        self.assertWithinBudget("ui search", f"{url}?limit=100", max_queries=30)
+
+    def test_ui_repo_collections(self):
+        url = get_current_ui_url(
+            "collections-list", kwargs={"distro_base_path": data.REPO_NAME}
+        )
+        self.assertWithinBudget("ui repo collections", f"{url}?limit=100", max_queries=30)
+
+
+@override_settings(GALAXY_DEPLOYMENT_MODE=DeploymentMode.STANDALONE.value)
+@skipUnless(
+    settings.GALAXY_FEATURE_FLAGS["execution_environments"],
+    "execution environments are disabled",
+)
+class TestExecutionEnvironmentBenchmarks(BenchmarkTestCase):
+
+    def test_ee_repositories(self):
+        url = reverse("galaxy:api:v3:container-repository-list")
+        self.assertWithinBudget("ee repositories", f"{url}?limit=100", max_queries=30)
+
+
+@override_settings(
+    GALAXY_DEPLOYMENT_MODE=DeploymentMode.STANDALONE.value,
+    GALAXY_ENABLE_LEGACY_ROLES=True,
+)
+class TestLegacyBenchmarks(BenchmarkTestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        legacy_roles = settings.GALAXY_ENABLE_LEGACY_ROLES
+        super().setUpClass()
+        # the v1 urls are only routed when legacy roles are enabled at import
+        reload_urlconf()
+        cls.addClassCleanup(reload_urlconf, GALAXY_ENABLE_LEGACY_ROLES=legacy_roles)
+
+    def test_v1_roles(self):
+        url = reverse("galaxy:api:v1:legacy_role-list")
+        self.assertWithinBudget("v1 roles", f"{url}?page_size=100", max_queries=30)
+
+    def test_v1_namespaces(self):
+        url = reverse("galaxy:api:v1:legacy_namespace-list")
+        self.assertWithinBudget("v1 namespaces", f"{url}?page_size=100", max_queries=30)
+
+
+@override_settings(GALAXY_DEPLOYMENT_MODE=DeploymentMode.STANDALONE.value)
+class TestAccessPolicyBenchmarks(BenchmarkTestCase):
+    """Same endpoints as a user with object level roles only, so the access
+    policy conditions and queryset scoping are exercised."""
+
+    def setUp(self):
+        super().setUp()
+        self.client.force_authenticate(user=self.user)
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.user = User.objects.get(username="bench_user_0")
+        assign_role("galaxy.collection_namespace_owner", cls.user)
+
+    def test_v3_namespaces_as_user(self):
+        url = reverse("galaxy:api:v3:namespaces-list")
+        self.assertWithinBudget("v3 namespaces (user)", f"{url}?limit=100", max_queries=30)
+
+    def test_ui_repo_collections_as_user(self):
+        url = get_current_ui_url(
+            "collections-list", kwargs={"distro_base_path": data.REPO_NAME}
+        )
+        self.assertWithinBudget("ui repo collections (user)", f"{url}?limit=100", max_queries=30)
+
+    def test_ui_my_namespaces_as_user(self):
+        url = get_current_ui_url("my-namespaces-list")
+        self.assertWithinBudget("ui my namespaces (user)", f"{url}?limit=100", max_queries=30)
@@ -10,6 +10,7 @@ from galaxy_ng.app.access_control import access_policy
 from galaxy_ng.app.models import auth as auth_models
 from pulpcore.plugin.util import assign_role
 from galaxy_ng.app import constants
+from galaxy_ng.app.utils.snapshots import clear_settings_snapshots
 
 
 API_PREFIX = settings.GALAXY_API_PATH_PREFIX.strip("/")
@@ -59,6 +60,8 @@ def get_current_ui_url(namespace, **kwargs):
 class BaseTestCase(APITestCase):
     def setUp(self):
         self.client = APIClient()
+        # settings are changed in place by the tests
+        clear_settings_snapshots()
 
         self.user = self._create_user('test')
         self.client.force_authenticate(user=self.user)
@@ -0,0 +1,42 @@
+from rest_framework import status
+
+from galaxy_ng.app.api.v1.models import LegacyNamespace, LegacyRole
+from galaxy_ng.app.models import Namespace
+
+from .base import BaseTestCase, get_current_ui_url
+
+
+class TestUiAutocompleteView(BaseTestCase):
+    def setUp(self):
+        super().setUp()
+        self.url = get_current_ui_url('search-autocomplete')
+        Namespace.objects.create(name='dockerhub')
+        legacy_ns = LegacyNamespace.objects.create(name='geerlingguy')
+        LegacyRole.objects.create(namespace=legacy_ns, name='docker', full_metadata={})
+        LegacyRole.objects.create(namespace=legacy_ns, name='moby_docker', full_metadata={})
+
+    def test_ranked_suggestions(self):
+        response = self.client.get(self.url, {'q': 'docker'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        suggestions = [(s['type'], s['name']) for s in response.data['data']]
+        self.assertEqual(
+            suggestions,
+            [('role', 'docker'), ('namespace', 'dockerhub'), ('role', 'moby_docker')]
+        )
+        self.assertEqual(response.data['data'][0]['namespace'], 'geerlingguy')
+
+    def test_type_and_limit(self):
+        response = self.client.get(self.url, {'q': 'DOCK', 'type': 'role', 'limit': 1})
+        self.assertEqual([s['name'] for s in response.data['data']], ['docker'])
+
+    def test_short_terms_match_prefixes(self):
+        response = self.client.get(self.url, {'q': 'mo', 'type': 'role'})
+        self.assertEqual([s['name'] for s in response.data['data']], ['moby_docker'])
+        response = self.client.get(self.url, {'q': 'ck', 'type': 'role'})
+        self.assertEqual(response.data['data'], [])
+
+    def test_invalid_params(self):
+        response = self.client.get(self.url, {'q': 'docker', 'type': 'user'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        response = self.client.get(self.url, {'q': 'docker', 'limit': 500})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
@@ -0,0 +1,113 @@
+import uuid
+from unittest import mock
+
+from django.test import override_settings
+from pulp_ansible.app.models import (
+    AnsibleDistribution,
+    AnsibleRepository,
+    Collection,
+    CollectionVersion,
+)
+from pulpcore.plugin.models import SigningService
+
+from galaxy_ng.app.constants import DeploymentMode
+from galaxy_ng.app.tasks import signing
+
+from .base import BaseTestCase, get_current_ui_url
+
+
+@override_settings(GALAXY_DEPLOYMENT_MODE=DeploymentMode.STANDALONE.value)
+class TestCollectionSignView(BaseTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.user.is_superuser = True
+        self.user.save()
+
+        self.repo = AnsibleRepository.objects.create(name="signing")
+        AnsibleDistribution.objects.create(
+            name="signing", base_path="signing", repository=self.repo
+        )
+        self.signing_service = SigningService.objects.create(
+            name="signer", public_key="key", pubkey_fingerprint="fingerprint", script="/bin/true"
+        )
+        collection = Collection.objects.create(namespace="signing", name="foo")
+        self.collection_version = CollectionVersion.objects.create(
+            namespace="signing",
+            name="foo",
+            collection=collection,
+            version="1.0.0",
+            sha256=uuid.uuid4().hex,
+        )
+        with self.repo.new_version() as new_version:
+            new_version.add_content(
+                CollectionVersion.objects.filter(pk=self.collection_version.pk)
+            )
+
+        patcher = mock.patch.object(signing, "dispatch", return_value=mock.Mock(pk="task"))
+        self.dispatch = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def sign(self, url_name="collection-sign", kwargs=None, **data):
+        url = get_current_ui_url(url_name, kwargs=kwargs)
+        return self.client.post(
+            url, {"signing_service": "signer", **data}, format="json"
+        )
+
+    def test_sign_by_filter(self):
+        response = self.sign(
+            "collection-sign-version",
+            kwargs={
+                "path": "signing", "namespace": "signing", "collection": "foo", "version": "1.0.0"
+            },
+        )
+
+        self.assertEqual(response.status_code, 202)
+        self.assertEqual(response.data, {"task_id": "task"})
+        self.dispatch.assert_called_once_with(
+            signing.sign_by_filter,
+            exclusive_resources=[self.repo],
+            kwargs={
+                "repository_pk": self.repo.pk,
+                "signing_service_pk": self.signing_service.pk,
+                "namespace": "signing",
+                "collection": "foo",
+                "version": "1.0.0",
+            },
+        )
+
+    def test_sign_namespace(self):
+        response = self.sign(
+            "collection-sign-namespace", kwargs={"path": "signing", "namespace": "signing"}
+        )
+
+        self.assertEqual(response.status_code, 202)
+        self.assertEqual(self.dispatch.call_args.kwargs["kwargs"]["namespace"], "signing")
+        self.assertIsNone(self.dispatch.call_args.kwargs["kwargs"]["collection"])
+        self.assertIsNone(self.dispatch.call_args.kwargs["kwargs"]["version"])
+
+    def test_filter_matching_nothing(self):
+        response = self.sign(
+            "collection-sign-version",
+            kwargs={
+                "path": "signing", "namespace": "signing", "collection": "foo", "version": "2.0.0"
+            },
+        )
+
+        self.assertEqual(response.status_code, 400)
+        self.dispatch.assert_not_called()
+
+    def test_sign_content_units(self):
+        content_units = [str(self.collection_version.pk)]
+        response = self.sign(distro_base_path="signing", content_units=content_units)
+
+        self.assertEqual(response.status_code, 202)
+        self.dispatch.assert_called_once_with(
+            signing.sign,
+            exclusive_resources=[self.repo],
+            kwargs={
+                "repository_href": self.repo.pk,
+                "content_hrefs": content_units,
+                "signing_service_href": self.signing_service.pk,
+            },
+        )
@@ -18,3 +18,16 @@ class TestUiFeatureFlagsView(BaseTestCase):
         response = self.client.get(self.settings_url)
         self.assertEqual(response.data['GALAXY_ENABLE_UNAUTHENTICATED_COLLECTION_ACCESS'], True)
         self.assertEqual(response.data['GALAXY_ENABLE_UNAUTHENTICATED_COLLECTION_DOWNLOAD'], False)
+
+    def test_settings_etag(self):
+        self.settings_url = get_current_ui_url('settings')
+        response = self.client.get(self.settings_url)
+        etag = response['ETag']
+        self.assertEqual(response['Cache-Control'], 'no-cache')
+
+        response = self.client.get(self.settings_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+        response = self.client.get(self.settings_url, HTTP_IF_NONE_MATCH='"outdated"')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['ETag'], etag)
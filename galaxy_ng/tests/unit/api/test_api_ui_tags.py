@@ -0,0 +1,112 @@
+import uuid
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import override_settings
+from pulp_ansible.app.models import (
+    AnsibleDistribution,
+    AnsibleRepository,
+    Collection,
+    CollectionVersion,
+    Tag,
+)
+
+from galaxy_ng.app.constants import DeploymentMode
+from galaxy_ng.app.models import TagUsage
+from galaxy_ng.app.utils.tags import invalidate_tag_usage_cache, refresh_collection_tag_usage
+from galaxy_ng.tests.unit.fake_redis import patch_redis
+
+from .base import BaseTestCase, get_current_ui_url
+
+
+def _create_version(repo, collection, version, tags):
+    collection_version = CollectionVersion.objects.create(
+        namespace=collection.namespace,
+        name=collection.name,
+        collection=collection,
+        version=version,
+        sha256=uuid.uuid4().hex,
+    )
+    for name in tags:
+        collection_version.tags.add(Tag.objects.get_or_create(name=name)[0])
+    with repo.new_version() as new_version:
+        new_version.add_content(CollectionVersion.objects.filter(pk=collection_version.pk))
+
+
+def _collection_counts():
+    return dict(TagUsage.objects.filter(kind="collection").values_list("name", "count"))
+
+
+@override_settings(GALAXY_DEPLOYMENT_MODE=DeploymentMode.STANDALONE.value)
+class TestCollectionTagUsage(BaseTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.repo = AnsibleRepository.objects.create(name="tag_usage")
+        self.distribution = AnsibleDistribution.objects.create(
+            name="tag_usage", base_path="tag_usage", repository=self.repo
+        )
+        foo = Collection.objects.create(namespace="tag_usage", name="foo")
+        bar = Collection.objects.create(namespace="tag_usage", name="bar")
+        _create_version(self.repo, foo, "1.0.0", ["old", "shared"])
+        _create_version(self.repo, foo, "2.0.0", ["new", "shared"])
+        _create_version(self.repo, bar, "1.0.0", ["shared"])
+
+    def test_refresh_counts_highest_versions(self):
+        refresh_collection_tag_usage()
+        self.assertEqual(_collection_counts(), {"new": 1, "shared": 2})
+
+    def test_refresh_some_tags(self):
+        refresh_collection_tag_usage()
+        TagUsage.objects.filter(kind="collection").update(count=10)
+
+        refresh_collection_tag_usage(["new", "old"])
+        self.assertEqual(_collection_counts(), {"new": 1, "old": 0, "shared": 10})
+
+    def test_deleted_distribution_is_not_counted(self):
+        refresh_collection_tag_usage()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.distribution.delete()
+        self.assertEqual(_collection_counts(), {"new": 0, "shared": 0})
+
+
+@override_settings(GALAXY_DEPLOYMENT_MODE=DeploymentMode.STANDALONE.value)
+class TestCachedTagListings(BaseTestCase):
+
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        self.addCleanup(cache.clear)
+        patcher = patch_redis()
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.url = get_current_ui_url("collections-tags-list")
+        Tag.objects.create(name="cached")
+        TagUsage.objects.create(kind="collection", name="cached", count=1)
+
+    def count(self, **headers):
+        response = self.client.get(self.url, {"name": "cached"}, **headers)
+        self.assertEqual(response.status_code, 200)
+        return response.data["data"][0]["count"]
+
+    def test_listing_is_cached_until_invalidated(self):
+        self.assertEqual(self.count(), 1)
+
+        TagUsage.objects.filter(name="cached").update(count=2)
+        self.assertEqual(self.count(), 1)
+
+        invalidate_tag_usage_cache("collection")
+        self.assertEqual(self.count(), 2)
+
+    def test_listing_is_cached_per_host(self):
+        self.assertEqual(self.count(HTTP_HOST="one.example.com"), 1)
+
+        TagUsage.objects.filter(name="cached").update(count=2)
+        self.assertEqual(self.count(HTTP_HOST="one.example.com"), 1)
+        self.assertEqual(self.count(HTTP_HOST="two.example.com"), 2)
+
+    def test_no_cache_without_redis(self):
+        with mock.patch("galaxy_ng.app.tasks.settings_cache.conn", None):
+            self.assertEqual(self.count(), 1)
+            TagUsage.objects.filter(name="cached").update(count=2)
+            self.assertEqual(self.count(), 2)
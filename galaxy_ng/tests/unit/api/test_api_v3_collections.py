@@ -1,6 +1,7 @@
 import uuid
 import logging
 
+from unittest import mock
 from unittest.case import skip
 from uuid import uuid4
 
@@ -301,6 +302,74 @@ class TestCollectionViewsets(BaseTestCase):
         #         self.assertNotIn(self.pulp_href_fragment, vresponse.data["collection"]["href"])
         #         self.assertNotIn(self.pulp_href_fragment, vresponse.data["download_url"])
 
+    def _bulk_move_url(self, source_path, dest_path):
+        return reverse(
+            "galaxy:api:v3:collection-version-bulk-move",
+            kwargs={"source_path": source_path, "dest_path": dest_path},
+        )
+
+    def _bulk_move_data(self, *versions):
+        return {
+            "collection_versions": [
+                {
+                    "namespace": self.namespace.name,
+                    "name": self.collection.name,
+                    "version": version,
+                }
+                for version in versions
+            ]
+        }
+
+    def test_collection_versions_bulk_move(self):
+        dest_repo = _create_repo(name="col_dest_repo")
+        self.client.force_authenticate(user=self.admin_user)
+
+        with mock.patch(
+            "galaxy_ng.app.api.v3.viewsets.collection.call_move_content_task",
+        ) as move_task:
+            move_task.return_value.pk = uuid4()
+            response = self.client.post(
+                self._bulk_move_url(self.repo.name, dest_repo.name),
+                self._bulk_move_data("1.1.1", "1.1.2"),
+                format="json",
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        self.assertEqual(response.data["copy_task_id"], move_task.return_value.pk)
+        move_task.assert_called_once()
+        self.assertEqual(
+            {cv.version for cv in move_task.call_args.kwargs["collection_versions"]},
+            {"1.1.1", "1.1.2"},
+        )
+
+    def test_collection_versions_bulk_move_checks_membership(self):
+        dest_repo = _create_repo(name="col_dest_repo")
+        self.client.force_authenticate(user=self.admin_user)
+
+        response = self.client.post(
+            self._bulk_move_url(self.repo.name, dest_repo.name),
+            self._bulk_move_data("1.1.1", "9.9.9"),
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertIn("9.9.9", str(response.data))
+
+        response = self.client.post(
+            self._bulk_move_url(dest_repo.name, self.repo.name),
+            self._bulk_move_data("1.1.1"),
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertIn("not found in source repo", str(response.data))
+
+        response = self.client.post(
+            self._bulk_move_url(self.repo.name, self.repo.name),
+            self._bulk_move_data("1.1.1"),
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertIn("already found in destination repo", str(response.data))
+
     # def test_unpaginated_collection_versions_list(self):
     #     """Assert the call to v3/collections/all returns correct
     #     collections and versions
@@ -0,0 +1,89 @@
+import uuid
+from unittest import mock
+
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from pulp_container.app import models as container_models
+from pulp_container.constants import MEDIA_TYPE
+
+from galaxy_ng.app.api.v3.viewsets import ContainerRepositoryHistoryViewSet
+from galaxy_ng.app.constants import DeploymentMode
+
+from .base import BaseTestCase
+
+
+@override_settings(GALAXY_DEPLOYMENT_MODE=DeploymentMode.STANDALONE.value)
+class TestContainerRepositoryHistory(BaseTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.user.is_superuser = True
+        self.user.save()
+
+        self.repo = container_models.ContainerRepository.objects.create(name="history")
+        container_models.ContainerDistribution.objects.create(
+            name="history", base_path="history", repository=self.repo
+        )
+        self.url = reverse(
+            "galaxy:api:v3:container-repository-history", kwargs={"base_path": "history"}
+        )
+        self.tags = []
+        self.add_versions(2)
+
+    def add_versions(self, count):
+        for _ in range(count):
+            manifest = container_models.Manifest.objects.create(
+                digest=f"sha256:{uuid.uuid4().hex}",
+                schema_version=2,
+                media_type=MEDIA_TYPE.MANIFEST_V2,
+            )
+            tag = container_models.Tag.objects.create(
+                name=f"tag{len(self.tags)}", tagged_manifest=manifest
+            )
+            with self.repo.new_version() as new_version:
+                new_version.add_content(
+                    container_models.Manifest.objects.filter(pk=manifest.pk)
+                )
+                new_version.add_content(container_models.Tag.objects.filter(pk=tag.pk))
+                if self.tags:
+                    # a tag removed as well
+                    new_version.remove_content(
+                        container_models.Tag.objects.filter(pk=self.tags.pop(0).pk)
+                    )
+            self.tags.append(tag)
+
+    def history(self):
+        response = self.client.get(self.url, {"limit": 100})
+        self.assertEqual(response.status_code, 200)
+        return response.data["data"]
+
+    def test_same_output_without_context(self):
+        history = self.history()
+
+        with mock.patch.object(
+            ContainerRepositoryHistoryViewSet, "_get_content_info_context", return_value={}
+        ):
+            self.assertEqual(self.history(), history)
+
+        tag_names = [
+            content["tag_name"]
+            for version in history
+            for content in version["added"] + version["removed"]
+            if content["pulp_type"] == "container.tag"
+        ]
+        self.assertEqual(sorted(tag_names), ["tag0", "tag0", "tag1"])
+        for version in history:
+            for content in version["added"] + version["removed"]:
+                self.assertIsNotNone(content["manifest_digest"])
+
+    def test_bounded_queries_per_page(self):
+        with CaptureQueriesContext(connection) as small_page:
+            self.assertEqual(len(self.history()), 2)
+
+        self.add_versions(8)
+        with CaptureQueriesContext(connection) as large_page:
+            self.assertEqual(len(self.history()), 10)
+
+        self.assertEqual(len(large_page), len(small_page))
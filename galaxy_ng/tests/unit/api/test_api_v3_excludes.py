@@ -0,0 +1,65 @@
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import TestCase
+from pulp_ansible.app.models import Collection
+
+from galaxy_ng.app.api.v3.views.excludes import get_cached_synclist_excludes
+from galaxy_ng.app.models import SyncList
+from galaxy_ng.app.models.synclist import EXCLUDES_CACHE_VERSION
+from galaxy_ng.app.utils.cache_versions import bump_cache_versions
+from galaxy_ng.tests.unit.fake_redis import patch_redis
+
+
+class TestCachedSynclistExcludes(TestCase):
+
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        self.addCleanup(cache.clear)
+        patcher = patch_redis()
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.synclist = SyncList.objects.create(name="excludes", policy="exclude")
+        self.foo = Collection.objects.create(namespace="excludes", name="foo")
+        self.bar = Collection.objects.create(namespace="excludes", name="bar")
+        with self.captureOnCommitCallbacks(execute=True):
+            self.synclist.collections.add(self.foo)
+
+    def excludes(self):
+        return [collection["name"] for collection in get_cached_synclist_excludes("excludes")]
+
+    def test_cached_until_the_synclist_changes(self):
+        self.assertEqual(self.excludes(), ["excludes.foo"])
+
+        # the through table is changed without any signal
+        SyncList.collections.through.objects.create(synclist=self.synclist, collection=self.bar)
+        self.assertEqual(self.excludes(), ["excludes.foo"])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.synclist.collections.remove(self.foo)
+        self.assertEqual(self.excludes(), ["excludes.bar"])
+
+    def test_invalidated_by_other_processes(self):
+        self.assertEqual(self.excludes(), ["excludes.foo"])
+        SyncList.collections.through.objects.create(synclist=self.synclist, collection=self.bar)
+
+        # another process only shares the version stored in redis
+        bump_cache_versions([EXCLUDES_CACHE_VERSION.format(name="excludes")])
+        self.assertEqual(self.excludes(), ["excludes.bar", "excludes.foo"])
+
+    def test_renamed_synclist(self):
+        self.assertEqual(self.excludes(), ["excludes.foo"])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.synclist.name = "renamed"
+            self.synclist.save()
+        self.assertEqual(self.excludes(), [])
+
+    def test_no_cache_without_redis(self):
+        with mock.patch("galaxy_ng.app.tasks.settings_cache.conn", None):
+            self.assertEqual(self.excludes(), ["excludes.foo"])
+            SyncList.collections.through.objects.create(
+                synclist=self.synclist, collection=self.bar
+            )
+            self.assertEqual(self.excludes(), ["excludes.bar", "excludes.foo"])
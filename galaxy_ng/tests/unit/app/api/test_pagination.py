@@ -0,0 +1,133 @@
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+from django.utils import timezone
+from rest_framework.exceptions import NotFound
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from galaxy_ng.app.api.ui.v1.views.search import SearchListView
+from galaxy_ng.app.api.v1.models import LegacyNamespace, LegacyRole
+from galaxy_ng.app.api.v1.viewsets.namespaces import LegacyNamespacesSetPagination
+from galaxy_ng.app.api.v1.viewsets.roles import LegacyRolesSetPagination
+
+
+def paginate(queryset, paginator_class=LegacyNamespacesSetPagination, **params):
+    request = Request(APIRequestFactory().get('/api/v1/namespaces/', params))
+    paginator = paginator_class()
+    page = paginator.paginate_queryset(queryset, request)
+    return page, paginator.get_paginated_response([row.name for row in page]).data
+
+
+def next_cursor(link):
+    return parse_qs(urlparse(link).query)['cursor'][0]
+
+
+def search(**params):
+    view = SearchListView.as_view({'get': 'list'})
+    response = view(APIRequestFactory().get('/api/ui/v1/search/', params))
+    assert response.status_code == 200, response.data
+    return response.data
+
+
+def search_all(page_size, **params):
+    """Walk the search results with the cursor, return the (namespace, name) seen."""
+    seen = []
+    params = {'cursor': '', 'limit': page_size, **params}
+    while True:
+        data = search(**params)
+        seen.extend((row['namespace'], row['name']) for row in data['data'])
+        if data['links']['next'] is None:
+            return seen
+        params['cursor'] = next_cursor(data['links']['next'])
+
+
+@pytest.fixture
+def ranked_roles():
+    """Roles matching the keyword with a different relevance each."""
+    namespace = LegacyNamespace.objects.create(name='keyset_search')
+    for i in range(1, 6):
+        LegacyRole.objects.create(
+            namespace=namespace,
+            name=f'ranked_{i}',
+            full_metadata={'description': ' '.join(['keysetword'] * i + ['filler'] * (6 - i))},
+        )
+    return namespace
+
+
+@pytest.mark.django_db
+def test_keyset_pagination_walks_all_rows():
+    names = [f'keyset_ns_{i}' for i in range(7)]
+    for name in names:
+        LegacyNamespace.objects.create(name=name)
+    queryset = LegacyNamespace.objects.filter(name__startswith='keyset_ns_').order_by('id')
+
+    seen = []
+    params = {'cursor': '', 'page_size': 3}
+    while True:
+        _, data = paginate(queryset, **params)
+        seen.extend(data['results'])
+        assert data['count'] == 7
+        assert data['previous'] is None
+        if data['next'] is None:
+            break
+        params['cursor'] = next_cursor(data['next'])
+
+    assert seen == names
+
+
+@pytest.mark.django_db
+def test_page_number_pagination_is_the_default():
+    LegacyNamespace.objects.create(name='keyset_default')
+    queryset = LegacyNamespace.objects.filter(name='keyset_default').order_by('id')
+    _, data = paginate(queryset)
+    assert data['count'] == 1
+    assert data['results'] == ['keyset_default']
+
+
+@pytest.mark.django_db
+def test_invalid_cursor():
+    with pytest.raises(NotFound):
+        paginate(LegacyNamespace.objects.all(), cursor='not-a-cursor')
+
+
+@pytest.mark.django_db
+def test_keyset_pagination_breaks_ties_on_id():
+    namespace = LegacyNamespace.objects.create(name='keyset_roles')
+    roles = [LegacyRole.objects.create(namespace=namespace, name=f'role_{i}') for i in range(5)]
+    # (created, id) keyset, several rows sharing the same created
+    LegacyRole.objects.filter(pk__in=[role.pk for role in roles]).update(created=timezone.now())
+    queryset = LegacyRole.objects.filter(namespace=namespace).order_by('created')
+
+    seen = []
+    params = {'cursor': '', 'page_size': 2}
+    while True:
+        _, data = paginate(queryset, paginator_class=LegacyRolesSetPagination, **params)
+        seen.extend(data['results'])
+        if data['next'] is None:
+            break
+        params['cursor'] = next_cursor(data['next'])
+
+    assert seen == [role.name for role in roles]
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize('content_type', ['role', ''])
+def test_search_keyset_by_relevance(ranked_roles, content_type):
+    # the empty type pages through the union of collections and roles
+    params = {'keywords': 'keysetword', 'type': content_type, 'order_by': '-relevance'}
+    one_page = search(cursor='', limit=100, **params)
+    expected = [(row['namespace'], row['name']) for row in one_page['data']]
+
+    assert expected == [('keyset_search', f'ranked_{i}') for i in range(5, 0, -1)]
+    assert search_all(2, **params) == expected
+
+
+@pytest.mark.django_db
+def test_search_keyset_default_sorting(ranked_roles):
+    params = {'keywords': 'keysetword'}
+    one_page = search(cursor='', limit=100, **params)
+    expected = [(row['namespace'], row['name']) for row in one_page['data']]
+
+    assert len(expected) == 5
+    assert search_all(2, **params) == expected
@@ -0,0 +1,85 @@
+import pytest
+from pulpcore.plugin.util import assign_role
+
+from galaxy_ng.app.api.v1.filtersets import LegacyNamespaceFilter, LegacyRoleFilter
+from galaxy_ng.app.api.v1.models import LegacyNamespace
+from galaxy_ng.app.api.v1.models import LegacyRole
+from galaxy_ng.app.api.v1.tasks import find_real_role
+from galaxy_ng.app.models import Namespace, User
+
+
+@pytest.fixture
+def roles():
+    ns, _ = LegacyNamespace.objects.get_or_create(name='filterns')
+    other_ns, _ = LegacyNamespace.objects.get_or_create(name='otherns')
+    docker = LegacyRole.objects.create(
+        namespace=ns,
+        name='docker',
+        full_metadata={
+            'github_user': 'filterns',
+            'github_repo': 'ansible-role-docker',
+            'description': 'Installs the docker engine',
+            'tags': ['containers'],
+        },
+    )
+    nginx = LegacyRole.objects.create(
+        namespace=other_ns,
+        name='nginx',
+        full_metadata={
+            'github_user': 'otherns',
+            'github_repo': 'ansible-role-nginx',
+            'description': 'Web server',
+            'tags': ['web'],
+        },
+    )
+    return docker, nginx
+
+
+@pytest.mark.django_db
+def test_keywords_match_substrings(roles):
+    docker, nginx = roles
+    qs = LegacyRole.objects.filter(pk__in=[docker.pk, nginx.pk])
+
+    def search(*keywords):
+        return set(LegacyRoleFilter()._filter_by_keywords(qs, list(keywords)))
+
+    # description is a substring match, not a whole value match
+    assert search('docker engine') == {docker}
+    assert search('otherns') == {nginx}
+    assert search('ngin') == {nginx}
+    assert search('ns', 'web') == {nginx}
+    assert search('nothing') == set()
+
+
+@pytest.mark.django_db
+def test_tags_filter(roles):
+    docker, nginx = roles
+    qs = LegacyRole.objects.filter(pk__in=[docker.pk, nginx.pk])
+    assert set(LegacyRoleFilter().tags_filter(qs, 'tags', 'web')) == {nginx}
+
+
+@pytest.mark.django_db
+def test_find_real_role_by_github_metadata(roles):
+    docker, _ = roles
+    real_role, namespace_name, _, _, clone_url = find_real_role(
+        'filterns', 'ansible-role-docker'
+    )
+    assert real_role == docker
+    assert namespace_name == 'filterns'
+    assert clone_url == 'https://github.com/filterns/ansible-role-docker'
+
+
+@pytest.mark.django_db
+def test_owner_filter_requires_the_owner_role():
+    owned = LegacyNamespace.objects.create(
+        name='ownedns', namespace=Namespace.objects.create(name='ownedns')
+    )
+    published = LegacyNamespace.objects.create(
+        name='publishedns', namespace=Namespace.objects.create(name='publishedns')
+    )
+    user = User.objects.create(username='filterowner')
+    assign_role('galaxy.collection_namespace_owner', user, owned.namespace)
+    assign_role('galaxy.collection_publisher', user, published.namespace)
+
+    qs = LegacyNamespace.objects.filter(pk__in=[owned.pk, published.pk])
+    assert set(LegacyNamespaceFilter().owner_filter(qs, 'owner', 'filterowner')) == {owned}
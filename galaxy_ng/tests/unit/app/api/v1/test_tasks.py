@@ -1,3 +1,8 @@
+import logging
+import os
+import subprocess
+from types import SimpleNamespace
+
 import pytest
 
 from unittest.mock import patch
@@ -7,7 +12,12 @@ from galaxy_ng.app.models import Namespace
 from galaxy_ng.app.api.v1.models import LegacyNamespace
 from galaxy_ng.app.api.v1.models import LegacyRole
 
+from git import Repo
+
+from galaxy_ng.app.api.v1.tasks import _git_raw_date_to_isoformat
+from galaxy_ng.app.api.v1.tasks import compute_all_versions
 from galaxy_ng.app.api.v1.tasks import legacy_role_import
+from galaxy_ng.app.api.v1.tasks import load_legacy_role
 # from galaxy_ng.app.api.v1.tasks import legacy_sync_from_upstream
 
 
@@ -61,6 +71,9 @@ def test_legacy_role_import_simple():
     # should have many versions
     assert len(role.full_metadata['versions']) >= 1
 
+    # the tags should be indexed without running populate-role-tags
+    assert sorted(role.tags.values_list('name', flat=True)) == sorted(role.full_metadata['tags'])
+
 
 @pytest.mark.django_db
 def test_legacy_role_import_altered_github_org_name():
@@ -187,3 +200,58 @@ def test_legacy_role_import_with_tag_name():
     # the tag should be in the versions ...
     vmap = {x['version']: x for x in role.full_metadata['versions']}
     assert github_reference in vmap
+
+
+def test_load_legacy_role_keeps_working_directory(tmp_path):
+    role_path = tmp_path / 'my_role'
+    (role_path / 'meta').mkdir(parents=True)
+    (role_path / 'meta' / 'main.yml').write_text(
+        'galaxy_info:\n  author: foo\n  description: my role\n  galaxy_tags: [web]\n'
+    )
+    (role_path / 'README.md').write_text('# my role')
+
+    cfg = Config()
+    cfg.run_ansible_lint = False
+    cwd = os.getcwd()
+    result = load_legacy_role(str(role_path), 'foo', cfg, logging.getLogger(__name__))
+
+    assert os.getcwd() == cwd
+    assert result['name'] == 'my_role'
+    assert result['metadata']['galaxy_info']['galaxy_tags'] == ['web']
+
+
+def test_git_raw_date_to_isoformat():
+    assert _git_raw_date_to_isoformat('1704164645 +0000') == '2024-01-02T03:04:05+00:00'
+    assert _git_raw_date_to_isoformat('1704164645 -0330') == '2024-01-01T23:34:05-03:30'
+
+
+def test_compute_all_versions(tmp_path):
+    def git(*args):
+        subprocess.run(
+            ['git', '-c', 'user.name=foo', '-c', 'user.email=foo@localhost', *args],
+            cwd=tmp_path, check=True, capture_output=True,
+            # recent git prints UTC iso-strict dates with a Z suffix
+            env={**os.environ, 'GIT_COMMITTER_DATE': '2024-01-02T03:04:05+00:00'},
+        )
+
+    git('init')
+    git('commit', '--allow-empty', '-m', 'first')
+    git('tag', '1.0.0')
+    git('commit', '--allow-empty', '-m', 'second')
+    git('tag', '-a', 'v2.0.0', '-m', 'annotated')
+    git('tag', 'not-a-version')
+    gitrepo = Repo(tmp_path)
+
+    role = SimpleNamespace(full_metadata={'versions': [
+        {'name': '1.0.0', 'version': '1.0.0', 'commit_sha': 'abc'},
+        {'name': '0.1.0', 'version': '0.1.0'},
+    ]})
+    versions = compute_all_versions(role, gitrepo)
+
+    assert [v['tag'] for v in versions] == ['1.0.0', 'v2.0.0']
+    # existing versions are kept as they are
+    assert versions[0]['commit_sha'] == 'abc'
+    # annotated tags point to their commit
+    head = gitrepo.head.commit
+    assert versions[1]['commit_sha'] == head.hexsha
+    assert versions[1]['commit_date'] == head.committed_datetime.isoformat()
@@ -77,6 +77,13 @@ class TestAutomationAnalyticsCollector(TestCase):
         tgzfiles = collector.gather(subset=['example1', 'example2'])
         assert tgzfiles is None
 
+    def test_full_snapshot_without_last_gathering(self):
+        """No watermark is persisted, whole tables are exported"""
+        collector = Collector(
+            collector_module=importlib.import_module(__name__),
+            collection_type=Collector.DRY_RUN)
+        assert collector.full_snapshot is True
+
     def test_wrong_collections(self):
         self.skipTest("FIXME - broken by dab 2024.12.13.")
         collector = Collector(
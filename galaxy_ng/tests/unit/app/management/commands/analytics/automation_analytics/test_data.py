@@ -1,29 +1,92 @@
+import os
+import tempfile
+from datetime import datetime
+
 import galaxy_ng.app.metrics_collection.common_data
-from django.test import TestCase, override_settings
+from django.conf import settings
+from django.test import TestCase
 from unittest.mock import MagicMock, patch
-import unittest
 
 
 class TestAutomationAnalyticsData(TestCase):
 
-    @unittest.skip("FIXME - broken by dab 2024.12.13")
-    @override_settings(ANSIBLE_API_HOSTNAME='https://example.com')
-    @override_settings(GALAXY_API_PATH_PREFIX='/api-test/xxx')
-    @patch('galaxy_ng.app.metrics_collection.common_data.requests.request')
-    def test_api_status_request(self, mock_request):
-        mock_response = MagicMock(name="mock_response")
-        mock_response.status_code = 200
-        mock_request.return_value = mock_response
+    def setUp(self):
+        super().setUp()
+        galaxy_ng.app.metrics_collection.common_data.api_status.cache_clear()
+
+    def tearDown(self):
+        galaxy_ng.app.metrics_collection.common_data.api_status.cache_clear()
+        super().tearDown()
+
+    def test_api_status_in_process(self):
+        status = galaxy_ng.app.metrics_collection.common_data.api_status()
+
+        components = [version['component'] for version in status['versions']]
+        self.assertIn('galaxy', components)
+        self.assertTrue(status['database_connection']['connected'])
+
+    def test_api_status_matches_status_endpoint(self):
+        status = galaxy_ng.app.metrics_collection.common_data.api_status()
+        response = self.client.get(f"{settings.V3_API_ROOT}status/")
+        self.assertEqual(response.status_code, 200)
+        expected = response.json()
+
+        self.assertEqual(status.keys(), expected.keys())
+        for key, value in expected.items():
+            self.assertIsInstance(status[key], type(value), key)
+            if isinstance(value, dict):
+                self.assertEqual(status[key].keys(), value.keys(), key)
+        self.assertEqual(status['versions'], expected['versions'])
+
+    @patch('pulpcore.app.views.status.pulp_plugin_configs')
+    def test_api_status_gathered_once_per_run(self, mock_plugin_configs):
+        app_config = MagicMock(
+            label='galaxy', version='1.2.3', python_package_name='galaxy-ng',
+            domain_compatible=False
+        )
+        app_config.name = 'galaxy_ng.app'
+        mock_plugin_configs.return_value = [app_config]
+        common_data = galaxy_ng.app.metrics_collection.common_data
+
+        self.assertEqual(common_data.hub_version(), '1.2.3')
+        common_data.instance_info()
+        mock_plugin_configs.assert_called_once()
+
+        # next collection run
+        common_data.api_status.cache_clear()
+        common_data.instance_info()
+        self.assertEqual(mock_plugin_configs.call_count, 2)
+
+    def test_changed_between(self):
+        changed_between = galaxy_ng.app.metrics_collection.common_data.changed_between
+        copy_params = galaxy_ng.app.metrics_collection.common_data.copy_params
+        since, until = datetime(2024, 1, 1), datetime(2024, 1, 8)
+
+        self.assertEqual(
+            changed_between("modified", since, until),
+            "modified > %(since)s AND modified <= %(until)s"
+        )
+        # full snapshot
+        self.assertEqual(changed_between("modified", None, until), "modified <= %(until)s")
+        self.assertEqual(changed_between("modified"), "TRUE")
 
-        json_response = MagicMock(name="json")
-        mocked_api_status = MagicMock(name="api_status")
-        json_response.return_value = mocked_api_status
-        mock_response.json = json_response
+        self.assertEqual(copy_params(since, until), {"since": since, "until": until})
+        self.assertIsNone(copy_params())
 
-        response = galaxy_ng.app.metrics_collection.common_data.api_status()
+    def test_bytes_csv_file_splitter(self):
+        splitter_class = galaxy_ng.app.metrics_collection.common_data.BytesCsvFileSplitter
 
-        self.assertEqual(response, mocked_api_status)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            splitter = splitter_class(
+                filespec=os.path.join(tmp_dir, "table.csv"), max_file_size=20
+            )
+            splitter.write(b"id,name\n1,first\n")
+            splitter.write(b"2,second\n")
+            splitter.write(b"3,third\n")
+            files = splitter.file_list()
 
-        mock_request.assert_called_with("GET",
-                                        'https://example.com/api-test/xxx/pulp/api/v3/status/')
-        json_response.assert_called_once()
+            self.assertEqual(len(files), 2)
+            with open(files[0], "rb") as f:
+                self.assertEqual(f.read(), b"id,name\n1,first\n2,second\n")
+            with open(files[1], "rb") as f:
+                self.assertEqual(f.read(), b"id,name\n3,third\n")
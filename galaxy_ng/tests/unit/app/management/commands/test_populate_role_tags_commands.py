@@ -2,6 +2,7 @@ from django.core.management import call_command
 from django.test import TestCase
 
 from galaxy_ng.app.api.v1.models import LegacyNamespace, LegacyRole, LegacyRoleTag
+from galaxy_ng.app.models import TagUsage
 
 
 class TestPopulateRoleTagsCommand(TestCase):
@@ -43,3 +44,31 @@ class TestPopulateRoleTagsCommand(TestCase):
         call_command('populate-role-tags')
         role_tags = LegacyRoleTag.objects.all()
         self.assertEqual(4, role_tags.count())
+
+    def test_populate_drops_removed_tags(self):
+        call_command('populate-role-tags')
+
+        role = LegacyRole.objects.get(name="bar1")
+        role.full_metadata = {"tags": ["database"]}
+        role.save()
+        call_command('populate-role-tags', batch_size=1)
+
+        self.assertEqual(list(role.tags.values_list("name", flat=True)), ["database"])
+        self.assertEqual(
+            sorted(LegacyRole.objects.get(name="bar2").tags.values_list("name", flat=True)),
+            ["database", "network"],
+        )
+
+    def test_populate_updates_tag_usage(self):
+        call_command('populate-role-tags')
+
+        counts = dict(TagUsage.objects.filter(kind="role").values_list("name", "count"))
+        self.assertEqual(counts, {"database": 2, "network": 2, "postgres": 1})
+
+        role = LegacyRole.objects.get(name="bar1")
+        role.full_metadata = {"tags": ["database"]}
+        role.save()
+        call_command('populate-role-tags')
+
+        counts = dict(TagUsage.objects.filter(kind="role").values_list("name", "count"))
+        self.assertEqual(counts, {"database": 2, "network": 1, "postgres": 0})
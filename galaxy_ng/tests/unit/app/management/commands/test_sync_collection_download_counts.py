@@ -0,0 +1,51 @@
+import datetime
+import importlib
+from unittest import mock
+
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+from pulp_ansible.app.models import Collection, CollectionDownloadCount
+
+command = importlib.import_module(
+    "galaxy_ng.app.management.commands.sync-collection-download-counts"
+)
+
+
+class TestSyncCollectionDownloadCounts(TestCase):
+
+    def setUp(self):
+        super().setUp()
+        for name in ("a", "b", "c"):
+            Collection.objects.create(namespace="foo", name=name)
+        CollectionDownloadCount.objects.create(namespace="foo", name="a", download_count=5)
+        CollectionDownloadCount.objects.create(namespace="foo", name="b", download_count=50)
+        # checked long ago, so not fresh
+        CollectionDownloadCount.objects.update(
+            pulp_last_updated=timezone.now() - datetime.timedelta(days=2)
+        )
+
+    def _counts(self):
+        return dict(
+            CollectionDownloadCount.objects.values_list("name", "download_count")
+        )
+
+    def test_sync_download_counts(self):
+        with mock.patch.object(command, "fetch_download_count", return_value=10) as fetch:
+            call_command("sync-collection-download-counts", workers=2)
+        assert fetch.call_count == 3
+        # counters only go up
+        assert self._counts() == {"a": 10, "b": 50, "c": 10}
+
+    def test_fresh_counters_are_skipped(self):
+        with mock.patch.object(command, "fetch_download_count", return_value=10):
+            call_command("sync-collection-download-counts")
+
+        with mock.patch.object(command, "fetch_download_count", return_value=20) as fetch:
+            call_command("sync-collection-download-counts")
+        fetch.assert_not_called()
+
+        with mock.patch.object(command, "fetch_download_count", return_value=20) as fetch:
+            call_command("sync-collection-download-counts", force=True)
+        assert fetch.call_count == 3
+        assert self._counts() == {"a": 20, "b": 50, "c": 20}
@@ -0,0 +1,210 @@
+import importlib
+import uuid
+from unittest import mock
+
+import yaml
+from django.core.management import call_command
+from django.test import TestCase
+from pulp_ansible.app.models import (
+    AnsibleRepository,
+    Collection,
+    CollectionRemote,
+    CollectionVersion,
+)
+from pulpcore.plugin.constants import TASK_STATES
+from pulpcore.plugin.models import Task
+
+from galaxy_ng.app.tasks import collection_sync
+
+command = importlib.import_module("galaxy_ng.app.management.commands.sync-galaxy-collections")
+
+
+def _upstream(*collections):
+    """Upstream iterator items for `collections`, ("namespace.name", [versions])."""
+    items = []
+    for fqn, versions in collections:
+        namespace, name = fqn.split(".")
+        items.append((
+            {"name": namespace},
+            {"namespace": {"name": namespace}, "name": name},
+            [{"version": version} for version in versions],
+        ))
+    return items
+
+
+class TestSyncGalaxyCollections(TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.remote = CollectionRemote.objects.create(
+            name="published", url="https://galaxy.example.com/api/"
+        )
+        self.repo = AnsibleRepository.objects.create(name="published")
+
+        contents = [{"name": "module", "content_type": "module"}]
+        self._create_version("sync.fresh", "1.0.0", contents=contents, requires_ansible=">=2.9")
+        self._create_version("sync.empty", "1.0.0", contents=[], requires_ansible=">=2.9")
+        self._create_version("sync.noansible", "1.0.0", contents=contents)
+        self._create_version(
+            "sync.blankansible", "1.0.0", contents=contents, requires_ansible=""
+        )
+
+        patcher = mock.patch.object(command, "process_namespace")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _create_version(self, fqn, version, **kwargs):
+        namespace, name = fqn.split(".")
+        collection, _ = Collection.objects.get_or_create(namespace=namespace, name=name)
+        CollectionVersion.objects.create(
+            collection=collection,
+            namespace=namespace,
+            name=name,
+            version=version,
+            sha256=uuid.uuid4().hex,
+            **kwargs,
+        )
+
+    def _call(self, upstream, **options):
+        dispatched = []
+
+        def dispatch(func, kwargs, **_):
+            dispatched.append(kwargs)
+            return Task.objects.create(
+                name=func.__name__, state=TASK_STATES.COMPLETED, logging_cid=""
+            )
+
+        with mock.patch.object(command, "upstream_collection_iterator", return_value=upstream), \
+                mock.patch.object(command, "dispatch", side_effect=dispatch):
+            call_command("sync-galaxy-collections", **options)
+        return dispatched
+
+    def test_batch_status(self):
+        batch = [(info, versions) for _, info, versions in _upstream(
+            ("sync.fresh", ["1.0.0"]),
+            ("sync.empty", ["1.0.0"]),
+            ("sync.noansible", ["1.0.0"]),
+            ("sync.blankansible", ["1.0.0"]),
+            ("sync.missing", ["1.0.0"]),
+            # a new upstream version of a collection already there
+            ("sync.fresh2", ["2.0.0"]),
+        )]
+        self._create_version("sync.fresh2", "1.0.0", contents=[{}], requires_ansible=">=2.9")
+
+        to_sync, to_rebuild = command.Command().get_batch_status(batch)
+
+        self.assertEqual(to_sync, [("sync", "fresh2"), ("sync", "missing")])
+        self.assertEqual(to_rebuild, [
+            ("sync", "blankansible"),
+            ("sync", "empty"),
+            ("sync", "fresh2"),
+            ("sync", "missing"),
+            ("sync", "noansible"),
+        ])
+
+    def test_one_task_per_batch(self):
+        dispatched = self._call(
+            _upstream(
+                ("sync.missing1", ["1.0.0"]),
+                ("sync.missing2", ["1.0.0"]),
+                ("sync.fresh", ["1.0.0"]),
+                ("sync.empty", ["1.0.0"]),
+                ("sync.missing3", ["1.0.0"]),
+            ),
+            batch_size=2,
+        )
+
+        self.assertEqual(
+            [kwargs["sync_collections"] for kwargs in dispatched],
+            [["sync.missing1", "sync.missing2"], [], ["sync.missing3"]],
+        )
+        self.assertEqual(
+            [kwargs["rebuild_collections"] for kwargs in dispatched],
+            [
+                [("sync", "missing1"), ("sync", "missing2")],
+                [("sync", "empty")],
+                [("sync", "missing3")],
+            ],
+        )
+        for kwargs in dispatched:
+            self.assertEqual(kwargs["remote_pk"], str(self.remote.pk))
+            self.assertEqual(kwargs["repository_pk"], str(self.repo.pk))
+
+    def test_up_to_date_batches_dispatch_nothing(self):
+        dispatched = self._call(_upstream(("sync.fresh", ["1.0.0"])), batch_size=1)
+        self.assertEqual(dispatched, [])
+
+    def test_rebuild_only(self):
+        dispatched = self._call(
+            _upstream(("sync.missing", ["1.0.0"]), ("sync.empty", ["1.0.0"])),
+            rebuild_only=True,
+        )
+
+        self.assertEqual(len(dispatched), 1)
+        self.assertEqual(dispatched[0]["sync_collections"], [])
+        self.assertEqual(
+            dispatched[0]["rebuild_collections"], [("sync", "empty"), ("sync", "missing")]
+        )
+
+    def test_exit_code_when_a_task_fails(self):
+        states = iter([TASK_STATES.COMPLETED, TASK_STATES.FAILED])
+
+        def dispatch(func, kwargs, **_):
+            return Task.objects.create(name=func.__name__, state=next(states), logging_cid="")
+
+        upstream = _upstream(("sync.missing1", ["1.0.0"]), ("sync.missing2", ["1.0.0"]))
+        with mock.patch.object(command, "upstream_collection_iterator", return_value=upstream), \
+                mock.patch.object(command, "dispatch", side_effect=dispatch), \
+                self.assertRaises(SystemExit) as exit_:
+            call_command("sync-galaxy-collections", batch_size=1)
+        self.assertEqual(exit_.exception.code, 1)
+
+    def test_no_failed_task_exits_normally(self):
+        self._call(_upstream(("sync.missing", ["1.0.0"])))
+
+
+class TestSyncAndRebuildCollections(TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.remote = CollectionRemote.objects.create(
+            name="batch", url="https://galaxy.example.com/api/"
+        )
+        self.repo = AnsibleRepository.objects.create(name="batch")
+
+    def _run(self, **kwargs):
+        rebuild_target = "rebuild_repository_collection_versions_metadata"
+        with mock.patch.object(collection_sync, "sync") as sync, \
+                mock.patch.object(collection_sync, rebuild_target) as rebuild:
+            collection_sync.sync_and_rebuild_collections(
+                str(self.remote.pk), str(self.repo.pk), **kwargs
+            )
+        return sync, rebuild
+
+    def test_sync_and_rebuild(self):
+        sync, rebuild = self._run(
+            sync_collections=["foo.bar", "foo.baz"],
+            rebuild_collections=[["foo", "bar"], ["foo", "baz"]],
+        )
+
+        self.remote.refresh_from_db()
+        self.assertEqual(
+            yaml.safe_load(self.remote.requirements_file),
+            {"collections": ["foo.bar", "foo.baz"]},
+        )
+        sync.assert_called_once_with(
+            remote_pk=str(self.remote.pk),
+            repository_pk=str(self.repo.pk),
+            mirror=False,
+            optimize=False,
+        )
+        version_pk = str(self.repo.latest_version().pk)
+        self.assertEqual(rebuild.call_args_list, [
+            mock.call(version_pk, namespace="foo", name="bar"),
+            mock.call(version_pk, namespace="foo", name="baz"),
+        ])
+
+    def test_rebuild_only(self):
+        sync, rebuild = self._run(rebuild_collections=[["foo", "bar"]])
+        sync.assert_not_called()
+        rebuild.assert_called_once()
@@ -0,0 +1,50 @@
+from django.core.management import call_command
+from django.test import TestCase
+from pulp_ansible.app.models import AnsibleDistribution, AnsibleRepository
+
+from galaxy_ng.app.models import SyncList
+
+
+class TestSynclistCommands(TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.published = AnsibleRepository.objects.get(name="published")
+        self.names = [f"{i:06d}-synclist" for i in range(5)]
+        for name in self.names:
+            repo = AnsibleRepository.objects.create(name=name)
+            AnsibleDistribution.objects.create(name=name, base_path=name, repository=repo)
+            SyncList.objects.create(name=name, repository=repo)
+
+    def test_update_synclist_distros(self):
+        call_command("update-synclist-distros")
+
+        distros = AnsibleDistribution.objects.filter(name__in=self.names)
+        self.assertEqual(distros.count(), 5)
+        for distro in distros:
+            self.assertEqual(distro.repository_id, self.published.pk)
+
+    def test_delete_synclist_repos_skips_unpublished(self):
+        AnsibleDistribution.objects.filter(name__in=self.names[:3]).update(
+            repository=self.published
+        )
+
+        call_command("delete-synclist-repos", "--batch-size", "2")
+
+        remaining = set(
+            AnsibleRepository.objects.filter(name__in=self.names).values_list("name", flat=True)
+        )
+        self.assertEqual(remaining, set(self.names[3:]))
+        for synclist in SyncList.objects.filter(name__in=self.names[:3]):
+            self.assertEqual(synclist.distribution.name, synclist.name)
+            self.assertIsNone(synclist.repository)
+
+    def test_delete_synclist_repos_hard_with_number(self):
+        call_command("delete-synclist-repos", "--number", "3", "--batch-size", "2", "--hard")
+
+        remaining = AnsibleRepository.objects.filter(name__in=self.names)
+        self.assertEqual(remaining.count(), 2)
+
+        # resuming deletes the rest
+        call_command("delete-synclist-repos", "--hard")
+        self.assertFalse(AnsibleRepository.objects.filter(name__in=self.names).exists())
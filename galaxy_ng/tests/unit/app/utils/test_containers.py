@@ -0,0 +1,61 @@
+import io
+import json
+from unittest import mock
+
+from django.test import TestCase, override_settings
+
+from galaxy_ng.app.utils.containers import clear_config_blob_cache, get_config_blob_data
+
+
+def _config_blob(digest, data):
+    content = json.dumps(data).encode()
+    blob = mock.Mock(digest=digest)
+    artifact = blob._artifacts.first.return_value
+    artifact.size = len(content)
+    artifact.file.open.side_effect = lambda: io.BytesIO(content)
+    return blob
+
+
+@override_settings(
+    GALAXY_CONTAINER_CONFIG_BLOB_CACHE_SIZE=2,
+    GALAXY_CONTAINER_CONFIG_BLOB_CACHE_MAX_BYTES=1024,
+)
+class TestConfigBlobCache(TestCase):
+
+    def setUp(self):
+        super().setUp()
+        clear_config_blob_cache()
+        self.addCleanup(clear_config_blob_cache)
+
+    def test_config_blob_is_read_once(self):
+        blob = _config_blob("sha256:a", {"architecture": "amd64"})
+
+        self.assertEqual(get_config_blob_data(blob), {"architecture": "amd64"})
+        self.assertEqual(get_config_blob_data(blob), {"architecture": "amd64"})
+        blob._artifacts.first.return_value.file.open.assert_called_once()
+
+    def test_least_recently_used_is_evicted(self):
+        blobs = [_config_blob(f"sha256:{i}", {"i": i}) for i in range(3)]
+        for blob in blobs:
+            get_config_blob_data(blob)
+
+        get_config_blob_data(blobs[2])
+        get_config_blob_data(blobs[0])
+        self.assertEqual(blobs[2]._artifacts.first.return_value.file.open.call_count, 1)
+        self.assertEqual(blobs[0]._artifacts.first.return_value.file.open.call_count, 2)
+
+    def test_big_config_blob_is_not_cached(self):
+        blob = _config_blob("sha256:big", {"history": "x" * 2048})
+
+        get_config_blob_data(blob)
+        get_config_blob_data(blob)
+        self.assertEqual(blob._artifacts.first.return_value.file.open.call_count, 2)
+
+    @override_settings(GALAXY_CONTAINER_CONFIG_BLOB_SHARED_CACHE=True)
+    def test_big_config_blob_skips_shared_cache(self):
+        blob = _config_blob("sha256:big", {"history": "x" * 2048})
+
+        with mock.patch("galaxy_ng.app.utils.containers.cache") as cache:
+            get_config_blob_data(blob)
+        cache.get.assert_not_called()
+        cache.set.assert_not_called()
@@ -0,0 +1,50 @@
+from django.test import TestCase
+from pulp_ansible.app.models import Collection
+
+from galaxy_ng.app.utils.db import batched_by_pk, filter_by_tuples, iterate_by_pk
+
+
+class TestDbUtils(TestCase):
+
+    def setUp(self):
+        super().setUp()
+        for namespace, name in [("foo", "bar"), ("foo", "baz"), ("bar", "foo")]:
+            Collection.objects.create(namespace=namespace, name=name)
+
+    def test_filter_by_tuples(self):
+        qs = filter_by_tuples(
+            Collection.objects.all(),
+            ("namespace", "name"),
+            [("foo", "bar"), ("bar", "foo"), ("foo", "missing")],
+        )
+        found = sorted(qs.values_list("namespace", "name"))
+        assert found == [("bar", "foo"), ("foo", "bar")]
+
+    def test_filter_by_tuples_single_query(self):
+        values = [("foo", f"name{i}") for i in range(1000)] + [("foo", "baz")]
+        with self.assertNumQueries(1):
+            found = list(
+                filter_by_tuples(Collection.objects.all(), ("namespace", "name"), values)
+            )
+        assert [(c.namespace, c.name) for c in found] == [("foo", "baz")]
+
+    def test_filter_by_tuples_in_subquery(self):
+        subquery = filter_by_tuples(
+            Collection.objects.all(), ("namespace", "name"), [("foo", "bar")]
+        ).values("pk")
+        found = Collection.objects.filter(pk__in=subquery).values_list("namespace", "name")
+        assert list(found) == [("foo", "bar")]
+
+    def test_filter_by_tuples_empty(self):
+        with self.assertNumQueries(0):
+            assert list(filter_by_tuples(Collection.objects.all(), ("namespace", "name"), [])) == []
+
+    def test_batched_by_pk(self):
+        qs = Collection.objects.values_list("name", flat=True)
+        batches = list(batched_by_pk(qs, batch_size=2))
+        assert [len(rows) for _, rows in batches] == [2, 1]
+        assert sorted(name for _, rows in batches for name in rows) == ["bar", "baz", "foo"]
+
+        # resume after the first batch
+        checkpoint = batches[0][0]
+        assert list(iterate_by_pk(qs, batch_size=2, start_after=checkpoint)) == batches[1][1]
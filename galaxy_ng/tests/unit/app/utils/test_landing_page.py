@@ -0,0 +1,38 @@
+from django.core.cache import cache
+from django.test import TestCase
+
+from galaxy_ng.app.models import Namespace
+from galaxy_ng.app.utils.landing_page import get_landing_page_estate
+
+
+class TestLandingPageEstate(TestCase):
+
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        self.addCleanup(cache.clear)
+        for i in range(3):
+            Namespace.objects.create(name=f"partner_{i}", company=f"Partner {i}")
+
+    def test_estate_is_cached(self):
+        estate = get_landing_page_estate()
+        self.assertEqual(estate["partner_count"], Namespace.objects.count())
+        self.assertIn(
+            estate["partner"]["name"], Namespace.objects.values_list("name", flat=True)
+        )
+
+        with self.assertNumQueries(0):
+            self.assertEqual(get_landing_page_estate(), estate)
+
+    def test_namespace_changes_invalidate_estate(self):
+        partner_count = get_landing_page_estate()["partner_count"]
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Namespace.objects.create(name="partner_new")
+        self.assertEqual(get_landing_page_estate()["partner_count"], partner_count + 1)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Namespace.objects.all().delete()
+        estate = get_landing_page_estate()
+        self.assertEqual(estate["partner_count"], 0)
+        self.assertIsNone(estate["partner"])
@@ -0,0 +1,43 @@
+from django.test import TestCase
+
+from galaxy_ng.app.models import Namespace
+from galaxy_ng.app.models.auth import User
+from galaxy_ng.app.utils.galaxy import generate_unverified_email
+from galaxy_ng.app.utils.legacy import sync_namespace_owners
+from galaxy_ng.app.utils.rbac import get_v3_namespace_owner_ids, get_v3_namespace_owners
+
+
+class TestSyncNamespaceOwners(TestCase):
+
+    def test_sync_namespace_owners(self):
+        ns1 = Namespace.objects.create(name="legacy_owners_ns1")
+        ns2 = Namespace.objects.create(name="legacy_owners_ns2")
+        # matched on the unverified email username, with its email fixed
+        by_email_name = User.objects.create(username=generate_unverified_email(1))
+        # matched on the username
+        by_username = User.objects.create(username="bar", email="bar@localhost")
+
+        sync_namespace_owners([
+            (ns1, [{"username": "foo", "github_id": 1}, {"username": "bar"}]),
+            (ns2, [{"username": "bar"}, {"username": "newbie", "github_id": 2}]),
+        ])
+
+        by_email_name.refresh_from_db()
+        self.assertEqual(by_email_name.email, generate_unverified_email(1))
+        newbie = User.objects.get(username="newbie")
+        self.assertEqual(newbie.email, generate_unverified_email(2))
+
+        owners = get_v3_namespace_owner_ids([ns1, ns2])
+        self.assertEqual(owners[ns1.pk], {by_email_name.pk, by_username.pk})
+        self.assertEqual(owners[ns2.pk], {by_username.pk, newbie.pk})
+        for ns in (ns1, ns2):
+            self.assertEqual(owners[ns.pk], {u.pk for u in get_v3_namespace_owners(ns)})
+
+    def test_sync_namespace_owners_is_idempotent(self):
+        ns = Namespace.objects.create(name="legacy_owners_ns")
+        owners_info = [{"username": "foo", "github_id": 1}, {"username": "bar"}]
+        sync_namespace_owners([(ns, owners_info)])
+
+        # the users lookup and the two role queries
+        with self.assertNumQueries(3):
+            sync_namespace_owners([(ns, owners_info)])
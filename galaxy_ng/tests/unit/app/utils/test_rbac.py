@@ -0,0 +1,51 @@
+from django.contrib.contenttypes.models import ContentType
+from django.test import TestCase
+from pulpcore.plugin.util import assign_role, get_users_with_perms
+
+from galaxy_ng.app.models import Namespace
+from galaxy_ng.app.models.auth import Group, User
+from galaxy_ng.app.utils.rbac import get_users_with_perms_by_object, is_v3_namespace_owner
+
+
+class TestRbacUtils(TestCase):
+
+    def test_get_users_with_perms_by_object(self):
+        owner = User.objects.create(username="ns_owner")
+        other = User.objects.create(username="other_owner")
+        ns1 = Namespace.objects.create(name="rbac_batch_ns1")
+        ns2 = Namespace.objects.create(name="rbac_batch_ns2")
+        ns3 = Namespace.objects.create(name="rbac_batch_ns3")
+        assign_role("galaxy.collection_namespace_owner", owner, ns1)
+        assign_role("galaxy.collection_namespace_owner", other, ns1)
+        assign_role("galaxy.collection_namespace_owner", other, ns2)
+
+        ContentType.objects.get_for_model(Namespace, for_concrete_model=True)
+        with self.assertNumQueries(1):
+            users = get_users_with_perms_by_object([ns1, ns2, ns3])
+
+        self.assertEqual(users[ns1.pk], ["ns_owner", "other_owner"])
+        self.assertEqual(users[ns2.pk], ["other_owner"])
+        self.assertEqual(users[ns3.pk], [])
+
+        for ns in (ns1, ns2, ns3):
+            expected = get_users_with_perms(ns, with_group_users=False, for_concrete_model=True)
+            self.assertEqual(users[ns.pk], sorted(expected.values_list("username", flat=True)))
+
+    def test_is_v3_namespace_owner(self):
+        user = User.objects.create(username="direct_owner")
+        member = User.objects.create(username="group_member")
+        other = User.objects.create(username="not_an_owner")
+        group = Group.objects.create(name="rbac_owner_group")
+        group.user_set.add(member)
+        ns = Namespace.objects.create(name="rbac_owner_ns")
+        other_ns = Namespace.objects.create(name="rbac_other_ns")
+        assign_role("galaxy.collection_namespace_owner", user, ns)
+        assign_role("galaxy.collection_namespace_owner", group, ns)
+        assign_role("galaxy.collection_namespace_owner", other, other_ns)
+
+        ContentType.objects.get_for_model(Namespace)
+        with self.assertNumQueries(1):
+            self.assertTrue(is_v3_namespace_owner(user, ns.pk))
+        self.assertTrue(is_v3_namespace_owner(member, ns.pk))
+        self.assertFalse(is_v3_namespace_owner(other, ns.pk))
+        self.assertFalse(is_v3_namespace_owner(member, other_ns.pk))
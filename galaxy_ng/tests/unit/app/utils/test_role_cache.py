@@ -0,0 +1,119 @@
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import TestCase
+from rest_framework.test import APIRequestFactory
+
+from galaxy_ng.app.api.v1.models import (
+    LegacyNamespace,
+    LegacyRole,
+    LegacyRoleDownloadCount,
+)
+from galaxy_ng.app.api.v1.viewsets.roles import LegacyRolesViewSet
+from galaxy_ng.app.utils.role_cache import get_role_cache_version
+from galaxy_ng.tests.unit.fake_redis import patch_redis
+
+
+class RoleCacheTestCase(TestCase):
+
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        self.addCleanup(cache.clear)
+        patcher = patch_redis()
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.namespace = LegacyNamespace.objects.create(name="stamps")
+        self.role = LegacyRole.objects.create(
+            namespace=self.namespace, name="role", full_metadata={}
+        )
+        self.other = LegacyRole.objects.create(
+            namespace=LegacyNamespace.objects.create(name="others"), name="role", full_metadata={}
+        )
+
+
+class TestRoleCacheVersions(RoleCacheTestCase):
+
+    def versions(self):
+        return (
+            get_role_cache_version(),
+            get_role_cache_version(self.role.pk),
+            get_role_cache_version(self.other.pk),
+        )
+
+    def test_role_save_moves_its_versions(self):
+        list_version, role_version, other_version = self.versions()
+        self.assertEqual(self.versions(), (list_version, role_version, other_version))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.role.save()
+        new_list_version, new_role_version, new_other_version = self.versions()
+        self.assertNotEqual(new_list_version, list_version)
+        self.assertNotEqual(new_role_version, role_version)
+        self.assertEqual(new_other_version, other_version)
+
+    def test_namespace_save_moves_its_role_versions(self):
+        _, role_version, other_version = self.versions()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.namespace.save()
+        _, new_role_version, new_other_version = self.versions()
+        self.assertNotEqual(new_role_version, role_version)
+        self.assertEqual(new_other_version, other_version)
+
+    def test_download_count_save_moves_the_role_versions(self):
+        _, role_version, _ = self.versions()
+        with self.captureOnCommitCallbacks(execute=True):
+            LegacyRoleDownloadCount.objects.create(legacyrole=self.role, count=10)
+        self.assertNotEqual(self.versions()[1], role_version)
+
+    def test_no_version_without_redis(self):
+        with mock.patch("galaxy_ng.app.tasks.settings_cache.conn", None):
+            self.assertIsNone(get_role_cache_version())
+
+
+class TestRoleCacheViews(RoleCacheTestCase):
+
+    def get(self, headers=None, **params):
+        view = LegacyRolesViewSet.as_view({"get": "list"})
+        return view(APIRequestFactory().get("/api/v1/roles/", params, **(headers or {})))
+
+    def download_count(self):
+        response = self.get(github_user="stamps", name="role")
+        self.assertEqual(response.status_code, 200)
+        return response.data["results"][0]["download_count"]
+
+    def test_cache_hit(self):
+        self.assertEqual(self.get(github_user="stamps").data["results"][0]["name"], "role")
+
+        # an UPDATE sends no signal, the cached response is served
+        LegacyRole.objects.filter(pk=self.role.pk).update(name="renamed")
+        response = self.get(github_user="stamps")
+        self.assertEqual(response.data["results"][0]["name"], "role")
+
+    def test_not_modified(self):
+        response = self.get(github_user="stamps")
+        etag = response["ETag"]
+
+        response = self.get(headers={"HTTP_IF_NONE_MATCH": etag}, github_user="stamps")
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response["ETag"], etag)
+
+        response = self.get(headers={"HTTP_IF_NONE_MATCH": '"outdated"'}, github_user="stamps")
+        self.assertEqual(response.status_code, 200)
+
+    def test_installs_invalidate_the_cache(self):
+        self.assertEqual(self.download_count(), 0)
+
+        # the first install creates the counter, the next ones UPDATE it
+        for _ in range(3):
+            with self.captureOnCommitCallbacks(execute=True):
+                self.get(owner__username="stamps", name="role")
+
+        self.assertEqual(self.download_count(), 3)
+
+    def test_no_cache_without_redis(self):
+        with mock.patch("galaxy_ng.app.tasks.settings_cache.conn", None):
+            self.get(github_user="stamps")
+            LegacyRole.objects.filter(pk=self.role.pk).update(name="renamed")
+            response = self.get(github_user="stamps")
+        self.assertEqual(response.data["results"][0]["name"], "renamed")
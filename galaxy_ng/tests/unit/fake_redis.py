@@ -0,0 +1,36 @@
+from unittest import mock
+
+
+class FakeRedis:
+    """In memory stand-in for the few redis commands of the cache versions."""
+
+    def __init__(self):
+        self.data = {}
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def incr(self, key):
+        self.data[key] = str(int(self.data.get(key, 0)) + 1)
+        return int(self.data[key])
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+class FakePipeline:
+
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = []
+
+    def incr(self, key):
+        self.commands.append(key)
+
+    def execute(self):
+        return [self.redis.incr(key) for key in self.commands]
+
+
+def patch_redis():
+    """Patch the redis connection of the settings cache with a FakeRedis."""
+    return mock.patch("galaxy_ng.app.tasks.settings_cache.conn", FakeRedis())